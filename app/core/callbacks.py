@@ -0,0 +1,49 @@
+"""
+Typed callback data for the service catalog keyboards.
+
+Every choice is sent as its integer code (position in the catalog lists
+of app.core.service_categories), e.g. ``sv:3`` instead of the full
+service name, and decoded by indexing those lists.
+"""
+
+from aiogram.filters.callback_data import CallbackData
+
+
+class ServiceCallback(CallbackData, prefix="sv"):
+    """Service selection."""
+    code: int
+
+
+class SubcategoryCallback(CallbackData, prefix="sc"):
+    """Service type selection."""
+    code: int
+
+
+class BudgetCallback(CallbackData, prefix="bg"):
+    """Budget selection."""
+    code: int
+
+
+class TimelineCallback(CallbackData, prefix="tl"):
+    """Timeline selection."""
+    code: int
+
+
+class ContentCallback(CallbackData, prefix="ct"):
+    """Content availability selection."""
+    code: int
+
+
+class DesignCallback(CallbackData, prefix="ds"):
+    """Design availability selection."""
+    code: int
+
+
+class SupportCallback(CallbackData, prefix="sp"):
+    """Support level selection."""
+    code: int
+
+
+class OptionCallback(CallbackData, prefix="op"):
+    """Additional option toggle."""
+    code: int
@@ -3,7 +3,7 @@ Configuration management with Pydantic validation.
 """
 
 import os
-from typing import List, Optional
+from typing import List, Literal, Optional
 from pydantic import validator
 from pydantic_settings import BaseSettings
 
@@ -25,6 +25,42 @@ class Settings(BaseSettings):
     
     # Database
     database_url: str = "sqlite:///./app.db"
+    database_async: bool = False  # AsyncEngine (aiosqlite/asyncpg) instead of the sync engine
+    
+    # Connection pool (sizing applies to queue pools: PostgreSQL, file-based SQLite)
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0  # seconds to wait for a free connection
+    db_pool_recycle: int = -1  # seconds, -1 keeps connections forever
+    db_pool_pre_ping: bool = False
+    db_statement_timeout: int = 0  # milliseconds, PostgreSQL only, 0 disables
+    
+    # Caching
+    user_cache_size: int = 10000
+    user_cache_ttl: int = 300  # seconds
+    dashboard_cache_ttl: float = 30.0  # seconds an admin dashboard snapshot is reused
+    
+    # Write-behind
+    profile_flush_interval: float = 5.0  # seconds between profile update flushes
+    
+    # Batched application inserts (off: each submission is inserted by its own update)
+    application_batching: bool = False
+    application_batch_size: int = 50  # applications per bulk INSERT
+    application_batch_delay: float = 0.005  # seconds a batch waits for more submissions
+    application_queue_size: int = 1000  # queued submissions before submitters wait
+    
+    # Local spool for submissions that fail to reach the database
+    submission_spool_path: str = "submissions.spool"
+    submission_replay_interval: float = 30.0  # seconds between replay attempts
+    submission_write_timeout: float = 10.0  # seconds a submission write may take before spooling
+    
+    # FSM storage: in-process (lost on restart), Redis or the bot database
+    fsm_storage: Literal["memory", "redis", "database"] = "memory"
+    redis_url: Optional[str] = None  # e.g. redis://:password@redis:6379/0
+    fsm_state_ttl: int = 86400  # seconds an idle conversation is kept
+    
+    # Callback queries left unanswered by the handler are acknowledged after this delay
+    callback_answer_deadline: float = 0.25  # seconds; 0 answers before the handler runs
     
     # Services list
     services: List[str] = [
@@ -70,6 +106,16 @@ class Settings(BaseSettings):
             return v.replace("postgres://", "postgresql://", 1)
         return v
     
+    @property
+    def async_database_url(self) -> str:
+        """Database URL with an asyncio driver (aiosqlite / asyncpg)."""
+        url = self.database_url
+        if url.startswith("sqlite://"):
+            return url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+        if url.startswith("postgresql://") or url.startswith("postgresql+psycopg2://"):
+            return "postgresql+asyncpg://" + url.split("://", 1)[1]
+        return url
+    
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
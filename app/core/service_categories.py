@@ -2,7 +2,9 @@
 Detailed service categories configuration.
 """
 
-from typing import Dict, List, Any
+import hashlib
+import json
+from typing import Dict, List, Any, Optional
 
 # Детальная структура услуг
 SERVICE_CATEGORIES = {
@@ -184,4 +186,106 @@ GENERAL_OPTIONS = {
         "💎 Расширенная поддержка": "Обновления и доработки",
         "🚀 VIP поддержка": "24/7 поддержка и консультации"
     }
-} 
\ No newline at end of file
+}
+
+
+# Form answers are kept as small integer codes: positions in these lists
+SERVICE_NAMES: List[str] = list(SERVICE_CATEGORIES)
+
+SERVICE_CHOICES: List[Dict[str, List[str]]] = [
+    {
+        "subcategory": list(category["subcategories"]),
+        "budget": list(category["budgets"]),
+        "additional_options": list(category["options"])
+    }
+    for category in SERVICE_CATEGORIES.values()
+]
+
+GENERAL_CHOICES: Dict[str, List[str]] = {
+    "timeline": list(GENERAL_OPTIONS["timeline"]),
+    "has_content": list(GENERAL_OPTIONS["has_content"]),
+    "has_design": list(GENERAL_OPTIONS["has_design"]),
+    "support_level": list(GENERAL_OPTIONS["support"])
+}
+
+CODED_FIELDS = ("service", "subcategory", "budget", *GENERAL_CHOICES, "additional_options")
+
+# Forms record the catalog they were started with (FSM data key "catalog"):
+# after the lists above are reordered, old codes would point at other choices
+CATALOG_VERSION = hashlib.sha1(
+    json.dumps([SERVICE_NAMES, SERVICE_CHOICES, GENERAL_CHOICES], ensure_ascii=False).encode()
+).hexdigest()[:8]
+
+
+def form_choices(field: str, service: Optional[int] = None) -> List[str]:
+    """
+    Get the choices a form field code points into.
+    
+    Args:
+        field: Form field name (see CODED_FIELDS)
+        service: Service code, required for service-specific fields
+        
+    Returns:
+        Choices in code order
+    """
+    if field == "service":
+        return SERVICE_NAMES
+    if field in GENERAL_CHOICES:
+        return GENERAL_CHOICES[field]
+    return SERVICE_CHOICES[service][field]
+
+
+def is_choice(field: str, code: Any, service: Optional[int] = None) -> bool:
+    """
+    Check that a code received from a user points into a field's choices.
+    
+    Args:
+        field: Form field name (see CODED_FIELDS)
+        code: Code from callback data or FSM data
+        service: Service code, required for service-specific fields
+        
+    Returns:
+        True if the code is a valid index of form_choices(field, service)
+    """
+    if field != "service" and field not in GENERAL_CHOICES and not is_choice("service", service):
+        return False
+    return type(code) is int and 0 <= code < len(form_choices(field, service))
+
+
+def decode_form(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Resolve coded form answers for rendering.
+    
+    Args:
+        data: FSM data of the service form
+        
+    Returns:
+        Copy of data with codes replaced by their texts (option keys for
+        additional_options); missing answers are left out
+        
+    Raises:
+        ValueError: If the form was started with another catalog version,
+            has no service or a code does not point into its field's choices
+    """
+    if data.get("catalog") != CATALOG_VERSION:
+        raise ValueError(f"Service form of catalog {data.get('catalog')!r}")
+    if "service" not in data:
+        raise ValueError("Service form without a service")
+    
+    form = dict(data)
+    service = data.get("service")
+    
+    for field in CODED_FIELDS:
+        code = data.get(field)
+        if code is None:
+            continue
+        codes = code if field == "additional_options" else [code]
+        if not isinstance(codes, list) or not all(is_choice(field, c, service) for c in codes):
+            raise ValueError(f"Invalid {field} code in service form: {code!r}")
+        choices = form_choices(field, service)
+        if field == "additional_options":
+            form[field] = [choices[option] for option in code]
+        else:
+            form[field] = choices[code]
+    
+    return form
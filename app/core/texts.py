@@ -0,0 +1,187 @@
+"""
+Pre-rendered bot texts.
+
+Screens that do not depend on the user are rendered once at import and
+served by reference; catalog screens are rendered per service code (and
+per subcategory code for the budget screen), the options screen per
+support level code.
+"""
+
+from typing import Tuple
+
+from app.core.config import settings
+from app.core.service_categories import SERVICE_CATEGORIES, SERVICE_NAMES, form_choices
+
+WELCOME_TEXT = (
+    f"👋 <b>Добро пожаловать в {settings.bot_name}!</b>\n\n"
+    "🚀 <b>NOFACE.digital</b> — команда профессиональных разработчиков\n\n"
+    "💎 <b>Мы создаём:</b>\n"
+    "• Высокопроизводительные веб-приложения\n"
+    "• Интеллектуальные Telegram-боты\n"
+    "• Современные онлайн-магазины\n"
+    "• Инновационные Web3 решения\n"
+    "• Защищённые анонимные платформы\n"
+    "• AI-интеграции нового поколения\n"
+    "• Стартапы полного цикла\n\n"
+    "🎯 <b>Выберите, что вас интересует:</b>"
+)
+
+DIRECT_CONTACT_TEXT = (
+    "📞 <b>Связаться напрямую</b>\n\n"
+    "💬 <b>Telegram CEO:</b> @pavel_xdev\n"
+    "🌐 <b>Сайт:</b> https://noface.digital\n\n"
+    "⚡️ <b>Для срочных вопросов:</b>\n"
+    "Пишите напрямую CEO @pavel_xdev для быстрой консультации\n\n"
+    "🕐 <b>Время ответа:</b> в течение 2-4 часов\n"
+    "🌍 <b>Работаем:</b> 24/7, любая временная зона"
+)
+
+ABOUT_TEXT = (
+    "ℹ️ <b>О компании NOFACE.digital</b>\n\n"
+    "🚀 <b>Кто мы?</b>\n"
+    "Команда профессиональных разработчиков с экспертизой "
+    "в создании цифровых решений нового поколения.\n\n"
+
+    "💎 <b>Наша миссия:</b>\n"
+    "Превращать самые смелые идеи в работающие продукты, "
+    "которые меняют бизнес и жизни людей.\n\n"
+
+    "🎯 <b>Специализация:</b>\n"
+    "• Высоконагруженные веб-приложения\n"
+    "• Интеллектуальные Telegram-боты\n"
+    "• E-commerce платформы\n"
+    "• Блокчейн и Web3 решения\n"
+    "• AI/ML интеграции\n"
+    "• DevOps и инфраструктура\n\n"
+
+    "🏆 <b>Наши принципы:</b>\n"
+    "• Качество превыше всего\n"
+    "• Современные технологии\n"
+    "• Индивидуальный подход\n"
+    "• Полная прозрачность\n"
+    "• Соблюдение сроков\n\n"
+
+    "⚡ <b>Почему выбирают нас:</b>\n"
+    "• 5+ лет опыта в IT\n"
+    "• 100+ успешных проектов\n"
+    "• Команда Senior специалистов\n"
+    "• Поддержка 24/7\n"
+    "• Гарантия результата\n\n"
+
+    "🌐 <b>Сайт:</b> https://noface.digital\n"
+    "👨‍💼 <b>CEO:</b> @pavel_xdev"
+)
+
+HELP_TEXT = (
+    "❓ <b>Помощь по боту NOFACE.digital</b>\n\n"
+
+    "🎯 <b>Основные функции:</b>\n"
+    "• 🛠 <b>Заказать услугу</b> — оформить заявку на разработку\n"
+    "• 👥 <b>Присоединиться к команде</b> — подать анкету для работы\n"
+    "• 📞 <b>Связаться напрямую</b> — получить контакты\n"
+    "• ℹ️ <b>О компании</b> — узнать больше о NOFACE.digital\n\n"
+
+    "⚡ <b>Доступные команды:</b>\n"
+    "• /start — главное меню\n"
+    "• /help — эта справка\n"
+    "• /contact — контактная информация\n\n"
+
+    "🔄 <b>Как пользоваться:</b>\n"
+    "1. Выберите нужное действие в главном меню\n"
+    "2. Следуйте инструкциям бота\n"
+    "3. Заполните необходимые формы\n"
+    "4. Получите ответ от нашей команды\n\n"
+
+    "💬 <b>Нужна дополнительная помощь?</b>\n"
+    "Обращайтесь напрямую к CEO: @pavel_xdev"
+)
+
+CONTACT_TEXT = (
+    "📞 <b>Контактная информация</b>\n\n"
+    "🏢 <b>NOFACE.digital</b>\n"
+    "Команда профессиональных разработчиков\n\n"
+
+    "👨‍💼 <b>CEO:</b> @pavel_xdev\n"
+    "💬 <b>Telegram:</b> @pavel_xdev\n"
+    "🌐 <b>Веб-сайт:</b> https://noface.digital\n\n"
+
+    "⚡ <b>Для быстрой связи:</b>\n"
+    "Пишите напрямую CEO @pavel_xdev\n\n"
+
+    "🕐 <b>Время ответа:</b> 2-4 часа\n"
+    "🌍 <b>Режим работы:</b> 24/7, любая временная зона\n\n"
+
+    "🚀 <b>Готовы обсудить ваш проект?</b>\n"
+    "Используйте кнопки ниже для быстрого доступа!"
+)
+
+FALLBACK_TEXT = (
+    "💬 <b>Спасибо за сообщение!</b>\n\n"
+    "🤖 Я бот для приема заявок на услуги и вакансии.\n\n"
+    "💡 <b>Что вы можете сделать:</b>\n"
+    "• 🛠 <b>Заказать услугу</b> — оформить заявку на разработку\n"
+    "• 👥 <b>Присоединиться к команде</b> — подать анкету\n"
+    "• 📞 <b>Связаться напрямую</b> — получить контакты CEO\n\n"
+    "⚡ <b>Для личной консультации пишите напрямую:</b>\n"
+    "👨‍💼 CEO: @pavel_xdev\n\n"
+    "👇 <b>Выберите действие из меню:</b>"
+)
+
+SERVICES_CAPTION = (
+    "🛠 <b>ВЫБЕРИТЕ УСЛУГУ</b>\n\n"
+    "Выберите категорию услуги из списка ниже:"
+)
+
+SERVICE_CANCELLED_CAPTION = (
+    "❌ <b>Заявка отменена</b>\n\n"
+    "Вы можете начать заново в любое время.\n\n"
+    "🎯 <b>Выберите, что вас интересует:</b>"
+)
+
+
+def _subcategory_screen(service: str) -> str:
+    subcategories = SERVICE_CATEGORIES[service]["subcategories"]
+    description_text = "\n".join(
+        f"• <b>{name}</b> - {desc}" for name, desc in subcategories.items()
+    )
+    return (
+        f"📋 <b>ВЫБЕРИТЕ ТИП: {service}</b>\n\n"
+        f"{description_text}\n\n"
+        "Выберите подходящий вариант:"
+    )
+
+
+def _budget_screen(service: str, subcategory: str) -> str:
+    return (
+        f"💰 <b>ВЫБЕРИТЕ БЮДЖЕТ</b>\n\n"
+        f"<b>Услуга:</b> {service}\n"
+        f"<b>Тип:</b> {subcategory}\n\n"
+        "Выберите подходящий бюджет для вашего проекта:"
+    )
+
+
+def _options_screen(support: str) -> str:
+    return (
+        f"⚙️ <b>ДОПОЛНИТЕЛЬНЫЕ ОПЦИИ</b>\n\n"
+        f"<b>Поддержка:</b> {support}\n\n"
+        "Выберите дополнительные опции которые вам нужны.\n"
+        "Можно выбрать несколько вариантов:"
+    )
+
+
+# Subcategory selection screen by service code
+SUBCATEGORY_SCREENS: Tuple[str, ...] = tuple(
+    _subcategory_screen(service) for service in SERVICE_NAMES
+)
+
+# Budget selection screen by service code, then subcategory code
+BUDGET_SCREENS: Tuple[Tuple[str, ...], ...] = tuple(
+    tuple(_budget_screen(service, subcategory) for subcategory in form_choices("subcategory", code))
+    for code, service in enumerate(SERVICE_NAMES)
+)
+
+# Additional options screen by support level code (the selection is shown
+# by the keyboard only, so toggling an option edits just the markup)
+OPTIONS_SCREENS: Tuple[str, ...] = tuple(
+    _options_screen(support) for support in form_choices("support_level")
+)
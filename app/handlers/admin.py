@@ -2,20 +2,31 @@
 Admin panel for NOFACE.digital bot management.
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 from aiogram import Router, F
-from aiogram.types import Message, CallbackQuery
+from aiogram.types import Message, CallbackQuery, InlineKeyboardButton, InlineKeyboardMarkup
+from aiogram.utils.keyboard import InlineKeyboardBuilder
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
 
 from app.models.user import User
-from app.models.application import Application, ApplicationType
-from app.services.user import UserService
-from app.services.application import ApplicationService
+from app.models.application import ApplicationType
+from app.services.user import AsyncUserService, user_cache
+from app.services.application import AsyncApplicationService
+from app.services.statistics import dashboard_cache, get_dashboard_snapshot
+from app.models.base import pool_metrics
+from app.services.profile_writer import profile_writer
+from app.services.application_writer import application_writer
+from app.services.submission_spool import submission_spool
+from app.services.media import media_registry
+from app.utils.keyboards import get_pagination_keyboard, get_row_keyboard
+from app.utils.transitions import edit_text_if_changed, rendered_edits, transition_metrics
+from app.middlewares.callback_answer import callback_answer_metrics
+from app.utils.pagination import parse_page_callback
 from app.core.config import settings
 from app.core.logger import get_logger
 
@@ -33,11 +44,9 @@ def is_admin(user_id: int) -> bool:
     return user_id in settings.admin_ids
 
 
-def get_admin_menu():
+@lru_cache(maxsize=None)
+def get_admin_menu() -> InlineKeyboardMarkup:
     """Get admin main menu keyboard."""
-    from aiogram.utils.keyboard import InlineKeyboardBuilder
-    from aiogram.types import InlineKeyboardButton
-    
     keyboard = InlineKeyboardBuilder()
     
     # Основные функции
@@ -54,17 +63,16 @@ def get_admin_menu():
         InlineKeyboardButton(text="🔄 Обновить", callback_data="admin_refresh")
     )
     keyboard.row(
+        InlineKeyboardButton(text="📈 Метрики", callback_data="admin_metrics"),
         InlineKeyboardButton(text="🏠 Главное меню", callback_data="back_to_main")
     )
     
     return keyboard.as_markup()
 
 
-def get_applications_menu():
+@lru_cache(maxsize=None)
+def get_applications_menu() -> InlineKeyboardMarkup:
     """Get applications management menu."""
-    from aiogram.utils.keyboard import InlineKeyboardBuilder
-    from aiogram.types import InlineKeyboardButton
-    
     keyboard = InlineKeyboardBuilder()
     
     keyboard.row(
@@ -96,24 +104,14 @@ async def admin_main(
     logger.info(f"Admin {user.telegram_id} opened admin panel")
     
     # Получаем базовую статистику
-    user_service = UserService(db)
-    app_service = ApplicationService(db)
-    
-    total_users = user_service.get_users_count()
-    total_applications = app_service.get_applications_count()
-    
-    # Новые заявки за сегодня
-    today = datetime.now().date()
-    new_apps_today = db.query(Application).filter(
-        func.date(Application.created_at) == today
-    ).count()
+    stats = await get_dashboard_snapshot()
     
     admin_text = (
         f"👨‍💻 <b>Админ-панель NOFACE.digital</b>\n\n"
         f"📊 <b>Быстрая статистика:</b>\n"
-        f"👥 Пользователи: <b>{total_users}</b>\n"
-        f"📝 Всего заявок: <b>{total_applications}</b>\n"
-        f"🆕 Новых сегодня: <b>{new_apps_today}</b>\n\n"
+        f"👥 Пользователи: <b>{stats.users.total}</b>\n"
+        f"📝 Всего заявок: <b>{stats.applications.total}</b>\n"
+        f"🆕 Новых сегодня: <b>{stats.applications.today}</b>\n\n"
         f"🕐 <b>Время:</b> {datetime.now().strftime('%H:%M, %d.%m.%Y')}\n\n"
         f"🎛 <b>Выберите раздел:</b>"
     )
@@ -137,28 +135,20 @@ async def admin_main_callback(
         return
     
     # Получаем статистику
-    user_service = UserService(db)
-    app_service = ApplicationService(db)
-    
-    total_users = user_service.get_users_count()
-    total_applications = app_service.get_applications_count()
-    
-    today = datetime.now().date()
-    new_apps_today = db.query(Application).filter(
-        func.date(Application.created_at) == today
-    ).count()
+    stats = await get_dashboard_snapshot()
     
     admin_text = (
         f"👨‍💻 <b>Админ-панель NOFACE.digital</b>\n\n"
         f"📊 <b>Быстрая статистика:</b>\n"
-        f"👥 Пользователи: <b>{total_users}</b>\n"
-        f"📝 Всего заявок: <b>{total_applications}</b>\n"
-        f"🆕 Новых сегодня: <b>{new_apps_today}</b>\n\n"
+        f"👥 Пользователи: <b>{stats.users.total}</b>\n"
+        f"📝 Всего заявок: <b>{stats.applications.total}</b>\n"
+        f"🆕 Новых сегодня: <b>{stats.applications.today}</b>\n\n"
         f"🕐 <b>Время:</b> {datetime.now().strftime('%H:%M, %d.%m.%Y')}\n\n"
         f"🎛 <b>Выберите раздел:</b>"
     )
     
-    await callback.message.edit_text(
+    await edit_text_if_changed(
+        callback.message,
         admin_text,
         reply_markup=get_admin_menu(),
         parse_mode="HTML"
@@ -177,84 +167,43 @@ async def admin_statistics(
         await callback.answer("❌ Нет прав", show_alert=True)
         return
     
-    # Детальная статистика
-    user_service = UserService(db)
-    
-    total_users = user_service.get_users_count()
-    
-    # Статистика за периоды
-    now = datetime.now()
-    today = now.date()
-    week_ago = today - timedelta(days=7)
-    month_ago = today - timedelta(days=30)
-    
-    # Новые пользователи
-    new_users_today = db.query(User).filter(
-        func.date(User.created_at) == today
-    ).count()
-    
-    new_users_week = db.query(User).filter(
-        User.created_at >= week_ago
-    ).count()
-    
-    # Заявки
-    total_apps = db.query(Application).count()
-    service_apps = db.query(Application).filter(
-        Application.type == ApplicationType.SERVICE
-    ).count()
-    team_apps = db.query(Application).filter(
-        Application.type == ApplicationType.TEAM
-    ).count()
-    
-    apps_today = db.query(Application).filter(
-        func.date(Application.created_at) == today
-    ).count()
-    
-    # Популярные услуги
-    popular_services = db.query(
-        Application.service,
-        func.count(Application.id).label('count')
-    ).filter(
-        Application.type == ApplicationType.SERVICE,
-        Application.service.isnot(None)
-    ).group_by(Application.service).order_by(desc('count')).limit(3).all()
+    # Детальная статистика: пользователи, заявки и популярные услуги
+    stats = await get_dashboard_snapshot()
     
     stats_text = (
         f"📊 <b>Детальная статистика</b>\n\n"
         
         f"👥 <b>Пользователи:</b>\n"
-        f"• Всего: <b>{total_users}</b>\n"
-        f"• Сегодня: <b>{new_users_today}</b>\n"
-        f"• За неделю: <b>{new_users_week}</b>\n\n"
+        f"• Всего: <b>{stats.users.total}</b>\n"
+        f"• Сегодня: <b>{stats.users.today}</b>\n"
+        f"• За неделю: <b>{stats.users.week}</b>\n\n"
         
         f"📝 <b>Заявки:</b>\n"
-        f"• Всего: <b>{total_apps}</b>\n"
-        f"• На услуги: <b>{service_apps}</b>\n"
-        f"• В команду: <b>{team_apps}</b>\n"
-        f"• Сегодня: <b>{apps_today}</b>\n\n"
+        f"• Всего: <b>{stats.applications.total}</b>\n"
+        f"• На услуги: <b>{stats.applications.service}</b>\n"
+        f"• В команду: <b>{stats.applications.team}</b>\n"
+        f"• Сегодня: <b>{stats.applications.today}</b>\n\n"
     )
     
-    if popular_services:
+    if stats.popular_services:
         stats_text += f"🔥 <b>Популярные услуги:</b>\n"
-        for service, count in popular_services:
+        for service, count in stats.popular_services:
             service_short = service.split()[0] if service else "Услуга"
             stats_text += f"• {service_short}: <b>{count}</b>\n"
-        stats_text += "\n"
-    
-    stats_text += f"🕐 <b>Обновлено:</b> {now.strftime('%H:%M:%S')}"
     
-    from aiogram.utils.keyboard import InlineKeyboardBuilder
-    from aiogram.types import InlineKeyboardButton
+    # Без времени снимка: оно меняется при каждом пересчёте кэша, и «Обновить»
+    # слал бы правку даже без изменений в данных
+    stats_text = stats_text.rstrip()
     
-    keyboard = InlineKeyboardBuilder()
-    keyboard.row(
-        InlineKeyboardButton(text="🔄 Обновить", callback_data="admin_stats"),
-        InlineKeyboardButton(text="⬅️ Назад", callback_data="admin_main")
+    keyboard = get_row_keyboard(
+        ("🔄 Обновить", "admin_stats"),
+        ("⬅️ Назад", "admin_main")
     )
     
-    await callback.message.edit_text(
+    await edit_text_if_changed(
+        callback.message,
         stats_text,
-        reply_markup=keyboard.as_markup(),
+        reply_markup=keyboard,
         parse_mode="HTML"
     )
     await callback.answer()
@@ -279,7 +228,8 @@ async def admin_applications_menu(
         f"📊 <b>Выберите категорию:</b>"
     )
     
-    await callback.message.edit_text(
+    await edit_text_if_changed(
+        callback.message,
         apps_text,
         reply_markup=get_applications_menu(),
         parse_mode="HTML"
@@ -298,33 +248,27 @@ async def admin_applications_list(
         await callback.answer("❌ Нет прав", show_alert=True)
         return
     
-    filter_type = callback.data.split("_")[-1]
-    
-    # Формируем запрос
-    query = db.query(Application).order_by(desc(Application.created_at))
+    prefix, direction, cursor = parse_page_callback(callback.data)
+    filter_type = prefix.split("_")[-1]
     
     if filter_type == "services":
-        query = query.filter(Application.type == ApplicationType.SERVICE)
         title = "🛠 Заявки на услуги"
     elif filter_type == "team":
-        query = query.filter(Application.type == ApplicationType.TEAM)
         title = "👥 Заявки в команду"
     elif filter_type == "new":
-        # Новые за последние 24 часа
-        yesterday = datetime.now() - timedelta(days=1)
-        query = query.filter(Application.created_at >= yesterday)
         title = "⭐ Новые заявки"
     else:
         title = "📋 Все заявки"
     
-    applications = query.limit(10).all()
+    app_service = AsyncApplicationService(db)
+    page = await app_service.get_applications_page(filter_type, cursor, direction, limit=10)
     
-    if not applications:
+    if not page.items:
         apps_text = f"{title}\n\n❌ <b>Заявок нет</b>"
     else:
         apps_text = f"{title}\n\n"
         
-        for app in applications:
+        for app in page.items:
             date_str = app.created_at.strftime("%d.%m %H:%M")
             type_emoji = "🛠" if app.type == ApplicationType.SERVICE else "👥"
             
@@ -342,16 +286,14 @@ async def admin_applications_list(
                     f"👤 {app.name} | {activity_short}\n\n"
                 )
     
-    from aiogram.utils.keyboard import InlineKeyboardBuilder
-    from aiogram.types import InlineKeyboardButton
-    
-    keyboard = InlineKeyboardBuilder()
+    keyboard = InlineKeyboardBuilder.from_markup(get_pagination_keyboard(prefix, page))
     keyboard.row(
         InlineKeyboardButton(text="🔄 Обновить", callback_data=callback.data),
         InlineKeyboardButton(text="⬅️ Назад", callback_data="admin_applications")
     )
     
-    await callback.message.edit_text(
+    await edit_text_if_changed(
+        callback.message,
         apps_text,
         reply_markup=keyboard.as_markup(),
         parse_mode="HTML"
@@ -380,17 +322,14 @@ async def admin_broadcast_start(
         f"💬 <b>Введите текст сообщения:</b>"
     )
     
-    from aiogram.utils.keyboard import InlineKeyboardBuilder
-    from aiogram.types import InlineKeyboardButton
-    
-    keyboard = InlineKeyboardBuilder()
-    keyboard.row(
-        InlineKeyboardButton(text="❌ Отменить", callback_data="admin_main")
+    keyboard = get_row_keyboard(
+        ("❌ Отменить", "admin_main")
     )
     
-    await callback.message.edit_text(
+    await edit_text_if_changed(
+        callback.message,
         broadcast_text,
-        reply_markup=keyboard.as_markup(),
+        reply_markup=keyboard,
         parse_mode="HTML"
     )
     
@@ -417,8 +356,8 @@ async def admin_broadcast_send(
         return
     
     # Получаем всех пользователей
-    user_service = UserService(db)
-    all_users = user_service.get_all_users()
+    user_service = AsyncUserService(db)
+    all_users = await user_service.get_all_users()
     
     if not all_users:
         await message.answer("❌ Нет пользователей для рассылки")
@@ -434,13 +373,9 @@ async def admin_broadcast_send(
         f"❓ <b>Отправить рассылку?</b>"
     )
     
-    from aiogram.utils.keyboard import InlineKeyboardBuilder
-    from aiogram.types import InlineKeyboardButton
-    
-    keyboard = InlineKeyboardBuilder()
-    keyboard.row(
-        InlineKeyboardButton(text="✅ Отправить", callback_data="broadcast_confirm"),
-        InlineKeyboardButton(text="❌ Отменить", callback_data="admin_main")
+    keyboard = get_row_keyboard(
+        ("✅ Отправить", "broadcast_confirm"),
+        ("❌ Отменить", "admin_main")
     )
     
     # Сохраняем сообщение в состояние
@@ -448,12 +383,13 @@ async def admin_broadcast_send(
     
     await message.answer(
         confirm_text,
-        reply_markup=keyboard.as_markup(),
+        reply_markup=keyboard,
         parse_mode="HTML"
     )
 
 
-@router.callback_query(F.data == "broadcast_confirm")
+# Отвечает на callback сам: алерт об ошибке идёт после чтения FSM
+@router.callback_query(F.data == "broadcast_confirm", flags={"own_answer": True})
 async def admin_broadcast_confirm(
     callback: CallbackQuery,
     user: User,
@@ -475,11 +411,15 @@ async def admin_broadcast_confirm(
         await state.clear()
         return
     
+    # Итог рассылки показывается в сообщении
+    await callback.answer("📤 Рассылка запущена")
+    
     # Получаем всех пользователей
-    user_service = UserService(db)
-    all_users = user_service.get_all_users()
+    user_service = AsyncUserService(db)
+    all_users = await user_service.get_all_users()
     
-    await callback.message.edit_text(
+    await edit_text_if_changed(
+        callback.message,
         f"📤 <b>Отправляю рассылку...</b>\n👥 Пользователей: {len(all_users)}",
         parse_mode="HTML"
     )
@@ -509,27 +449,23 @@ async def admin_broadcast_confirm(
         f"🕐 <b>Время:</b> {datetime.now().strftime('%H:%M:%S')}"
     )
     
-    from aiogram.utils.keyboard import InlineKeyboardBuilder
-    from aiogram.types import InlineKeyboardButton
-    
-    keyboard = InlineKeyboardBuilder()
-    keyboard.row(
-        InlineKeyboardButton(text="🏠 Главная", callback_data="admin_main")
+    keyboard = get_row_keyboard(
+        ("🏠 Главная", "admin_main")
     )
     
-    await callback.message.edit_text(
+    await edit_text_if_changed(
+        callback.message,
         result_text,
-        reply_markup=keyboard.as_markup(),
+        reply_markup=keyboard,
         parse_mode="HTML"
     )
     
     await state.clear()
-    await callback.answer("✅ Рассылка выполнена!")
     
     logger.info(f"Admin {user.telegram_id} sent broadcast to {success_count} users")
 
 
-@router.callback_query(F.data == "admin_users")
+@router.callback_query((F.data == "admin_users") | F.data.startswith("admin_users:"))
 async def admin_users(
     callback: CallbackQuery,
     user: User,
@@ -540,33 +476,32 @@ async def admin_users(
         await callback.answer("❌ Нет прав", show_alert=True)
         return
     
-    user_service = UserService(db)
-    total_users = user_service.get_users_count()
+    prefix, direction, cursor = parse_page_callback(callback.data)
+    
+    stats = await get_dashboard_snapshot()
     
-    # Последние 10 пользователей
-    recent_users = db.query(User).order_by(User.created_at.desc()).limit(10).all()
+    # Страница пользователей (keyset-пагинация по created_at, id)
+    page = await AsyncUserService(db).get_users_page(cursor, direction, limit=10)
     
     users_text = f"👥 <b>Управление пользователями</b>\n\n"
-    users_text += f"📊 <b>Всего пользователей:</b> {total_users}\n\n"
+    users_text += f"📊 <b>Всего пользователей:</b> {stats.users.total}\n\n"
     
-    if recent_users:
-        users_text += f"👤 <b>Последние пользователи:</b>\n"
-        for u in recent_users:
+    if page.items:
+        users_text += f"👤 <b>Пользователи (новые сверху):</b>\n"
+        for u in page.items:
             username = f"@{u.username}" if u.username else "без username"
             date_str = u.created_at.strftime("%d.%m %H:%M")
             blocked = " 🚫" if u.is_blocked else ""
             users_text += f"• {u.first_name} ({username}) - {date_str}{blocked}\n"
     
-    from aiogram.utils.keyboard import InlineKeyboardBuilder
-    from aiogram.types import InlineKeyboardButton
-    
-    keyboard = InlineKeyboardBuilder()
+    keyboard = InlineKeyboardBuilder.from_markup(get_pagination_keyboard(prefix, page))
     keyboard.row(
-        InlineKeyboardButton(text="🔄 Обновить", callback_data="admin_users"),
+        InlineKeyboardButton(text="🔄 Обновить", callback_data=callback.data),
         InlineKeyboardButton(text="⬅️ Назад", callback_data="admin_main")
     )
     
-    await callback.message.edit_text(
+    await edit_text_if_changed(
+        callback.message,
         users_text,
         reply_markup=keyboard.as_markup(),
         parse_mode="HTML"
@@ -599,17 +534,109 @@ async def admin_settings(
         service_short = service.split()[0]
         settings_text += f"{i}. {service_short}\n"
     
-    from aiogram.utils.keyboard import InlineKeyboardBuilder
-    from aiogram.types import InlineKeyboardButton
-    
-    keyboard = InlineKeyboardBuilder()
-    keyboard.row(
-        InlineKeyboardButton(text="⬅️ Назад", callback_data="admin_main")
+    keyboard = get_row_keyboard(
+        ("⬅️ Назад", "admin_main")
     )
     
-    await callback.message.edit_text(
+    await edit_text_if_changed(
+        callback.message,
         settings_text,
-        reply_markup=keyboard.as_markup(),
+        reply_markup=keyboard,
+        parse_mode="HTML"
+    )
+    await callback.answer()
+
+
+@router.callback_query(F.data == "admin_metrics")
+async def admin_metrics(
+    callback: CallbackQuery,
+    user: User
+):
+    """Show runtime performance metrics."""
+    if not is_admin(user.telegram_id):
+        await callback.answer("❌ Нет прав", show_alert=True)
+        return
+    
+    cache_stats = user_cache.stats()
+    dashboard_stats = dashboard_cache.stats()
+    pool_stats = pool_metrics.stats()
+    if pool_stats:
+        pool_text = (
+            f"• Размер / overflow: <b>{pool_stats['size']} + {pool_stats['max_overflow']}</b>\n"
+            f"• Занято сейчас: <b>{pool_stats['in_use']}</b> (пик {pool_stats['peak_in_use']})\n"
+            f"• Overflow сейчас: <b>{pool_stats['overflow']}</b> "
+            f"(пик {pool_stats['peak_overflow']})\n"
+            f"• Выдач: <b>{pool_stats['checkouts']}</b>, "
+            f"таймаутов: <b>{pool_stats['timeouts']}</b>\n"
+            f"• Ожидание: <b>{pool_stats['wait_avg_ms']:.2f}</b> мс сред., "
+            f"<b>{pool_stats['wait_max_ms']:.2f}</b> мс макс.\n\n"
+        )
+    else:
+        pool_text = "• Нет данных (пул без очереди)\n\n"
+    
+    transitions_text = "".join(
+        f"• {flow}: правок <b>{counters.edits}</b>, клавиатур <b>{counters.markup_edits}</b>, "
+        f"пропущено <b>{counters.skipped}</b>, переотправок <b>{counters.resends}</b>, "
+        f"сэкономлено вызовов <b>{counters.calls_saved}</b>\n"
+        for flow, counters in sorted(transition_metrics.flows.items())
+    ) or "• Нет данных\n"
+    
+    metrics_text = (
+        f"📈 <b>Метрики бота</b>\n\n"
+        f"👤 <b>Кэш пользователей:</b>\n"
+        f"• Записей: <b>{cache_stats['size']}</b>\n"
+        f"• Попаданий: <b>{cache_stats['hits']}</b>\n"
+        f"• Промахов: <b>{cache_stats['misses']}</b>\n"
+        f"• Hit rate: <b>{cache_stats['hit_rate']:.1%}</b>\n\n"
+        f"✍️ <b>Отложенная запись профилей:</b>\n"
+        f"• В очереди: <b>{profile_writer.pending}</b>\n"
+        f"• Сбросов: <b>{profile_writer.flushes}</b>\n"
+        f"• Записано строк: <b>{profile_writer.rows_written}</b>\n\n"
+        f"📥 <b>Пакетная запись заявок:</b> {'вкл' if application_writer.running else 'выкл'}\n"
+        f"• В очереди: <b>{application_writer.depth}</b> (пик {application_writer.max_depth})\n"
+        f"• Пакетов: <b>{application_writer.batches}</b>\n"
+        f"• Записано заявок: <b>{application_writer.rows_written}</b>\n\n"
+        f"💾 <b>Спул заявок (сбои БД):</b>\n"
+        f"• Ожидает: <b>{submission_spool.pending_bytes}</b> байт\n"
+        f"• Сохранено в спул: <b>{submission_spool.captured}</b>\n"
+        f"• Восстановлено: <b>{submission_spool.replayed}</b> "
+        f"(дублей {submission_spool.duplicates})\n"
+        f"• В карантине: <b>{submission_spool.quarantined}</b>\n\n"
+        f"🖼 <b>Фото по file_id:</b>\n"
+        f"• Известно: <b>{media_registry.size}</b>\n"
+        f"• Отправлено по file_id: <b>{media_registry.hits}</b>\n"
+        f"• Загружено по URL: <b>{media_registry.uploads}</b> "
+        f"(отклонено id {media_registry.rejected})\n\n"
+        f"👆 <b>Ответы на нажатия кнопок:</b>\n"
+        f"• Ранних (≤ {settings.callback_answer_deadline:g} с): "
+        f"<b>{callback_answer_metrics.early}</b>\n"
+        f"• Хендлером: <b>{callback_answer_metrics.by_handler}</b>\n"
+        f"• После хендлера: <b>{callback_answer_metrics.late}</b>\n"
+        f"• Подавлено повторных: <b>{callback_answer_metrics.suppressed}</b>\n\n"
+        f"♻️ <b>Переходы экранов:</b>\n"
+        f"{transitions_text}\n"
+        f"🔁 <b>Правки без изменений:</b>\n"
+        f"• Отправлено правок: <b>{rendered_edits.edits}</b>\n"
+        f"• Пропущено по хэшу: <b>{rendered_edits.skipped}</b>\n"
+        f"• «Not modified» от Telegram: <b>{rendered_edits.not_modified}</b>\n\n"
+        f"📸 <b>Снимок дашборда:</b>\n"
+        f"• Из кэша: <b>{dashboard_stats['hits']}</b>\n"
+        f"• Пересчётов: <b>{dashboard_stats['misses']}</b>\n"
+        f"• Совмещённых запросов: <b>{dashboard_stats['shared']}</b>\n\n"
+        f"🔌 <b>Пул соединений БД:</b>\n"
+        f"{pool_text}"
+        f"🕐 <b>Обновлено:</b> {datetime.now().strftime('%H:%M:%S')}"
+    )
+    
+    keyboard = get_row_keyboard(
+        ("🔄 Обновить", "admin_metrics"),
+        ("⬅️ Назад", "admin_main")
+    )
+    
+    await edit_text_if_changed(
+        callback.message,
+        metrics_text,
+        reply_markup=keyboard,
         parse_mode="HTML"
     )
     await callback.answer()
@@ -626,34 +653,23 @@ async def admin_refresh(
         await callback.answer("❌ Нет прав", show_alert=True)
         return
     
-    # Получаем свежую статистику с временем
-    user_service = UserService(db)
-    app_service = ApplicationService(db)
-    
-    total_users = user_service.get_users_count()
-    total_applications = app_service.get_applications_count()
-    
-    today = datetime.now().date()
-    new_apps_today = db.query(Application).filter(
-        func.date(Application.created_at) == today
-    ).count()
+    await callback.answer("🔄 Панель обновлена!")
     
-    # Добавляем секунды для гарантии изменения контента
-    current_time = datetime.now().strftime('%H:%M:%S, %d.%m.%Y')
+    # Получаем свежую статистику
+    stats = await get_dashboard_snapshot()
     
     admin_text = (
         f"👨‍💻 <b>Админ-панель NOFACE.digital</b>\n\n"
         f"📊 <b>Быстрая статистика:</b>\n"
-        f"👥 Пользователи: <b>{total_users}</b>\n"
-        f"📝 Всего заявок: <b>{total_applications}</b>\n"
-        f"🆕 Новых сегодня: <b>{new_apps_today}</b>\n\n"
-        f"🔄 <b>Обновлено:</b> {current_time}\n\n"
+        f"👥 Пользователи: <b>{stats.users.total}</b>\n"
+        f"📝 Всего заявок: <b>{stats.applications.total}</b>\n"
+        f"🆕 Новых сегодня: <b>{stats.applications.today}</b>\n\n"
         f"🎛 <b>Выберите раздел:</b>"
     )
     
-    await callback.message.edit_text(
+    await edit_text_if_changed(
+        callback.message,
         admin_text,
         reply_markup=get_admin_menu(),
         parse_mode="HTML"
     )
-    await callback.answer("🔄 Панель обновлена!") 
\ No newline at end of file
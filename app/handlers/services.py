@@ -3,17 +3,27 @@ Service order handlers with step-by-step selection.
 """
 
 import json
+from typing import Any, Dict, Optional, Union
 from aiogram import Router, F
 from aiogram.types import CallbackQuery, Message
 from aiogram.fsm.context import FSMContext
 from sqlalchemy.orm import Session
 
 from app.core.states import ServiceFormStates
-from app.core.service_categories import SERVICE_CATEGORIES
+from app.core.callbacks import (
+    BudgetCallback, ContentCallback, DesignCallback, OptionCallback,
+    ServiceCallback, SubcategoryCallback, SupportCallback, TimelineCallback
+)
+from app.core.service_categories import CATALOG_VERSION, decode_form, form_choices, is_choice
+from app.core.texts import (
+    BUDGET_SCREENS, OPTIONS_SCREENS, SERVICE_CANCELLED_CAPTION, SERVICES_CAPTION,
+    SUBCATEGORY_SCREENS
+)
 from app.models.application import Application, ApplicationType
 from app.models.user import User
-from app.services.application import ApplicationService
+from app.services.application import AsyncApplicationService
 from app.services.notification import NotificationService
+from app.services.media import MAIN_MENU_PHOTO, SERVICES_PHOTO, media_registry
 from app.utils.keyboards import (
     create_services_keyboard, create_subcategories_keyboard, 
     create_budget_keyboard, create_timeline_keyboard,
@@ -21,247 +31,371 @@ from app.utils.keyboards import (
     create_support_keyboard, create_additional_options_keyboard,
     create_final_step_keyboard, create_main_menu_keyboard,
     create_cancel_keyboard, create_confirmation_keyboard,
-    get_main_menu
+    create_contact_method_keyboard, get_main_menu
 )
+from app.utils.fsm_storage import advance_step
+from app.utils.transitions import show_screen, update_markup
 from app.core.logger import get_logger
 
 logger = get_logger(__name__)
 
 services_router = Router()
 
+# Handlers that can end with an alert answer the query themselves (see
+# CallbackAnswerMiddleware): an early empty answer would swallow the alert
+OWN_ANSWER = {"own_answer": True}
+
+UNKNOWN_CHOICE_ALERT = "⚠️ Такого варианта нет, выберите из списка"
+FORM_EXPIRED_TEXT = "⚠️ Данные заявки устарели, начните оформление заново"
+
+
+async def reject_unknown_choice(
+    callback: CallbackQuery,
+    field: str,
+    code: int,
+    service: Optional[int] = None
+) -> bool:
+    """
+    Alert about a button code outside a field's choices.
+    
+    Args:
+        callback: Callback query of the button
+        field: Form field name (see CODED_FIELDS)
+        code: Code from the callback data
+        service: Service code, required for service-specific fields
+        
+    Returns:
+        True if the code was rejected and the handler should stop
+    """
+    if is_choice(field, code, service):
+        return False
+    await callback.answer(UNKNOWN_CHOICE_ALERT, show_alert=True)
+    return True
+
+
+async def decode_answers(
+    event: Union[CallbackQuery, Message],
+    state: FSMContext,
+    data: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """
+    Decode form answers, resetting a form that does not decode.
+    
+    Codes in the FSM data come from callback data, so a stale or crafted
+    one is reported to the user instead of failing the handler. So is a
+    form started with another catalog version or already finished (no
+    service in the data).
+    
+    Args:
+        event: Callback query (answered with an alert) or message
+        state: FSM context of the form
+        data: FSM data of the form
+        
+    Returns:
+        Decoded form, or None if the user was asked to start over
+    """
+    try:
+        return decode_form(data)
+    except ValueError as e:
+        logger.warning(f"Service form of user {event.from_user.id} reset: {e}")
+    
+    await state.clear()
+    if isinstance(event, CallbackQuery):
+        await event.answer(FORM_EXPIRED_TEXT, show_alert=True)
+    else:
+        await event.answer(FORM_EXPIRED_TEXT, reply_markup=get_main_menu())
+    return None
+
 
 @services_router.callback_query(F.data == "order_service")
 async def start_service_selection(callback: CallbackQuery, state: FSMContext):
     """Start service selection process."""
-    await state.clear()
-    await state.set_state(ServiceFormStates.waiting_for_service)
+    # Новая форма запоминает версию каталога, по которой закодированы ответы
+    await advance_step(state, ServiceFormStates.waiting_for_service, {}, catalog=CATALOG_VERSION)
     
-    # Всегда удаляем предыдущее сообщение и отправляем новое с фото
-    await callback.message.delete()
-    await callback.message.answer_photo(
-        photo="https://i.ibb.co/kfTJqZx/B5-C581-C7-51-E9-4-BEF-B66-B-0615-B766-C386.png",
-        caption="🛠 <b>ВЫБЕРИТЕ УСЛУГУ</b>\n\n"
-                "Выберите категорию услуги из списка ниже:",
+    # Фото-меню заменяется на месте, текстовый шаг - удаляется и отправляется фото
+    await show_screen(
+        callback,
+        SERVICES_CAPTION,
         reply_markup=create_services_keyboard(),
-        parse_mode="HTML"
+        photo=SERVICES_PHOTO,
+        flow="service"
     )
     await callback.answer()
 
 
-@services_router.callback_query(F.data.startswith("service:"), ServiceFormStates.waiting_for_service)
-async def handle_service_selection(callback: CallbackQuery, state: FSMContext):
+@services_router.callback_query(
+    ServiceCallback.filter(), ServiceFormStates.waiting_for_service, flags=OWN_ANSWER
+)
+async def handle_service_selection(
+    callback: CallbackQuery,
+    callback_data: ServiceCallback,
+    state: FSMContext
+):
     """Handle service selection."""
-    service = callback.data.split(":", 1)[1]
-    await state.update_data(service=service)
-    await state.set_state(ServiceFormStates.waiting_for_subcategory)
+    if await reject_unknown_choice(callback, "service", callback_data.code):
+        return
     
-    # Получаем описания подкатегорий
-    subcategories = SERVICE_CATEGORIES[service]["subcategories"]
-    description_text = "\n".join([f"• <b>{name}</b> - {desc}" for name, desc in subcategories.items()])
+    await callback.answer()
     
-    await callback.message.delete()
-    await callback.message.answer(
-        f"📋 <b>ВЫБЕРИТЕ ТИП: {service}</b>\n\n"
-        f"{description_text}\n\n"
-        "Выберите подходящий вариант:",
-        reply_markup=create_subcategories_keyboard(service),
-        parse_mode="HTML"
+    await advance_step(state, ServiceFormStates.waiting_for_subcategory, service=callback_data.code)
+    
+    await show_screen(
+        callback,
+        SUBCATEGORY_SCREENS[callback_data.code],
+        reply_markup=create_subcategories_keyboard(callback_data.code),
+        flow="service"
     )
-    await callback.answer()
 
 
-@services_router.callback_query(F.data.startswith("subcategory:"), ServiceFormStates.waiting_for_subcategory)
-async def handle_subcategory_selection(callback: CallbackQuery, state: FSMContext):
+@services_router.callback_query(
+    SubcategoryCallback.filter(), ServiceFormStates.waiting_for_subcategory, flags=OWN_ANSWER
+)
+async def handle_subcategory_selection(
+    callback: CallbackQuery,
+    callback_data: SubcategoryCallback,
+    state: FSMContext
+):
     """Handle subcategory selection."""
-    subcategory = callback.data.split(":", 1)[1]
-    await state.update_data(subcategory=subcategory)
-    await state.set_state(ServiceFormStates.waiting_for_budget)
-    
-    # Получаем данные о сервисе для показа бюджетов
     data = await state.get_data()
-    service = data["service"]
+    service = data.get("service")
+    if await reject_unknown_choice(callback, "subcategory", callback_data.code, service):
+        return
     
-    await callback.message.delete()
-    await callback.message.answer(
-        f"💰 <b>ВЫБЕРИТЕ БЮДЖЕТ</b>\n\n"
-        f"<b>Услуга:</b> {service}\n"
-        f"<b>Тип:</b> {subcategory}\n\n"
-        "Выберите подходящий бюджет для вашего проекта:",
-        reply_markup=create_budget_keyboard(service),
-        parse_mode="HTML"
-    )
     await callback.answer()
+    
+    await advance_step(
+        state, ServiceFormStates.waiting_for_budget, data, subcategory=callback_data.code
+    )
+    
+    await show_screen(
+        callback,
+        BUDGET_SCREENS[data["service"]][callback_data.code],
+        reply_markup=create_budget_keyboard(data["service"]),
+        flow="service"
+    )
 
 
-@services_router.callback_query(F.data.startswith("budget:"), ServiceFormStates.waiting_for_budget)
-async def handle_budget_selection(callback: CallbackQuery, state: FSMContext):
+@services_router.callback_query(
+    BudgetCallback.filter(), ServiceFormStates.waiting_for_budget, flags=OWN_ANSWER
+)
+async def handle_budget_selection(
+    callback: CallbackQuery,
+    callback_data: BudgetCallback,
+    state: FSMContext
+):
     """Handle budget selection."""
-    budget = callback.data.split(":", 1)[1]
-    await state.update_data(budget=budget)
-    await state.set_state(ServiceFormStates.waiting_for_timeline)
+    data = await state.get_data()
+    if await reject_unknown_choice(callback, "budget", callback_data.code, data.get("service")):
+        return
     
-    await callback.message.delete()
-    await callback.message.answer(
+    await callback.answer()
+    
+    budget = form_choices("budget", data["service"])[callback_data.code]
+    await advance_step(
+        state, ServiceFormStates.waiting_for_timeline, data, budget=callback_data.code
+    )
+    
+    await show_screen(
+        callback,
         f"⏰ <b>ВЫБЕРИТЕ СРОКИ</b>\n\n"
         f"<b>Бюджет:</b> {budget}\n\n"
         "В какие сроки нужно выполнить проект?",
         reply_markup=create_timeline_keyboard(),
-        parse_mode="HTML"
+        flow="service"
     )
-    await callback.answer()
 
 
-@services_router.callback_query(F.data.startswith("timeline:"), ServiceFormStates.waiting_for_timeline)
-async def handle_timeline_selection(callback: CallbackQuery, state: FSMContext):
+@services_router.callback_query(
+    TimelineCallback.filter(), ServiceFormStates.waiting_for_timeline, flags=OWN_ANSWER
+)
+async def handle_timeline_selection(
+    callback: CallbackQuery,
+    callback_data: TimelineCallback,
+    state: FSMContext
+):
     """Handle timeline selection."""
-    timeline = callback.data.split(":", 1)[1]
-    await state.update_data(timeline=timeline)
-    await state.set_state(ServiceFormStates.waiting_for_content)
+    if await reject_unknown_choice(callback, "timeline", callback_data.code):
+        return
     
-    await callback.message.delete()
-    await callback.message.answer(
+    await callback.answer()
+    
+    timeline = form_choices("timeline")[callback_data.code]
+    await advance_step(state, ServiceFormStates.waiting_for_content, timeline=callback_data.code)
+    
+    await show_screen(
+        callback,
         f"📄 <b>КОНТЕНТ ДЛЯ ПРОЕКТА</b>\n\n"
         f"<b>Сроки:</b> {timeline}\n\n"
         "У вас есть готовый контент (тексты, фото, видео)?",
         reply_markup=create_content_keyboard(),
-        parse_mode="HTML"
+        flow="service"
     )
-    await callback.answer()
 
 
-@services_router.callback_query(F.data.startswith("content:"), ServiceFormStates.waiting_for_content)
-async def handle_content_selection(callback: CallbackQuery, state: FSMContext):
+@services_router.callback_query(
+    ContentCallback.filter(), ServiceFormStates.waiting_for_content, flags=OWN_ANSWER
+)
+async def handle_content_selection(
+    callback: CallbackQuery,
+    callback_data: ContentCallback,
+    state: FSMContext
+):
     """Handle content availability selection."""
-    content = callback.data.split(":", 1)[1]
-    await state.update_data(has_content=content)
-    await state.set_state(ServiceFormStates.waiting_for_design)
+    if await reject_unknown_choice(callback, "has_content", callback_data.code):
+        return
     
-    await callback.message.delete()
-    await callback.message.answer(
+    await callback.answer()
+    
+    content = form_choices("has_content")[callback_data.code]
+    await advance_step(state, ServiceFormStates.waiting_for_design, has_content=callback_data.code)
+    
+    await show_screen(
+        callback,
         f"🎨 <b>ДИЗАЙН ПРОЕКТА</b>\n\n"
         f"<b>Контент:</b> {content}\n\n"
         "У вас есть готовый дизайн-макет?",
         reply_markup=create_design_keyboard(),
-        parse_mode="HTML"
+        flow="service"
     )
-    await callback.answer()
 
 
-@services_router.callback_query(F.data.startswith("design:"), ServiceFormStates.waiting_for_design)
-async def handle_design_selection(callback: CallbackQuery, state: FSMContext):
+@services_router.callback_query(
+    DesignCallback.filter(), ServiceFormStates.waiting_for_design, flags=OWN_ANSWER
+)
+async def handle_design_selection(
+    callback: CallbackQuery,
+    callback_data: DesignCallback,
+    state: FSMContext
+):
     """Handle design availability selection."""
-    design = callback.data.split(":", 1)[1]
-    await state.update_data(has_design=design)
-    await state.set_state(ServiceFormStates.waiting_for_support)
+    if await reject_unknown_choice(callback, "has_design", callback_data.code):
+        return
     
-    await callback.message.delete()
-    await callback.message.answer(
+    await callback.answer()
+    
+    design = form_choices("has_design")[callback_data.code]
+    await advance_step(state, ServiceFormStates.waiting_for_support, has_design=callback_data.code)
+    
+    await show_screen(
+        callback,
         f"🛡 <b>УРОВЕНЬ ПОДДЕРЖКИ</b>\n\n"
         f"<b>Дизайн:</b> {design}\n\n"
         "Какой уровень поддержки вам нужен после запуска?",
         reply_markup=create_support_keyboard(),
-        parse_mode="HTML"
+        flow="service"
     )
-    await callback.answer()
 
 
-@services_router.callback_query(F.data.startswith("support:"), ServiceFormStates.waiting_for_support)
-async def handle_support_selection(callback: CallbackQuery, state: FSMContext):
+@services_router.callback_query(
+    SupportCallback.filter(), ServiceFormStates.waiting_for_support, flags=OWN_ANSWER
+)
+async def handle_support_selection(
+    callback: CallbackQuery,
+    callback_data: SupportCallback,
+    state: FSMContext
+):
     """Handle support level selection."""
-    support = callback.data.split(":", 1)[1]
-    await state.update_data(support_level=support)
-    await state.set_state(ServiceFormStates.waiting_for_additional_options)
+    if await reject_unknown_choice(callback, "support_level", callback_data.code):
+        return
     
-    # Получаем сервис для показа специфичных опций
-    data = await state.get_data()
-    service = data["service"]
+    await callback.answer()
     
-    await callback.message.delete()
-    await callback.message.answer(
-        f"⚙️ <b>ДОПОЛНИТЕЛЬНЫЕ ОПЦИИ</b>\n\n"
-        f"<b>Поддержка:</b> {support}\n\n"
-        f"<b>Выбрано опций:</b> 0\n\n"
-        "Выберите дополнительные опции которые вам нужны.\n"
-        "Можно выбрать несколько вариантов:",
-        reply_markup=create_additional_options_keyboard(service, []),
-        parse_mode="HTML"
+    data = await advance_step(
+        state, ServiceFormStates.waiting_for_additional_options,
+        support_level=callback_data.code
+    )
+    
+    await show_screen(
+        callback,
+        OPTIONS_SCREENS[callback_data.code],
+        reply_markup=create_additional_options_keyboard(data["service"], []),
+        flow="service"
     )
-    await callback.answer()
 
 
-@services_router.callback_query(F.data.startswith("option:"), ServiceFormStates.waiting_for_additional_options)
-async def handle_additional_option(callback: CallbackQuery, state: FSMContext):
+@services_router.callback_query(
+    OptionCallback.filter(), ServiceFormStates.waiting_for_additional_options, flags=OWN_ANSWER
+)
+async def handle_additional_option(
+    callback: CallbackQuery,
+    callback_data: OptionCallback,
+    state: FSMContext
+):
     """Handle additional option selection."""
-    option = callback.data.split(":", 1)[1]
+    code = callback_data.code
     
     # Получаем текущие опции
     data = await state.get_data()
-    current_options = data.get("additional_options", [])
+    
+    # Код приходит от клиента: чужие коды не попадают ни в форму, ни в кэш клавиатур
+    if await reject_unknown_choice(callback, "additional_options", code, data.get("service")):
+        return
+    
+    current_options = list(data.get("additional_options", []))
     
     # Добавляем или удаляем опцию
-    if option in current_options:
-        current_options.remove(option)
+    if code in current_options:
+        current_options.remove(code)
         await callback.answer("❌ Опция убрана")
     else:
-        current_options.append(option)
+        current_options.append(code)
         await callback.answer("✅ Опция добавлена")
     
-    await state.update_data(additional_options=current_options)
-    
-    # Обновляем сообщение
-    service = data["service"]
+    await state.set_data({**data, "additional_options": current_options})
     
-    await callback.message.delete()
-    await callback.message.answer(
-        f"⚙️ <b>ДОПОЛНИТЕЛЬНЫЕ ОПЦИИ</b>\n\n"
-        f"<b>Поддержка:</b> {data.get('support_level', '')}\n\n"
-        f"<b>Выбрано опций:</b> {len(current_options)}\n\n"
-        "Выберите дополнительные опции которые вам нужны.\n"
-        "Можно выбрать несколько вариантов:",
-        reply_markup=create_additional_options_keyboard(service, current_options),
-        parse_mode="HTML"
+    # Меняются только отметки в клавиатуре, текст остаётся прежним
+    await update_markup(
+        callback,
+        create_additional_options_keyboard(data["service"], current_options),
+        flow="service"
     )
 
 
-@services_router.callback_query(F.data == "skip_options", ServiceFormStates.waiting_for_additional_options)
+@services_router.callback_query(
+    F.data == "skip_options", ServiceFormStates.waiting_for_additional_options, flags=OWN_ANSWER
+)
 async def skip_additional_options(callback: CallbackQuery, state: FSMContext):
     """Skip additional options."""
-    await callback.answer("⏭ Пропускаем опции")
-    await state.update_data(additional_options=[])
-    await show_final_step(callback, state)
+    await show_final_step(callback, state, "⏭ Пропускаем опции", additional_options=[])
 
 
-@services_router.callback_query(F.data == "options_done", ServiceFormStates.waiting_for_additional_options)
+@services_router.callback_query(
+    F.data == "options_done", ServiceFormStates.waiting_for_additional_options, flags=OWN_ANSWER
+)
 async def finish_additional_options(callback: CallbackQuery, state: FSMContext):
     """Finish selecting additional options."""
-    await callback.answer("✅ Опции выбраны")
-    await show_final_step(callback, state)
+    await show_final_step(callback, state, "✅ Опции выбраны")
 
 
-async def show_final_step(callback: CallbackQuery, state: FSMContext):
+async def show_final_step(callback: CallbackQuery, state: FSMContext, answer_text: str, **changes):
     """Show final step - description or skip."""
-    await state.set_state(ServiceFormStates.waiting_for_description)
+    data = await advance_step(state, ServiceFormStates.waiting_for_description, **changes)
+    form = await decode_answers(callback, state, data)
+    if form is None:
+        return
+    await callback.answer(answer_text)
     
-    data = await state.get_data()
-    options_text = ", ".join(data.get("additional_options", [])) or "Не выбрано"
+    options_text = ", ".join(form.get("additional_options", [])) or "Не выбрано"
     
-    await callback.message.delete()
-    await callback.message.answer(
+    await show_screen(
+        callback,
         f"📝 <b>ДОПОЛНИТЕЛЬНОЕ ОПИСАНИЕ</b>\n\n"
         f"<b>Доп. опции:</b> {options_text}\n\n"
         "Хотите добавить подробное описание вашего проекта?\n"
         "Это поможет нам лучше понять ваши потребности.",
         reply_markup=create_final_step_keyboard(),
-        parse_mode="HTML"
+        flow="service"
     )
-    await callback.answer()
 
 
-@services_router.callback_query(F.data == "add_description", ServiceFormStates.waiting_for_description)
+@services_router.callback_query(
+    F.data == "add_description", ServiceFormStates.waiting_for_description
+)
 async def request_description(callback: CallbackQuery, state: FSMContext):
     """Request project description."""
-    await callback.message.delete()
-    await callback.message.answer(
+    await show_screen(
+        callback,
         "📝 <b>ОПИСАНИЕ ПРОЕКТА</b>\n\n"
         "Опишите ваш проект подробнее:\n"
         "• Цели и задачи\n"
@@ -270,29 +404,29 @@ async def request_description(callback: CallbackQuery, state: FSMContext):
         "• Любые дополнительные детали\n\n"
         "Напишите ваше описание одним сообщением:",
         reply_markup=create_cancel_keyboard("service"),
-        parse_mode="HTML"
+        flow="service"
     )
     await callback.answer()
 
 
-@services_router.callback_query(F.data == "skip_description", ServiceFormStates.waiting_for_description)
+@services_router.callback_query(
+    F.data == "skip_description", ServiceFormStates.waiting_for_description
+)
 async def skip_description(callback: CallbackQuery, state: FSMContext):
     """Skip description and proceed to contact info."""
     await callback.answer("⏭ Пропускаем описание")
-    await state.update_data(description="")
-    await request_contact_info(callback, state)
+    await request_contact_info(callback, state, description="")
 
 
 @services_router.message(ServiceFormStates.waiting_for_description)
 async def handle_description(message: Message, state: FSMContext):
     """Handle project description."""
-    await state.update_data(description=message.text)
-    await request_contact_info(message, state)
+    await request_contact_info(message, state, description=message.text)
 
 
-async def request_contact_info(message_or_callback, state: FSMContext):
+async def request_contact_info(message_or_callback, state: FSMContext, **changes):
     """Request contact information."""
-    await state.set_state(ServiceFormStates.waiting_for_name)
+    await advance_step(state, ServiceFormStates.waiting_for_name, **changes)
     
     text = (
         "👤 <b>ВАШИ КОНТАКТНЫЕ ДАННЫЕ</b>\n\n"
@@ -303,11 +437,11 @@ async def request_contact_info(message_or_callback, state: FSMContext):
     from aiogram.types import CallbackQuery, Message
     
     if isinstance(message_or_callback, CallbackQuery):
-        await message_or_callback.message.delete()
-        await message_or_callback.message.answer(
+        await show_screen(
+            message_or_callback,
             text,
             reply_markup=create_cancel_keyboard("service"),
-            parse_mode="HTML"
+            flow="service"
         )
         await message_or_callback.answer()  # ВАЖНО! Закрываем callback
     elif isinstance(message_or_callback, Message):
@@ -321,8 +455,7 @@ async def request_contact_info(message_or_callback, state: FSMContext):
 @services_router.message(ServiceFormStates.waiting_for_name)
 async def handle_name(message: Message, state: FSMContext):
     """Handle user name."""
-    await state.update_data(name=message.text)
-    await state.set_state(ServiceFormStates.waiting_for_contact)
+    await advance_step(state, ServiceFormStates.waiting_for_contact, name=message.text)
     
     await message.answer(
         "📱 <b>СПОСОБ СВЯЗИ</b>\n\n"
@@ -332,21 +465,6 @@ async def handle_name(message: Message, state: FSMContext):
     )
 
 
-def create_contact_method_keyboard():
-    """Create keyboard for contact method selection."""
-    from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
-    
-    buttons = [
-        [InlineKeyboardButton(text="📞 Телефон", callback_data="contact_method:phone")],
-        [InlineKeyboardButton(text="💬 Telegram", callback_data="contact_method:telegram")],
-        [InlineKeyboardButton(text="📧 Email", callback_data="contact_method:email")],
-        [InlineKeyboardButton(text="🌐 WhatsApp", callback_data="contact_method:whatsapp")],
-        [InlineKeyboardButton(text="✏️ Ввести вручную", callback_data="contact_method:manual")],
-        [InlineKeyboardButton(text="❌ Отменить", callback_data="cancel_service")]
-    ]
-    return InlineKeyboardMarkup(inline_keyboard=buttons)
-
-
 @services_router.callback_query(F.data.startswith("contact_method:"))
 async def handle_contact_method(callback: CallbackQuery, state: FSMContext):
     """Handle contact method selection."""
@@ -363,11 +481,11 @@ async def handle_contact_method(callback: CallbackQuery, state: FSMContext):
     else:  # manual
         text = "✏️ <b>КОНТАКТ</b>\n\nВведите любой удобный способ связи:"
     
-    await callback.message.delete()
-    await callback.message.answer(
+    await show_screen(
+        callback,
         text,
         reply_markup=create_cancel_keyboard("service"),
-        parse_mode="HTML"
+        flow="service"
     )
     await callback.answer()
 
@@ -375,10 +493,13 @@ async def handle_contact_method(callback: CallbackQuery, state: FSMContext):
 @services_router.message(ServiceFormStates.waiting_for_contact)
 async def handle_contact(message: Message, state: FSMContext, db: Session):
     """Handle contact info and show confirmation."""
-    await state.update_data(contact=message.text)
+    data = {**await state.get_data(), "contact": message.text}
+    await state.set_data(data)
     
     # Показываем сводку заявки
-    data = await state.get_data()
+    data = await decode_answers(message, state, data)
+    if data is None:
+        return
     
     summary = f"📋 <b>ПОДТВЕРЖДЕНИЕ ЗАЯВКИ</b>\n\n"
     summary += f"👤 <b>Имя:</b> {data['name']}\n"
@@ -406,27 +527,34 @@ async def handle_contact(message: Message, state: FSMContext, db: Session):
     )
 
 
-@services_router.callback_query(F.data == "confirm_application")
+@services_router.callback_query(F.data == "confirm_application", flags=OWN_ANSWER)
 async def confirm_application(callback: CallbackQuery, state: FSMContext, db: Session, user: User):
     """Confirm and save application."""
     data = await state.get_data()
     
     # Проверяем что все обязательные данные есть
     required_fields = ['name', 'contact', 'service', 'subcategory', 'budget', 'timeline', 'has_content', 'has_design', 'support_level']
-    missing_fields = [field for field in required_fields if not data.get(field)]
+    missing_fields = [field for field in required_fields if data.get(field) in (None, "")]
     
     if missing_fields:
         await callback.answer(f"❌ Не хватает данных: {', '.join(missing_fields)}", show_alert=True)
         logger.error(f"Missing required fields for user {user.telegram_id}: {missing_fields}")
         return
     
+    data = await decode_answers(callback, state, data)
+    if data is None:
+        return
+    
+    # Отвечаем до записи в БД и уведомлений - дальше результат показывает сообщение
+    await callback.answer("📤 Отправляем заявку...")
+    
     # Создаем заявку
-    application_service = ApplicationService(db)
+    application_service = AsyncApplicationService(db)
     
     additional_options_json = json.dumps(data.get('additional_options', []), ensure_ascii=False)
     
-    application = application_service.create_application(
-        user_id=user.id,
+    application = await application_service.create_application(
+        user=user,
         application_type=ApplicationType.SERVICE,
         name=data['name'],
         contact=data['contact'],
@@ -453,10 +581,10 @@ async def confirm_application(callback: CallbackQuery, state: FSMContext, db: Se
     await state.clear()
     
     await callback.message.delete()
-    await callback.message.answer_photo(
-        photo="https://i.ibb.co/3m4bCScL/AB6-FA99-A-E1-CA-4498-9-DE7-2-A64-DA7-B96-E4.png",
+    await media_registry.answer_photo(
+        callback.message, MAIN_MENU_PHOTO,
         caption=f"✅ <b>ЗАЯВКА ОТПРАВЛЕНА!</b>\n\n"
-               f"Номер заявки: <b>#{application.id}</b>\n\n"
+               f"Номер заявки: <b>{application.number}</b>\n\n"
                f"Спасибо за ваш заказ! Мы рассмотрим заявку и свяжемся с вами "
                f"в ближайшее время для уточнения деталей.\n\n"
                f"📞 Если у вас есть срочные вопросы, можете написать напрямую: @pavel_xdev\n\n"
@@ -464,160 +592,162 @@ async def confirm_application(callback: CallbackQuery, state: FSMContext, db: Se
         reply_markup=get_main_menu(),
         parse_mode="HTML"
     )
-    await callback.answer("✅ Заявка успешно отправлена!")
 
 
-# ALL NAVIGATION CALLBACKS WITH DELETE+ANSWER
+# ALL NAVIGATION CALLBACKS EDIT THE MESSAGE IN PLACE
 @services_router.callback_query(F.data == "back_to_services")
 async def back_to_services(callback: CallbackQuery, state: FSMContext):
     """Go back to services selection."""
     await start_service_selection(callback, state)
 
 
-@services_router.callback_query(F.data == "back_to_subcategory")
+@services_router.callback_query(F.data == "back_to_subcategory", flags=OWN_ANSWER)
 async def back_to_subcategory(callback: CallbackQuery, state: FSMContext):
     """Go back to subcategory selection."""
     data = await state.get_data()
-    service = data["service"]
-    await state.set_state(ServiceFormStates.waiting_for_subcategory)
+    if await decode_answers(callback, state, data) is None:
+        return
+    await callback.answer()
     
-    subcategories = SERVICE_CATEGORIES[service]["subcategories"]
-    description_text = "\n".join([f"• <b>{name}</b> - {desc}" for name, desc in subcategories.items()])
+    await state.set_state(ServiceFormStates.waiting_for_subcategory)
     
-    await callback.message.delete()
-    await callback.message.answer(
-        f"📋 <b>ВЫБЕРИТЕ ТИП: {service}</b>\n\n"
-        f"{description_text}\n\n"
-        "Выберите подходящий вариант:",
-        reply_markup=create_subcategories_keyboard(service),
-        parse_mode="HTML"
+    await show_screen(
+        callback,
+        SUBCATEGORY_SCREENS[data["service"]],
+        reply_markup=create_subcategories_keyboard(data["service"]),
+        flow="service"
     )
-    await callback.answer()
 
 
-@services_router.callback_query(F.data == "back_to_budget")
+@services_router.callback_query(F.data == "back_to_budget", flags=OWN_ANSWER)
 async def back_to_budget(callback: CallbackQuery, state: FSMContext):
     """Go back to budget selection."""
     data = await state.get_data()
-    service = data["service"]
-    subcategory = data["subcategory"]
+    if await decode_answers(callback, state, data) is None:
+        return
+    await callback.answer()
+    
     await state.set_state(ServiceFormStates.waiting_for_budget)
     
-    await callback.message.delete()
-    await callback.message.answer(
-        f"💰 <b>ВЫБЕРИТЕ БЮДЖЕТ</b>\n\n"
-        f"<b>Услуга:</b> {service}\n"
-        f"<b>Тип:</b> {subcategory}\n\n"
-        "Выберите подходящий бюджет для вашего проекта:",
-        reply_markup=create_budget_keyboard(service),
-        parse_mode="HTML"
+    await show_screen(
+        callback,
+        BUDGET_SCREENS[data["service"]][data["subcategory"]],
+        reply_markup=create_budget_keyboard(data["service"]),
+        flow="service"
     )
-    await callback.answer()
 
 
-@services_router.callback_query(F.data == "back_to_timeline")
+@services_router.callback_query(F.data == "back_to_timeline", flags=OWN_ANSWER)
 async def back_to_timeline(callback: CallbackQuery, state: FSMContext):
     """Go back to timeline selection."""
-    data = await state.get_data()
+    data = await decode_answers(callback, state, await state.get_data())
+    if data is None:
+        return
+    await callback.answer()
+    
     await state.set_state(ServiceFormStates.waiting_for_timeline)
     
-    await callback.message.delete()
-    await callback.message.answer(
+    await show_screen(
+        callback,
         f"⏰ <b>ВЫБЕРИТЕ СРОКИ</b>\n\n"
         f"<b>Бюджет:</b> {data.get('budget', '')}\n\n"
         "В какие сроки нужно выполнить проект?",
         reply_markup=create_timeline_keyboard(),
-        parse_mode="HTML"
+        flow="service"
     )
-    await callback.answer()
 
 
-@services_router.callback_query(F.data == "back_to_content")
+@services_router.callback_query(F.data == "back_to_content", flags=OWN_ANSWER)
 async def back_to_content(callback: CallbackQuery, state: FSMContext):
     """Go back to content selection."""
-    data = await state.get_data()
+    data = await decode_answers(callback, state, await state.get_data())
+    if data is None:
+        return
+    await callback.answer()
+    
     await state.set_state(ServiceFormStates.waiting_for_content)
     
-    await callback.message.delete()
-    await callback.message.answer(
+    await show_screen(
+        callback,
         f"📄 <b>КОНТЕНТ ДЛЯ ПРОЕКТА</b>\n\n"
         f"<b>Сроки:</b> {data.get('timeline', '')}\n\n"
         "У вас есть готовый контент (тексты, фото, видео)?",
         reply_markup=create_content_keyboard(),
-        parse_mode="HTML"
+        flow="service"
     )
-    await callback.answer()
 
 
-@services_router.callback_query(F.data == "back_to_design")
+@services_router.callback_query(F.data == "back_to_design", flags=OWN_ANSWER)
 async def back_to_design(callback: CallbackQuery, state: FSMContext):
     """Go back to design selection."""
-    data = await state.get_data()
+    data = await decode_answers(callback, state, await state.get_data())
+    if data is None:
+        return
+    await callback.answer()
+    
     await state.set_state(ServiceFormStates.waiting_for_design)
     
-    await callback.message.delete()
-    await callback.message.answer(
+    await show_screen(
+        callback,
         f"🎨 <b>ДИЗАЙН ПРОЕКТА</b>\n\n"
         f"<b>Контент:</b> {data.get('has_content', '')}\n\n"
         "У вас есть готовый дизайн-макет?",
         reply_markup=create_design_keyboard(),
-        parse_mode="HTML"
+        flow="service"
     )
-    await callback.answer()
 
 
-@services_router.callback_query(F.data == "back_to_support")
+@services_router.callback_query(F.data == "back_to_support", flags=OWN_ANSWER)
 async def back_to_support(callback: CallbackQuery, state: FSMContext):
     """Go back to support selection."""
-    data = await state.get_data()
+    data = await decode_answers(callback, state, await state.get_data())
+    if data is None:
+        return
+    await callback.answer()
+    
     await state.set_state(ServiceFormStates.waiting_for_support)
     
-    await callback.message.delete()
-    await callback.message.answer(
+    await show_screen(
+        callback,
         f"🛡 <b>УРОВЕНЬ ПОДДЕРЖКИ</b>\n\n"
         f"<b>Дизайн:</b> {data.get('has_design', '')}\n\n"
         "Какой уровень поддержки вам нужен после запуска?",
         reply_markup=create_support_keyboard(),
-        parse_mode="HTML"
+        flow="service"
     )
-    await callback.answer()
 
 
-@services_router.callback_query(F.data == "back_to_options")
+@services_router.callback_query(F.data == "back_to_options", flags=OWN_ANSWER)
 async def back_to_options(callback: CallbackQuery, state: FSMContext):
     """Go back to additional options."""
     data = await state.get_data()
-    service = data["service"]
+    if await decode_answers(callback, state, data) is None:
+        return
+    await callback.answer()
+    
     await state.set_state(ServiceFormStates.waiting_for_additional_options)
     
     current_options = data.get("additional_options", [])
     
-    await callback.message.delete()
-    await callback.message.answer(
-        f"⚙️ <b>ДОПОЛНИТЕЛЬНЫЕ ОПЦИИ</b>\n\n"
-        f"<b>Поддержка:</b> {data.get('support_level', '')}\n\n"
-        f"<b>Выбрано опций:</b> {len(current_options)}\n\n"
-        "Выберите дополнительные опции которые вам нужны.\n"
-        "Можно выбрать несколько вариантов:",
-        reply_markup=create_additional_options_keyboard(service, current_options),
-        parse_mode="HTML"
+    await show_screen(
+        callback,
+        OPTIONS_SCREENS[data["support_level"]],
+        reply_markup=create_additional_options_keyboard(data["service"], current_options),
+        flow="service"
     )
-    await callback.answer()
 
 
 @services_router.callback_query(F.data == "cancel_service")
 async def cancel_service_form(callback: CallbackQuery, state: FSMContext):
     """Cancel service form."""
     await state.clear()
+    await callback.answer("❌ Заявка отменена")
     
     # Всегда удаляем и отправляем новое сообщение с фото
     await callback.message.delete()
-    await callback.message.answer_photo(
-        photo="https://i.ibb.co/3m4bCScL/AB6-FA99-A-E1-CA-4498-9-DE7-2-A64-DA7-B96-E4.png",
-        caption="❌ <b>Заявка отменена</b>\n\n"
-                "Вы можете начать заново в любое время.\n\n"
-                "🎯 <b>Выберите, что вас интересует:</b>",
+    await media_registry.answer_photo(
+        callback.message, MAIN_MENU_PHOTO,
+        caption=SERVICE_CANCELLED_CAPTION,
         reply_markup=get_main_menu(),
         parse_mode="HTML"
-    )
-    await callback.answer("❌ Заявка отменена") 
\ No newline at end of file
+    ) 
\ No newline at end of file
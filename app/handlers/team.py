@@ -10,9 +10,11 @@ from sqlalchemy.orm import Session
 
 from app.models.user import User
 from app.models.application import ApplicationType
-from app.services.application import ApplicationService
+from app.services.application import AsyncApplicationService
 from app.services.notification import NotificationService
+from app.services.media import TEAM_PHOTO, media_registry
 from app.utils.keyboards import get_back_button, get_team_cancel_button, get_main_menu
+from app.utils.fsm_storage import advance_step
 from app.core.logger import get_logger
 
 logger = get_logger(__name__)
@@ -52,16 +54,17 @@ async def join_team_start(
         "<i>Укажите ваше полное имя</i>"
     )
     
+    await callback.answer("🎯 Начинаем заполнение анкеты!")
+    
     # Удаляем предыдущее сообщение и отправляем новое с фото
     await callback.message.delete()
-    await callback.message.answer_photo(
-        photo="https://i.ibb.co/8DfjBpqs/FB6-A8-CA0-C656-4397-AEE1-4989-CC4-FE5-A2.png",
+    await media_registry.answer_photo(
+        callback.message, TEAM_PHOTO,
         caption=team_text,
         reply_markup=get_team_cancel_button(),
         parse_mode="HTML"
     )
     await state.set_state(TeamApplicationForm.waiting_for_name)
-    await callback.answer("🎯 Начинаем заполнение анкеты!")
 
 
 @router.message(TeamApplicationForm.waiting_for_name)
@@ -81,7 +84,7 @@ async def process_team_name(
         )
         return
     
-    await state.update_data(name=name)
+    await advance_step(state, TeamApplicationForm.waiting_for_activity, name=name)
     logger.info(f"User {user.telegram_id} provided name for team: {name}")
     
     activity_text = (
@@ -106,7 +109,6 @@ async def process_team_name(
         reply_markup=get_team_cancel_button(),
         parse_mode="HTML"
     )
-    await state.set_state(TeamApplicationForm.waiting_for_activity)
 
 
 @router.message(TeamApplicationForm.waiting_for_activity)
@@ -126,7 +128,7 @@ async def process_team_activity(
         )
         return
     
-    await state.update_data(activity=activity)
+    await advance_step(state, TeamApplicationForm.waiting_for_experience, activity=activity)
     logger.info(f"User {user.telegram_id} provided activity: {activity}")
     
     experience_text = (
@@ -146,7 +148,6 @@ async def process_team_activity(
         reply_markup=get_team_cancel_button(),
         parse_mode="HTML"
     )
-    await state.set_state(TeamApplicationForm.waiting_for_experience)
 
 
 @router.message(TeamApplicationForm.waiting_for_experience)
@@ -166,7 +167,7 @@ async def process_team_experience(
         )
         return
     
-    await state.update_data(experience=experience)
+    await advance_step(state, TeamApplicationForm.waiting_for_portfolio, experience=experience)
     logger.info(f"User {user.telegram_id} provided experience: {len(experience)} characters")
     
     portfolio_text = (
@@ -190,7 +191,6 @@ async def process_team_experience(
         reply_markup=get_team_cancel_button(),
         parse_mode="HTML"
     )
-    await state.set_state(TeamApplicationForm.waiting_for_portfolio)
 
 
 @router.message(TeamApplicationForm.waiting_for_portfolio)
@@ -216,8 +216,8 @@ async def process_team_portfolio(
     
     try:
         # Create team application
-        app_service = ApplicationService(db)
-        application = app_service.create_team_application(
+        app_service = AsyncApplicationService(db)
+        application = await app_service.create_team_application(
             user=user,
             name=data['name'],
             activity=data['activity'],
@@ -237,7 +237,7 @@ async def process_team_portfolio(
         # Success message
         success_text = (
             "🎉 <b>Анкета успешно отправлена!</b>\n\n"
-            f"📋 <b>Номер заявки:</b> #{application.id}\n"
+            f"📋 <b>Номер заявки:</b> {application.number}\n"
             f"👤 <b>Имя:</b> {data['name']}\n"
             f"💼 <b>Специализация:</b> {data['activity']}\n\n"
             "⏰ <b>Что происходит дальше?</b>\n"
@@ -283,6 +283,7 @@ async def cancel_team_application(
         return
     
     await state.clear()
+    await callback.answer("Анкета отменена")
     logger.info(f"User {user.telegram_id} cancelled team application")
     
     cancel_text = (
@@ -307,5 +308,4 @@ async def cancel_team_application(
             cancel_text,
             reply_markup=get_back_button(),
             parse_mode="HTML"
-        )
-    await callback.answer("Анкета отменена") 
\ No newline at end of file
+        ) 
\ No newline at end of file
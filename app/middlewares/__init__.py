@@ -5,5 +5,9 @@ Middleware for the NOFACE.digital bot.
 from .logging import LoggingMiddleware
 from .database import DatabaseMiddleware
 from .user import UserMiddleware
+from .callback_answer import AnswerOnceMiddleware, CallbackAnswerMiddleware
 
-__all__ = ['LoggingMiddleware', 'DatabaseMiddleware', 'UserMiddleware'] 
\ No newline at end of file
+__all__ = [
+    'LoggingMiddleware', 'DatabaseMiddleware', 'UserMiddleware',
+    'AnswerOnceMiddleware', 'CallbackAnswerMiddleware'
+] 
\ No newline at end of file
@@ -0,0 +1,155 @@
+"""
+Early acknowledgement of callback queries.
+"""
+
+import asyncio
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+from aiogram import BaseMiddleware, Bot
+from aiogram.client.session.middlewares.base import BaseRequestMiddleware, NextRequestMiddlewareType
+from aiogram.dispatcher.flags import get_flag
+from aiogram.exceptions import TelegramAPIError
+from aiogram.methods import AnswerCallbackQuery, TelegramMethod
+from aiogram.types import CallbackQuery
+
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class PendingAnswer:
+    """Answer state of the callback query being handled."""
+    query_id: str
+    answered: bool = False
+
+
+# Callback query handled by the current task (copied into tasks it starts)
+pending_answer: ContextVar[Optional[PendingAnswer]] = ContextVar("pending_answer", default=None)
+
+
+class CallbackAnswerMetrics:
+    """Counters of callback query answers."""
+    
+    def __init__(self):
+        self.early = 0
+        self.by_handler = 0
+        self.late = 0
+        self.suppressed = 0
+
+
+class CallbackAnswerMiddleware(BaseMiddleware):
+    """
+    Acknowledges callback queries so the button spinner stops early.
+    
+    If the handler has not answered the query within ``deadline`` seconds
+    (quick alerts like "no rights" still get through), an empty answer is
+    sent while the handler keeps working; its own later answer() calls are
+    then dropped by AnswerOnceMiddleware. A query still unanswered when the
+    handler returns is answered then.
+    
+    Handlers whose answer can depend on slow work (an alert after reading
+    FSM data or the database) opt out of the early answer with
+    ``flags={"own_answer": True}``: they answer themselves as soon as they
+    know what to show, and only the answer after the handler remains as a
+    fallback.
+    """
+    
+    def __init__(self, deadline: float):
+        self.deadline = deadline
+        self._tasks: Set[asyncio.Task] = set()
+    
+    async def __call__(
+        self,
+        handler: Callable[[Any, Dict[str, Any]], Awaitable[Any]],
+        event: CallbackQuery,
+        data: Dict[str, Any],
+    ) -> Any:
+        """
+        Handle a callback query with an early answer.
+        
+        Args:
+            handler: Next handler
+            event: Callback query
+            data: Handler data
+            
+        Returns:
+            Handler result
+        """
+        pending = PendingAnswer(event.id)
+        token = pending_answer.set(pending)
+        timer = None
+        try:
+            early = not get_flag(data, "own_answer")
+            if early and self.deadline > 0:
+                timer = asyncio.get_running_loop().call_later(
+                    self.deadline, self._start_early_answer, event, pending
+                )
+            elif early:
+                await self._early_answer(event, pending)
+            return await handler(event, data)
+        finally:
+            # Only stops a timer that has not fired; a started answer completes
+            if timer is not None:
+                timer.cancel()
+            pending_answer.reset(token)
+            if await self._answer(event, pending):
+                callback_answer_metrics.late += 1
+    
+    def _start_early_answer(self, event: CallbackQuery, pending: PendingAnswer) -> None:
+        task = asyncio.create_task(self._early_answer(event, pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def _early_answer(self, event: CallbackQuery, pending: PendingAnswer) -> None:
+        if await self._answer(event, pending):
+            callback_answer_metrics.early += 1
+    
+    @staticmethod
+    async def _answer(event: CallbackQuery, pending: PendingAnswer) -> bool:
+        """Send an empty answer unless the query was answered; True if sent."""
+        if pending.answered:
+            return False
+        pending.answered = True
+        
+        # Already marked answered: hide it from AnswerOnceMiddleware to let the request through
+        token = pending_answer.set(None)
+        try:
+            await event.answer()
+        except TelegramAPIError as e:
+            logger.debug(f"Failed to answer callback query {event.id}: {e}")
+        finally:
+            pending_answer.reset(token)
+        return True
+
+
+class AnswerOnceMiddleware(BaseRequestMiddleware):
+    """
+    Drops repeated answers to the callback query being handled.
+    
+    Telegram accepts one answer per query, so once CallbackAnswerMiddleware
+    (or the handler) answered, further answer() calls succeed without a
+    request.
+    """
+    
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType,
+        bot: Bot,
+        method: TelegramMethod,
+    ) -> Any:
+        if isinstance(method, AnswerCallbackQuery):
+            pending = pending_answer.get()
+            if pending is not None and pending.query_id == method.callback_query_id:
+                if pending.answered:
+                    callback_answer_metrics.suppressed += 1
+                    return True
+                pending.answered = True
+                callback_answer_metrics.by_handler += 1
+        return await make_request(bot, method)
+
+
+# Global callback answer metrics instance
+callback_answer_metrics = CallbackAnswerMetrics()
@@ -5,14 +5,28 @@ Database middleware for providing database session.
 from typing import Any, Awaitable, Callable, Dict
 from aiogram import BaseMiddleware
 
-from app.models.base import SessionLocal, get_db
+from app.models.base import SessionLocal, AsyncSessionLocal, LazySession, update_session
+from app.core.config import settings
 from app.core.logger import get_logger
 
 logger = get_logger(__name__)
 
 
 class DatabaseMiddleware(BaseMiddleware):
-    """Middleware for providing database session to handlers."""
+    """
+    Middleware for providing database session to handlers.
+    
+    The session is lazy: it is only opened when a handler or UserMiddleware
+    actually queries, and commit/rollback/close are skipped otherwise.
+    
+    It is also the unit of work of the update: services and the database
+    FSM storage only flush into it, and it is committed here once the
+    handler returns, or rolled back if the handler fails. Two writes are
+    committed early because Telegram calls follow them: a signup, by
+    UserMiddleware before the handler runs, and a submission, before the
+    user is told it was saved (see AsyncApplicationService). Whatever the
+    update writes after that is again committed here.
+    """
     
     async def __call__(
         self,
@@ -31,8 +45,12 @@ class DatabaseMiddleware(BaseMiddleware):
         Returns:
             Handler result
         """
-        # Create database session
-        db = SessionLocal()
+        if settings.database_async:
+            return await self._call_async(handler, event, data)
+        
+        # Create lazy database session
+        db = LazySession(SessionLocal)
+        token = update_session.set(db)
         
         try:
             # Add session to handler data
@@ -41,17 +59,51 @@ class DatabaseMiddleware(BaseMiddleware):
             # Call next handler
             result = await handler(event, data)
             
-            # Commit any pending transactions
-            db.commit()
+            if db.touched and db.in_transaction():
+                db.commit()
             
             return result
             
         except Exception as e:
             # Rollback on error
-            db.rollback()
-            logger.error(f"Database transaction rolled back due to error: {e}")
+            if db.touched:
+                db.rollback()
+                logger.error(f"Database transaction rolled back due to error: {e}")
             raise
             
         finally:
-            # Always close the session
-            db.close() 
\ No newline at end of file
+            update_session.reset(token)
+            # Close the session if it was opened
+            if db.touched:
+                db.close()
+    
+    async def _call_async(
+        self,
+        handler: Callable[[Any, Dict[str, Any]], Awaitable[Any]],
+        event: Any,
+        data: Dict[str, Any],
+    ) -> Any:
+        """Provide an AsyncSession to handler (settings.database_async mode)."""
+        db = LazySession(AsyncSessionLocal)
+        token = update_session.set(db)
+        
+        try:
+            data["db"] = db
+            
+            result = await handler(event, data)
+            
+            if db.touched and db.in_transaction():
+                await db.commit()
+            
+            return result
+        
+        except Exception as e:
+            if db.touched:
+                await db.rollback()
+                logger.error(f"Database transaction rolled back due to error: {e}")
+            raise
+        
+        finally:
+            update_session.reset(token)
+            if db.touched:
+                await db.close()
@@ -5,8 +5,9 @@ User middleware for automatic user creation and management.
 from typing import Any, Awaitable, Callable, Dict
 from aiogram import BaseMiddleware
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.services.user import UserService
+from app.services.user import AsyncUserService
 from app.models.user import User
 from app.core.logger import get_logger
 
@@ -34,7 +35,7 @@ class UserMiddleware(BaseMiddleware):
             Handler result
         """
         # Get database session from previous middleware
-        db: Session = data.get("db")
+        db: Session | AsyncSession = data.get("db")
         if not db:
             logger.error("Database session not found in middleware data")
             return await handler(event, data)
@@ -54,25 +55,32 @@ class UserMiddleware(BaseMiddleware):
         if tg_user.is_bot:
             return await handler(event, data)
         
+        # Create user service and get/create user
+        user_service = AsyncUserService(db)
         try:
-            # Create user service and get/create user
-            user_service = UserService(db)
-            user = user_service.get_or_create_user(tg_user)
-            
-            # Check if user is blocked
-            if user.is_blocked:
-                logger.warning(f"Blocked user {user.telegram_id} attempted to interact")
-                # You can handle blocked users here (e.g., send a message or ignore)
-                return
-            
-            # Add user and user service to handler data
-            data["user"] = user
-            data["user_service"] = user_service
-            
-            # Call next handler
-            return await handler(event, data)
+            user, created = await user_service.get_or_create(tg_user)
             
+            # The only early commit besides submissions: a signup locks the
+            # users rollup rows that every other first contact bumps too, and
+            # holding them across the handler's Bot API calls made concurrent
+            # first contacts time out (tests/test_concurrent_updates.py)
+            if created:
+                await user_service.commit()
         except Exception as e:
             logger.error(f"Error in user middleware: {e}", exc_info=True)
+            await user_service.rollback()
             # Continue without user data on error
-            return await handler(event, data) 
\ No newline at end of file
+            return await handler(event, data)
+        
+        # Check if user is blocked
+        if user.is_blocked:
+            logger.warning(f"Blocked user {user.telegram_id} attempted to interact")
+            # You can handle blocked users here (e.g., send a message or ignore)
+            return
+        
+        # Add user and user service to handler data
+        data["user"] = user
+        data["user_service"] = user_service
+        
+        # Call next handler
+        return await handler(event, data) 
\ No newline at end of file
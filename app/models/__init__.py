@@ -4,5 +4,10 @@ Database models for the NOFACE.digital bot.
 
 from .application import Application, ApplicationType
 from .user import User
+from .stats import StatsDaily, StatsTotal
+from .fsm import FsmRecord
+from .media import MediaFile
 
-__all__ = ['Application', 'ApplicationType', 'User'] 
\ No newline at end of file
+__all__ = [
+    'Application', 'ApplicationType', 'User', 'StatsDaily', 'StatsTotal', 'FsmRecord', 'MediaFile'
+] 
\ No newline at end of file
@@ -3,7 +3,7 @@ Application model for storing user applications.
 """
 
 import enum
-from sqlalchemy import Column, String, Text, ForeignKey, Enum as SqlEnum
+from sqlalchemy import Column, String, Text, ForeignKey, Index, Enum as SqlEnum
 from sqlalchemy.orm import relationship
 
 from .base import Base, TimestampMixin
@@ -27,10 +27,22 @@ class Application(Base, TimestampMixin):
     """Application model for storing user requests."""
     
     __tablename__ = "applications"
+    __table_args__ = (
+        # Admin dashboard: per-type / per-status counts and lists over time ranges
+        Index("ix_applications_type_created_at", "type", "created_at"),
+        Index("ix_applications_status_created_at", "status", "created_at"),
+        # Keyset pagination of the unfiltered list
+        Index("ix_applications_created_at_id", "created_at", "id"),
+        # Deduplicates replays of spooled submissions
+        Index("ux_applications_submission_id", "submission_id", unique=True),
+    )
     
     # Foreign keys
     user_id = Column(ForeignKey("users.id"), nullable=False)
     
+    # Client-generated id of the submission (idempotent spool replays)
+    submission_id = Column(String(32), nullable=True)
+    
     # Application data
     type = Column(SqlEnum(ApplicationType), nullable=False)
     status = Column(SqlEnum(ApplicationStatus), default=ApplicationStatus.NEW)
@@ -64,6 +76,11 @@ class Application(Base, TimestampMixin):
     def __repr__(self):
         return f"<Application(id={self.id}, type={self.type.value}, user_id={self.user_id})>"
     
+    @property
+    def number(self) -> str:
+        """Application number for messages (pending while spooled)."""
+        return f"#{self.id}" if self.id is not None else "в очереди на сохранение"
+    
     @property
     def is_service_application(self) -> bool:
         """Check if this is a service application."""
@@ -77,7 +94,7 @@ class Application(Base, TimestampMixin):
     def to_admin_message(self) -> str:
         """Format application data for admin notification."""
         if self.is_service_application:
-            msg = f"🛠 <b>НОВАЯ ЗАЯВКА НА УСЛУГУ #{self.id}</b>\n\n"
+            msg = f"🛠 <b>НОВАЯ ЗАЯВКА НА УСЛУГУ {self.number}</b>\n\n"
             msg += f"👤 <b>Имя:</b> {self.name}\n"
             msg += f"📱 <b>Контакт:</b> {self.contact}\n"
             msg += f"🎯 <b>Услуга:</b> {self.service}\n"
@@ -104,7 +121,7 @@ class Application(Base, TimestampMixin):
             return msg
         else:
             return (
-                f"👥 <b>НОВАЯ ЗАЯВКА В КОМАНДУ #{self.id}</b>\n\n"
+                f"👥 <b>НОВАЯ ЗАЯВКА В КОМАНДУ {self.number}</b>\n\n"
                 f"👤 <b>Имя:</b> {self.name}\n"
                 f"💼 <b>Деятельность:</b> {self.activity}\n"
                 f"🎯 <b>Опыт:</b>\n{self.experience}\n\n"
@@ -2,27 +2,94 @@
 Base database models and configuration.
 """
 
+import asyncio
+from contextvars import ContextVar
 from datetime import datetime
-from typing import Optional
+from typing import Any, Callable, Optional
 
 from sqlalchemy import create_engine, Column, DateTime, Integer
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.config import settings
+from app.models.pool import PoolMetrics, engine_options, statement_timeout_args
 
 
+# Pool telemetry of the sync and async engines
+engine_pool_metrics = PoolMetrics()
+async_engine_pool_metrics = PoolMetrics()
+
 # Database setup
 engine = create_engine(
     settings.database_url,
     echo=settings.debug,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {}
+    connect_args=(
+        {"check_same_thread": False} if "sqlite" in settings.database_url
+        else statement_timeout_args(settings.database_url)
+    ),
+    # psycopg2: batch executemany UPDATEs (write-behind flushes) into few round trips
+    **({"executemany_mode": "values_plus_batch"}
+       if settings.database_url.startswith(("postgresql://", "postgresql+psycopg2://")) else {}),
+    **engine_options(settings.database_url, engine_pool_metrics)
 )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Committed instances stay usable without a reload SELECT (same as AsyncSessionLocal)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+# Async database setup (used when settings.database_async is enabled)
+async_engine = create_async_engine(
+    settings.async_database_url,
+    echo=settings.debug,
+    connect_args=statement_timeout_args(settings.async_database_url),
+    **engine_options(settings.async_database_url, async_engine_pool_metrics)
+) if settings.database_async else None
+
+# Metrics of the engine that serves handlers
+pool_metrics = async_engine_pool_metrics if settings.database_async else engine_pool_metrics
+
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    autoflush=False,
+    expire_on_commit=False
+) if async_engine is not None else None
+
 Base = declarative_base()
 
 
+class LazySession:
+    """
+    Session proxy that opens the real session on first use.
+    
+    Handlers that never talk to the database don't check out a session
+    at all, so commit/rollback/close can be skipped for them.
+    """
+    
+    def __init__(self, factory: Callable[[], Any]):
+        self._factory = factory
+        self._session = None
+    
+    @property
+    def touched(self) -> bool:
+        """Whether the real session has been opened."""
+        return self._session is not None
+    
+    @property
+    def session(self) -> Any:
+        """Real session, created on first access."""
+        if self._session is None:
+            self._session = self._factory()
+        return self._session
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.session, name)
+
+
+# Session of the update being handled (set by DatabaseMiddleware)
+update_session: ContextVar[Optional[LazySession]] = ContextVar("update_session", default=None)
+
+
 class TimestampMixin:
     """Mixin for adding timestamp fields."""
     
@@ -40,6 +107,83 @@ def get_db():
         db.close()
 
 
+def upsert_insert(db: Session) -> Optional[Callable[..., Any]]:
+    """
+    Get the dialect-specific insert() that supports ON CONFLICT.
+    
+    Args:
+        db: Session the statement will run in
+        
+    Returns:
+        insert() of the bound dialect or None if upserts are not supported
+    """
+    return {
+        "postgresql": postgresql.insert,
+        "sqlite": sqlite.insert
+    }.get(db.get_bind().dialect.name)
+
+
 def create_tables():
     """Create all database tables."""
-    Base.metadata.create_all(bind=engine) 
\ No newline at end of file
+    Base.metadata.create_all(bind=engine)
+
+
+async def run_in_session(fn: Callable[[Session], Any]) -> Any:
+    """
+    Run ``fn(session)`` in its own transaction outside of update handling.
+    
+    Uses the async engine through ``run_sync`` in async mode and a worker
+    thread otherwise, so background writes never block the event loop.
+    
+    Args:
+        fn: Callable receiving a sync Session
+        
+    Returns:
+        Result of ``fn``
+    """
+    if AsyncSessionLocal is not None:
+        async with AsyncSessionLocal() as session:
+            result = await session.run_sync(fn)
+            await session.commit()
+            return result
+    
+    def call() -> Any:
+        with SessionLocal() as session:
+            result = fn(session)
+            session.commit()
+            return result
+    
+    return await asyncio.to_thread(call)
+
+
+async def run_in_update_session(fn: Callable[[Session], Any]) -> Any:
+    """
+    Run ``fn(session)`` in the transaction of the update being handled.
+    
+    Statements made while handling an update then share the update's
+    connection (on SQLite a second connection would wait for the write
+    lock of the update's own unfinished transaction) and are committed or
+    rolled back with the rest of the update by DatabaseMiddleware, so a
+    failing handler leaves nothing half-written. Outside update handling
+    this is run_in_session().
+    
+    Args:
+        fn: Callable receiving a sync Session
+        
+    Returns:
+        Result of ``fn``
+    """
+    db = update_session.get()
+    if db is None:
+        return await run_in_session(fn)
+    
+    session = db.session
+    if isinstance(session, AsyncSession):
+        return await session.run_sync(fn)
+    return fn(session)
+
+
+async def create_tables_async():
+    """Create all database tables through the async engine."""
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all) 
\ No newline at end of file
@@ -0,0 +1,25 @@
+"""
+FSM state model for the database-backed FSM storage.
+"""
+
+from sqlalchemy import Column, DateTime, Index, String, Text
+
+from .base import Base
+
+
+class FsmRecord(Base):
+    """State and data of one FSM context (chat/user pair)."""
+    
+    __tablename__ = "fsm_records"
+    __table_args__ = (
+        # Purging expired conversations
+        Index("ix_fsm_records_expires_at", "expires_at"),
+    )
+    
+    key = Column(String(255), primary_key=True)
+    state = Column(String(255), nullable=True)
+    data = Column(Text, nullable=True)  # JSON
+    expires_at = Column(DateTime, nullable=False)
+    
+    def __repr__(self):
+        return f"<FsmRecord(key={self.key}, state={self.state})>"
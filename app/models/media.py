@@ -0,0 +1,22 @@
+"""
+Telegram file_id cache model.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, String
+
+from .base import Base
+
+
+class MediaFile(Base):
+    """Telegram file_id of a photo first sent by URL."""
+    
+    __tablename__ = "media_files"
+    
+    url = Column(String(512), primary_key=True)
+    file_id = Column(String(255), nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    
+    def __repr__(self):
+        return f"<MediaFile(url={self.url})>"
@@ -0,0 +1,142 @@
+"""
+Connection pool configuration and telemetry.
+"""
+
+import time
+from typing import Any, Dict, Optional, Type
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import Pool, QueuePool
+
+from app.core.config import settings
+
+
+class PoolMetrics:
+    """Checkout counters of an instrumented queue pool."""
+    
+    def __init__(self):
+        self.pool: Optional[Pool] = None
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.peak_in_use = 0
+        self.peak_overflow = 0
+    
+    def record_checkout(self, pool: QueuePool, wait: float) -> None:
+        """
+        Account a successful checkout.
+        
+        Args:
+            pool: Pool the connection came from
+            wait: Seconds spent waiting for the connection
+        """
+        self.pool = pool
+        self.checkouts += 1
+        self.wait_total += wait
+        self.wait_max = max(self.wait_max, wait)
+        self.peak_in_use = max(self.peak_in_use, pool.checkedout())
+        self.peak_overflow = max(self.peak_overflow, pool.overflow())
+    
+    def stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Get pool counters.
+        
+        Returns:
+            Dictionary with pool state and checkout wait times,
+            or None if no connection was checked out yet
+        """
+        if self.pool is None:
+            return None
+        
+        return {
+            "size": self.pool.size(),
+            "max_overflow": self.pool._max_overflow,
+            "in_use": self.pool.checkedout(),
+            "overflow": max(self.pool.overflow(), 0),
+            "peak_in_use": self.peak_in_use,
+            "peak_overflow": max(self.peak_overflow, 0),
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_avg_ms": self.wait_total / self.checkouts * 1000 if self.checkouts else 0.0,
+            "wait_max_ms": self.wait_max * 1000
+        }
+
+
+def instrumented_pool_class(base: Type[QueuePool], metrics: PoolMetrics) -> Type[QueuePool]:
+    """
+    Build a pool class that times every checkout into metrics.
+    
+    The class (not the instance) carries the metrics, so they survive
+    pool recreation on engine.dispose().
+    
+    Args:
+        base: Queue pool class chosen by the dialect
+        metrics: Metrics to record into
+    
+    Returns:
+        Instrumented subclass of base
+    """
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = base._do_get(self)
+        except PoolTimeoutError:
+            metrics.timeouts += 1
+            raise
+        metrics.record_checkout(self, time.perf_counter() - start)
+        return connection
+    
+    return type(f"Instrumented{base.__name__}", (base,), {"_do_get": _do_get})
+
+
+def engine_options(url: str, metrics: PoolMetrics) -> Dict[str, Any]:
+    """
+    Get pool keyword arguments for create_engine()/create_async_engine().
+    
+    Sizing options only apply to queue pools (PostgreSQL, file-based
+    SQLite on the sync driver); other pools keep the dialect defaults.
+    
+    Args:
+        url: Database URL
+        metrics: Metrics the pool should record into
+    
+    Returns:
+        Engine keyword arguments
+    """
+    database_url = make_url(url)
+    pool_class = database_url.get_dialect().get_pool_class(database_url)
+    
+    options: Dict[str, Any] = {
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "pool_recycle": settings.db_pool_recycle
+    }
+    if issubclass(pool_class, QueuePool):
+        options.update(
+            poolclass=instrumented_pool_class(pool_class, metrics),
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout
+        )
+    
+    return options
+
+
+def statement_timeout_args(url: str) -> Dict[str, Any]:
+    """
+    Get connect_args applying settings.db_statement_timeout on PostgreSQL.
+    
+    Args:
+        url: Database URL
+    
+    Returns:
+        Driver connect arguments (empty if not applicable)
+    """
+    timeout = settings.db_statement_timeout
+    if not timeout or not url.startswith("postgresql"):
+        return {}
+    
+    if url.startswith("postgresql+asyncpg://"):
+        return {"server_settings": {"statement_timeout": str(timeout)}}
+    return {"options": f"-c statement_timeout={timeout}"}
@@ -0,0 +1,38 @@
+"""
+Rollup models for dashboard statistics.
+"""
+
+from sqlalchemy import Column, Date, Integer, String
+
+from .base import Base
+
+
+class StatsDaily(Base):
+    """Per-day counters (new users, applications by type/service/status)."""
+    
+    __tablename__ = "stats_daily"
+    
+    day = Column(Date, primary_key=True)
+    metric = Column(String(32), primary_key=True)
+    app_type = Column(String(16), primary_key=True, default="")
+    service = Column(String(500), primary_key=True, default="")
+    status = Column(String(32), primary_key=True, default="")
+    value = Column(Integer, nullable=False, default=0)
+    
+    def __repr__(self):
+        return f"<StatsDaily(day={self.day}, metric={self.metric}, value={self.value})>"
+
+
+class StatsTotal(Base):
+    """Running totals with the same dimensions as StatsDaily."""
+    
+    __tablename__ = "stats_totals"
+    
+    metric = Column(String(32), primary_key=True)
+    app_type = Column(String(16), primary_key=True, default="")
+    service = Column(String(500), primary_key=True, default="")
+    status = Column(String(32), primary_key=True, default="")
+    value = Column(Integer, nullable=False, default=0)
+    
+    def __repr__(self):
+        return f"<StatsTotal(metric={self.metric}, value={self.value})>"
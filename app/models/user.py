@@ -2,7 +2,7 @@
 User model for storing user information.
 """
 
-from sqlalchemy import Column, String, BigInteger, Boolean, DateTime
+from sqlalchemy import Column, String, BigInteger, Boolean, DateTime, Index
 from sqlalchemy.orm import relationship
 
 from .base import Base, TimestampMixin
@@ -12,6 +12,10 @@ class User(Base, TimestampMixin):
     """User model for storing Telegram user data."""
     
     __tablename__ = "users"
+    __table_args__ = (
+        # Admin dashboard: new users per day / week; keyset pagination of the users list
+        Index("ix_users_created_at_id", "created_at", "id"),
+    )
     
     telegram_id = Column(BigInteger, unique=True, nullable=False, index=True)
     username = Column(String(255), nullable=True)
@@ -2,8 +2,14 @@
 Business logic services for the NOFACE.digital bot.
 """
 
-from .user import UserService
-from .application import ApplicationService
+from .user import UserService, AsyncUserService
+from .application import ApplicationService, AsyncApplicationService
+from .statistics import StatisticsService
 from .notification import NotificationService
 
-__all__ = ['UserService', 'ApplicationService', 'NotificationService'] 
\ No newline at end of file
+__all__ = [
+    'UserService', 'AsyncUserService',
+    'ApplicationService', 'AsyncApplicationService',
+    'StatisticsService',
+    'NotificationService'
+] 
\ No newline at end of file
@@ -2,13 +2,22 @@
 Application management service.
 """
 
-from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+import asyncio
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, List, Optional, Dict, Any
+from uuid import uuid4
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, joinedload, load_only
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.models.application import Application, ApplicationType, ApplicationStatus
 from app.models.user import User
+from app.services.application_writer import application_writer
+from app.services.base import AsyncService
+from app.services.statistics import StatisticsService, StatsRollupService
+from app.services.submission_spool import submission_spool
+from app.utils.pagination import OLDER, Cursor, Page, keyset_page
+from app.core.config import settings
 from app.core.logger import get_logger
 
 logger = get_logger(__name__)
@@ -17,9 +26,29 @@ logger = get_logger(__name__)
 class ApplicationService:
     """Service for managing applications."""
     
-    def __init__(self, db: Session | AsyncSession):
+    def __init__(self, db: Session):
         self.db = db
     
+    def _save(self, application: Application, user: User) -> None:
+        """
+        Insert a new application and attach its author without extra queries.
+        
+        The flush is a single ``INSERT ... RETURNING id`` (timestamps are
+        generated client-side) and the already-loaded user is set as the
+        committed value of ``application.user``, so rendering the admin
+        notification never goes back to the database. The commit is left
+        to the caller (AsyncApplicationService commits before the user is
+        told the application was sent).
+        
+        Args:
+            application: New application instance
+            user: Author of the application
+        """
+        self.db.add(application)
+        self.db.flush()
+        StatsRollupService(self.db).add_application(application)
+        set_committed_value(application, "user", user)
+    
     def create_service_application(
         self,
         user: User,
@@ -50,16 +79,14 @@ class ApplicationService:
             description=description
         )
         
-        self.db.add(application)
-        self.db.commit()
-        self.db.refresh(application)
+        self._save(application, user)
         
         logger.info(f"Created service application #{application.id} for user {user.telegram_id}")
         return application
     
     def create_application(
         self,
-        user_id: int,
+        user: User,
         application_type: ApplicationType,
         name: str,
         contact: str,
@@ -74,13 +101,14 @@ class ApplicationService:
         description: Optional[str] = None,
         activity: Optional[str] = None,
         experience: Optional[str] = None,
-        portfolio: Optional[str] = None
+        portfolio: Optional[str] = None,
+        submission_id: Optional[str] = None
     ) -> Application:
         """
-        Create a new detailed application (sync version).
+        Create a new detailed application.
         
         Args:
-            user_id: User ID
+            user: User instance (already loaded, e.g. by UserMiddleware)
             application_type: Type of application
             name: Contact name
             contact: Contact information
@@ -96,12 +124,14 @@ class ApplicationService:
             activity: Professional activity (for team applications)
             experience: Work experience (for team applications)
             portfolio: Portfolio information (for team applications)
+            submission_id: Client-generated submission id
             
         Returns:
             Created application instance
         """
         application = Application(
-            user_id=user_id,
+            user_id=user.id,
+            submission_id=submission_id,
             type=application_type,
             name=name,
             contact=contact,
@@ -119,14 +149,12 @@ class ApplicationService:
             portfolio=portfolio
         )
         
-        self.db.add(application)
-        self.db.commit()
-        self.db.refresh(application)
-        
-        # Принудительно загружаем связанного пользователя для избежания lazy loading проблем
-        _ = application.user  # Это инициирует загрузку
+        self._save(application, user)
         
-        logger.info(f"Created {application_type.value} application #{application.id} for user {user_id}")
+        logger.info(
+            f"Created {application_type.value} application #{application.id} "
+            f"for user {user.telegram_id}"
+        )
         return application
     
     def create_team_application(
@@ -135,7 +163,8 @@ class ApplicationService:
         name: str,
         activity: str,
         experience: str,
-        portfolio: str
+        portfolio: str,
+        submission_id: Optional[str] = None
     ) -> Application:
         """
         Create a new team application.
@@ -146,12 +175,14 @@ class ApplicationService:
             activity: Professional activity
             experience: Work experience
             portfolio: Portfolio information
+            submission_id: Client-generated submission id
             
         Returns:
             Created application instance
         """
         application = Application(
             user_id=user.id,
+            submission_id=submission_id,
             type=ApplicationType.TEAM,
             name=name,
             contact="",  # Team applications don't require separate contact
@@ -160,9 +191,7 @@ class ApplicationService:
             portfolio=portfolio
         )
         
-        self.db.add(application)
-        self.db.commit()
-        self.db.refresh(application)
+        self._save(application, user)
         
         logger.info(f"Created team application #{application.id} for user {user.telegram_id}")
         return application
@@ -177,7 +206,9 @@ class ApplicationService:
         Returns:
             Application instance if found, None otherwise
         """
-        return self.db.query(Application).filter(
+        return self.db.query(Application).options(
+            joinedload(Application.user)
+        ).filter(
             Application.id == application_id
         ).first()
     
@@ -222,7 +253,9 @@ class ApplicationService:
         Returns:
             List of applications
         """
-        query = self.db.query(Application).filter(
+        query = self.db.query(Application).options(
+            joinedload(Application.user)
+        ).filter(
             Application.status == status
         )
         
@@ -259,7 +292,8 @@ class ApplicationService:
         if admin_notes:
             application.admin_notes = admin_notes
         
-        self.db.commit()
+        StatsRollupService(self.db).move_status(application, old_status)
+        self.db.flush()
         
         logger.info(
             f"Updated application #{application.id} status: "
@@ -270,35 +304,19 @@ class ApplicationService:
     
     def get_statistics(self) -> Dict[str, Any]:
         """
-        Get application statistics.
+        Get application statistics (single aggregated query).
         
         Returns:
             Dictionary with statistics
         """
-        total_applications = self.db.query(Application).count()
-        
-        service_applications = self.db.query(Application).filter(
-            Application.type == ApplicationType.SERVICE
-        ).count()
-        
-        team_applications = self.db.query(Application).filter(
-            Application.type == ApplicationType.TEAM
-        ).count()
-        
-        new_applications = self.db.query(Application).filter(
-            Application.status == ApplicationStatus.NEW
-        ).count()
-        
-        completed_applications = self.db.query(Application).filter(
-            Application.status == ApplicationStatus.COMPLETED
-        ).count()
+        counters = StatisticsService(self.db).get_application_counters()
         
         return {
-            "total": total_applications,
-            "service": service_applications,
-            "team": team_applications,
-            "new": new_applications,
-            "completed": completed_applications
+            "total": counters.total,
+            "service": counters.service,
+            "team": counters.team,
+            "new": counters.new,
+            "completed": counters.completed
         }
     
     def get_applications_count(self) -> int:
@@ -308,4 +326,144 @@ class ApplicationService:
         Returns:
             Total number of applications
         """
-        return self.db.query(Application).count() 
\ No newline at end of file
+        return self.db.query(Application).count()
+    
+    def get_applications_page(
+        self,
+        filter_type: str = "all",
+        cursor: Optional[Cursor] = None,
+        direction: str = OLDER,
+        limit: int = 10
+    ) -> Page:
+        """
+        Get one page of the admin applications list (keyset pagination).
+        
+        Args:
+            filter_type: One of "services", "team", "new" or "all"
+            cursor: (created_at, id) to page from, None for the newest page
+            direction: OLDER or NEWER relative to the cursor
+            limit: Page size
+            
+        Returns:
+            Page of applications, newest first
+        """
+        # Only the columns the list renders; no user relationship is touched
+        query = self.db.query(Application).options(load_only(
+            Application.id, Application.created_at, Application.type,
+            Application.name, Application.contact,
+            Application.service, Application.activity
+        ))
+        
+        if filter_type == "services":
+            query = query.filter(Application.type == ApplicationType.SERVICE)
+        elif filter_type == "team":
+            query = query.filter(Application.type == ApplicationType.TEAM)
+        elif filter_type == "new":
+            # Новые за последние 24 часа
+            query = query.filter(Application.created_at >= datetime.now() - timedelta(days=1))
+        
+        return keyset_page(query, Application, cursor, direction, limit)
+
+
+class AsyncApplicationService(AsyncService):
+    """Async variant of ApplicationService for handlers."""
+    
+    service_class = ApplicationService
+    
+    async def create_application(
+        self,
+        user: User,
+        application_type: ApplicationType,
+        **kwargs: Any
+    ) -> Application:
+        """Create a new detailed application (batched by application_writer when it runs)."""
+        kwargs["submission_id"] = uuid4().hex
+        
+        async def write() -> Application:
+            if application_writer.running:
+                return await application_writer.submit(user, type=application_type, **kwargs)
+            return await self._run("create_application", user, application_type, **kwargs)
+        
+        return await self._write_or_spool(user, {"type": application_type, **kwargs}, write)
+    
+    async def create_team_application(self, user: User, **kwargs: Any) -> Application:
+        """Create a new team application (batched by application_writer when it runs)."""
+        kwargs["submission_id"] = uuid4().hex
+        fields = {"type": ApplicationType.TEAM, "contact": "", **kwargs}
+        
+        async def write() -> Application:
+            if application_writer.running:
+                return await application_writer.submit(user, **fields)
+            return await self._run("create_team_application", user, **kwargs)
+        
+        return await self._write_or_spool(user, fields, write)
+    
+    async def _write_or_spool(
+        self,
+        user: User,
+        fields: Dict[str, Any],
+        write: Callable[[], Awaitable[Application]]
+    ) -> Application:
+        """
+        Run and commit a write, falling back to submission_spool if the database fails.
+        
+        The update's unit of work is committed here, before the user is
+        told the application was sent. Connection errors, lock, pool and
+        statement timeouts and constraint violations on commit all surface
+        as SQLAlchemyError / OSError, and a write still running after
+        settings.submission_write_timeout is cancelled, so the completed
+        form is never lost.
+        
+        Args:
+            user: Author of the application
+            fields: Application column values including submission_id
+            write: Coroutine factory doing the database write
+            
+        Returns:
+            Saved application, or an unsaved one (id is None) if it was spooled
+        """
+        async def write_and_commit() -> Application:
+            application = await write()
+            await self.commit()
+            return application
+        
+        try:
+            return await asyncio.wait_for(write_and_commit(), settings.submission_write_timeout)
+        except (SQLAlchemyError, OSError, asyncio.TimeoutError) as e:
+            logger.error(f"Failed to save submission {fields['submission_id']}: {e!r}")
+            try:
+                await self.rollback()
+            except Exception as rollback_error:
+                logger.error(f"Rollback after failed submission failed: {rollback_error}")
+            return await submission_spool.capture(user, fields)
+    
+    async def get_application_by_id(self, application_id: int) -> Optional[Application]:
+        """Get application by ID."""
+        return await self._run("get_application_by_id", application_id)
+    
+    async def update_application_status(
+        self,
+        application: Application,
+        status: ApplicationStatus,
+        admin_notes: Optional[str] = None
+    ) -> Application:
+        """Update application status."""
+        return await self._run("update_application_status", application, status, admin_notes)
+    
+    async def get_statistics(self) -> Dict[str, Any]:
+        """Get application statistics."""
+        return await self._run("get_statistics")
+    
+    async def get_applications_count(self) -> int:
+        """Get total applications count."""
+        return await self._run("get_applications_count")
+    
+    async def get_applications_page(
+        self,
+        filter_type: str = "all",
+        cursor: Optional[Cursor] = None,
+        direction: str = OLDER,
+        limit: int = 10
+    ) -> Page:
+        """Get one page of the admin applications list."""
+        return await self._run("get_applications_page", filter_type, cursor, direction, limit)
\ No newline at end of file
@@ -0,0 +1,154 @@
+"""
+Batched background writer for application inserts.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.models.application import Application
+from app.models.base import run_in_session
+from app.models.user import User
+from app.services.statistics import StatsRollupService
+from app.core.config import settings
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Queued submission: (author, Application column values, future of the inserted row)
+Submission = Tuple[User, Dict[str, Any], asyncio.Future]
+
+
+class ApplicationWriter:
+    """
+    Ingestion queue that inserts submitted applications in batches.
+    
+    A batch is written when it reaches ``batch_size`` or ``delay`` seconds
+    after its first submission, as one bulk ``INSERT ... RETURNING`` and one
+    commit. The queue is bounded: when it is full, submitters wait.
+    """
+    
+    def __init__(self, batch_size: int, delay: float, max_queue: int):
+        self.batch_size = batch_size
+        self.delay = delay
+        self.batches = 0
+        self.rows_written = 0
+        self.max_depth = 0
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self._task: Optional[asyncio.Task] = None
+    
+    @property
+    def running(self) -> bool:
+        """Whether submissions are accepted."""
+        return self._task is not None
+    
+    @property
+    def depth(self) -> int:
+        """Number of submissions waiting to be written."""
+        return self._queue.qsize()
+    
+    async def submit(self, user: User, **fields: Any) -> Application:
+        """
+        Queue an application and wait until its batch is committed.
+        
+        The submitter waits for the commit rather than being acknowledged
+        from the queue so that the confirmation and the admin notification
+        carry the application number. A lone submission pays up to
+        ``delay`` extra; with concurrent submitters one commit per batch
+        more than makes up for it (scripts/bench_application_writer.py).
+        
+        Args:
+            user: Author of the application
+            **fields: Application column values (type, name, contact, ...)
+        
+        Returns:
+            Inserted application with ``user`` loaded
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((user, {"user_id": user.id, **fields}, future))
+        self.max_depth = max(self.max_depth, self._queue.qsize())
+        return await future
+    
+    def start(self) -> None:
+        """Start the batching loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        """Stop accepting submissions and write what is queued."""
+        if self._task is not None:
+            task, self._task = self._task, None
+            await self._queue.put(None)
+            await task
+    
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            first = await self._queue.get()
+            if first is None:
+                return
+            
+            batch = [first]
+            deadline = loop.time() + self.delay
+            stopping = False
+            
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            
+            await self._write(batch)
+            if stopping:
+                return
+    
+    async def _write(self, batch: List[Submission]) -> None:
+        """Insert a batch and resolve the futures of its submitters."""
+        rows = [fields for _, fields, _ in batch]
+        
+        def write(session: Session) -> List[Application]:
+            applications = session.scalars(
+                insert(Application).returning(Application, sort_by_parameter_order=True),
+                rows
+            ).all()
+            rollup = StatsRollupService(session)
+            for application in applications:
+                rollup.add_application(application)
+            return applications
+        
+        try:
+            applications = await run_in_session(write)
+        except Exception as e:
+            logger.error(f"Failed to write {len(batch)} applications: {e}")
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        self.batches += 1
+        self.rows_written += len(applications)
+        logger.info(f"Wrote batch of {len(applications)} applications")
+        
+        for (user, _, future), application in zip(batch, applications):
+            set_committed_value(application, "user", user)
+            if not future.done():
+                future.set_result(application)
+
+
+# Global application writer instance (started only with settings.application_batching)
+application_writer = ApplicationWriter(
+    batch_size=settings.application_batch_size,
+    delay=settings.application_batch_delay,
+    max_queue=settings.application_queue_size
+)
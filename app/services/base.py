@@ -0,0 +1,73 @@
+"""
+Shared helpers for business logic services.
+"""
+
+from typing import Any, Type
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.base import LazySession
+
+
+class AsyncService:
+    """
+    Awaitable facade over a synchronous service.
+    
+    With an ``AsyncSession`` every call is executed through
+    ``AsyncSession.run_sync`` on the async engine, so queries never block
+    the event loop. With a regular ``Session`` the sync service is called
+    directly, which keeps handlers identical in both database modes.
+    """
+    
+    service_class: Type[Any]
+    
+    def __init__(self, db: Session | AsyncSession | LazySession):
+        self.db = db
+    
+    async def _run(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        """
+        Call a method of the wrapped sync service.
+        
+        Args:
+            method: Sync service method name
+            *args: Positional arguments for the method
+            **kwargs: Keyword arguments for the method
+        
+        Returns:
+            Method result
+        """
+        def call(session: Session) -> Any:
+            return getattr(self.service_class(session), method)(*args, **kwargs)
+        
+        db = self.db.session if isinstance(self.db, LazySession) else self.db
+        if isinstance(db, AsyncSession):
+            return await db.run_sync(call)
+        return call(db)
+    
+    async def commit(self) -> None:
+        """
+        Commit the update's unit of work now.
+        
+        Called once the update's writes are done and before the handler
+        talks to Telegram, so the SQLite write lock and PostgreSQL row locks
+        (e.g. on the stats rollups) are not held across Bot API calls.
+        DatabaseMiddleware then only commits what is written afterwards.
+        """
+        if isinstance(self.db, LazySession) and not self.db.touched:
+            return
+        
+        db = self.db.session if isinstance(self.db, LazySession) else self.db
+        if not db.in_transaction():
+            return
+        if isinstance(db, AsyncSession):
+            await db.commit()
+        else:
+            db.commit()
+    
+    async def rollback(self) -> None:
+        """Roll back the update's session after a failed write."""
+        db = self.db.session if isinstance(self.db, LazySession) else self.db
+        if isinstance(db, AsyncSession):
+            await db.rollback()
+        else:
+            db.rollback()
@@ -0,0 +1,174 @@
+"""
+Telegram file_id cache for recurring photos.
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, Optional, Set
+
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.types import InlineKeyboardMarkup, InputMediaPhoto, Message
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.base import run_in_session, upsert_insert
+from app.models.media import MediaFile
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Recurring photos
+MAIN_MENU_PHOTO = "https://i.ibb.co/3m4bCScL/AB6-FA99-A-E1-CA-4498-9-DE7-2-A64-DA7-B96-E4.png"
+SERVICES_PHOTO = "https://i.ibb.co/kfTJqZx/B5-C581-C7-51-E9-4-BEF-B66-B-0615-B766-C386.png"
+TEAM_PHOTO = "https://i.ibb.co/8DfjBpqs/FB6-A8-CA0-C656-4397-AEE1-4989-CC4-FE5-A2.png"
+
+
+def is_file_error(error: TelegramBadRequest) -> bool:
+    """Check if Telegram rejected the file (unknown or foreign file_id) rather than the request."""
+    return "file" in error.message.lower()
+
+
+class MediaRegistry:
+    """
+    Sends photos by Telegram file_id instead of URL once they were uploaded.
+    
+    The first send of a URL makes Telegram fetch the image; the file_id of
+    the sent photo is kept in memory and in the media_files table, so later
+    sends (and restarts) reuse it. A rejected file_id is dropped and the
+    photo is sent by URL again, which records a fresh one.
+    
+    New file_ids are stored in the background, so a send never waits for
+    the database (e.g. for the write lock of the update that sent it).
+    """
+    
+    def __init__(self):
+        self.hits = 0
+        self.uploads = 0
+        self.rejected = 0
+        self._file_ids: Dict[str, str] = {}
+        self._tasks: Set[asyncio.Task] = set()
+    
+    @property
+    def size(self) -> int:
+        """Number of photos with a known file_id."""
+        return len(self._file_ids)
+    
+    async def load(self) -> None:
+        """Load stored file_ids."""
+        rows = await run_in_session(
+            lambda session: session.execute(select(MediaFile.url, MediaFile.file_id)).all()
+        )
+        self._file_ids = {url: file_id for url, file_id in rows}
+        logger.info(f"Loaded {len(self._file_ids)} cached media file ids")
+    
+    async def stop(self) -> None:
+        """Wait until file_ids being stored are written."""
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+    
+    async def answer_photo(self, message: Message, url: str, **kwargs: Any) -> Message:
+        """
+        Answer a message with a photo.
+        
+        Args:
+            message: Message to answer in the chat of
+            url: Photo URL (registry key)
+            **kwargs: Other Message.answer_photo() arguments
+        
+        Returns:
+            Sent message
+        """
+        file_id = self._file_ids.get(url)
+        if file_id is not None:
+            try:
+                sent = await message.answer_photo(photo=file_id, **kwargs)
+                self.hits += 1
+                return sent
+            except TelegramBadRequest as e:
+                if not is_file_error(e):
+                    raise
+                self._reject(url, e)
+        
+        sent = await message.answer_photo(photo=url, **kwargs)
+        self.uploads += 1
+        if sent.photo:
+            self._remember(url, sent.photo[-1].file_id)
+        return sent
+    
+    async def edit_photo(
+        self,
+        message: Message,
+        url: str,
+        caption: str,
+        reply_markup: Optional[InlineKeyboardMarkup] = None,
+        parse_mode: Optional[str] = None
+    ) -> Message:
+        """
+        Replace the photo and caption of a photo message.
+        
+        Args:
+            message: Photo message sent by the bot
+            url: Photo URL (registry key)
+            caption: New caption
+            reply_markup: New inline keyboard
+            parse_mode: Caption parse mode
+            
+        Returns:
+            Edited message
+        """
+        file_id = self._file_ids.get(url)
+        if file_id is not None:
+            try:
+                edited = await message.edit_media(
+                    InputMediaPhoto(media=file_id, caption=caption, parse_mode=parse_mode),
+                    reply_markup=reply_markup
+                )
+                self.hits += 1
+                return edited
+            except TelegramBadRequest as e:
+                if not is_file_error(e):
+                    raise
+                self._reject(url, e)
+        
+        edited = await message.edit_media(
+            InputMediaPhoto(media=url, caption=caption, parse_mode=parse_mode),
+            reply_markup=reply_markup
+        )
+        self.uploads += 1
+        if isinstance(edited, Message) and edited.photo:
+            self._remember(url, edited.photo[-1].file_id)
+        return edited
+    
+    def _reject(self, url: str, error: TelegramBadRequest) -> None:
+        self.rejected += 1
+        self._file_ids.pop(url, None)
+        logger.warning(f"Cached file id for {url} rejected, sending by URL: {error}")
+    
+    def _remember(self, url: str, file_id: str) -> None:
+        self._file_ids[url] = file_id
+        task = asyncio.create_task(self._store(url, file_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def _store(self, url: str, file_id: str) -> None:
+        def write(session: Session) -> None:
+            now = datetime.utcnow()
+            insert = upsert_insert(session)
+            if insert is None:
+                session.merge(MediaFile(url=url, file_id=file_id, updated_at=now))
+                return
+            stmt = insert(MediaFile).values(url=url, file_id=file_id, updated_at=now)
+            session.execute(stmt.on_conflict_do_update(
+                index_elements=[MediaFile.url],
+                set_={"file_id": stmt.excluded.file_id, "updated_at": stmt.excluded.updated_at}
+            ))
+        
+        try:
+            await run_in_session(write)
+        except Exception as e:
+            # The in-memory id still saves uploads until the next restart
+            logger.warning(f"Failed to store file id for {url}: {e}")
+
+
+# Global media registry instance
+media_registry = MediaRegistry()
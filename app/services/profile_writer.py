@@ -0,0 +1,120 @@
+"""
+Write-behind buffer for Telegram profile updates.
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy import bindparam, update
+
+from app.models.base import run_in_session
+from app.models.user import User
+from app.core.config import settings
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+PROFILE_FIELDS = ("username", "first_name", "last_name", "language_code", "is_premium")
+
+
+class ProfileWriter:
+    """
+    Coalesces profile changes in memory and flushes them in bulk.
+    
+    Every flush is a single executemany UPDATE keyed by primary key, so
+    user-facing latency never includes a profile write.
+    """
+    
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.flushes = 0
+        self.rows_written = 0
+        self._pending: Dict[int, Dict[str, Any]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._stopping: Optional[asyncio.Event] = None
+    
+    @property
+    def pending(self) -> int:
+        """Number of users waiting to be flushed."""
+        return len(self._pending)
+    
+    def queue(self, user_id: int, profile: Dict[str, Any]) -> None:
+        """
+        Buffer the latest profile of a user.
+        
+        Args:
+            user_id: User primary key
+            profile: Profile fields (see PROFILE_FIELDS)
+        """
+        self._pending[user_id] = profile
+    
+    async def flush(self) -> int:
+        """
+        Write all buffered profiles.
+        
+        Returns:
+            Number of rows written
+        """
+        if not self._pending:
+            return 0
+        
+        batch, self._pending = self._pending, {}
+        now = datetime.utcnow()
+        rows = [
+            {
+                "b_id": user_id,
+                "b_updated_at": now,
+                **{f"b_{field}": profile[field] for field in PROFILE_FIELDS}
+            }
+            for user_id, profile in batch.items()
+        ]
+        stmt = (
+            update(User.__table__)
+            .where(User.__table__.c.id == bindparam("b_id"))
+            .values(
+                updated_at=bindparam("b_updated_at"),
+                **{field: bindparam(f"b_{field}") for field in PROFILE_FIELDS}
+            )
+        )
+        
+        try:
+            await run_in_session(lambda session: session.execute(stmt, rows))
+        except Exception as e:
+            # Keep the batch for the next attempt unless a newer profile arrived
+            for user_id, profile in batch.items():
+                self._pending.setdefault(user_id, profile)
+            logger.error(f"Failed to flush {len(rows)} profile updates: {e}")
+            return 0
+        
+        self.flushes += 1
+        self.rows_written += len(rows)
+        logger.info(f"Flushed {len(rows)} profile updates")
+        return len(rows)
+    
+    def start(self) -> None:
+        """Start periodic flushing."""
+        if self._task is None:
+            self._stopping = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        """Stop periodic flushing and write what is left."""
+        if self._task is not None:
+            # Not cancelled: a flush in progress would lose its batch
+            task, self._task = self._task, None
+            self._stopping.set()
+            await task
+        await self.flush()
+    
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._stopping.wait(), self.interval)
+                return
+            except asyncio.TimeoutError:
+                await self.flush()
+
+
+# Global profile writer instance
+profile_writer = ProfileWriter(interval=settings.profile_flush_interval)
@@ -0,0 +1,381 @@
+"""
+Aggregated statistics for the admin dashboard.
+
+Counters are kept in the stats_daily / stats_totals rollup tables, which
+StatsRollupService updates in the same transaction as the rows they count.
+The dashboard then reads O(days) rollup rows instead of counting whole
+tables.
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import delete, event, func, insert
+from sqlalchemy.orm import Session
+
+from app.models.application import Application, ApplicationType, ApplicationStatus
+from app.models.base import run_in_session, upsert_insert
+from app.models.stats import StatsDaily, StatsTotal
+from app.models.user import User
+from app.utils.cache import SingleFlightCache
+from app.core.config import settings
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Dashboard snapshots shared by all admins, dropped whenever counters change
+dashboard_cache = SingleFlightCache(ttl=settings.dashboard_cache_ttl)
+
+# Popular services included in every snapshot
+DASHBOARD_POPULAR_SERVICES = 3
+
+# Session.info flag: the transaction touched the rollups
+STATS_CHANGED = "stats_changed"
+
+METRIC_USERS = "users"
+METRIC_APPLICATIONS = "applications"
+
+# Rollup dimensions without the day
+DIMENSIONS = ("metric", "app_type", "service", "status")
+
+
+@dataclass(frozen=True)
+class UserCounters:
+    """User counters."""
+    
+    total: int
+    today: int
+    week: int
+
+
+@dataclass(frozen=True)
+class ApplicationCounters:
+    """Application counters."""
+    
+    total: int
+    service: int
+    team: int
+    new: int
+    completed: int
+    today: int
+
+
+@dataclass(frozen=True)
+class DashboardStatistics:
+    """Everything the admin dashboard renders."""
+    
+    users: UserCounters
+    applications: ApplicationCounters
+    popular_services: List[Tuple[str, int]] = field(default_factory=list)
+    generated_at: datetime = field(default_factory=datetime.now)
+
+
+def application_dimensions(application: Application) -> Dict[str, str]:
+    """
+    Get rollup dimensions of an application.
+    
+    Args:
+        application: Flushed application instance
+    
+    Returns:
+        Dictionary with metric, app_type, service and status
+    """
+    return {
+        "metric": METRIC_APPLICATIONS,
+        "app_type": application.type.value,
+        "service": application.service or "",
+        "status": application.status.value if application.status else ""
+    }
+
+
+def _as_date(day: object) -> date:
+    """Normalise func.date() results (SQLite returns strings)."""
+    return day if isinstance(day, date) else date.fromisoformat(str(day))
+
+
+class StatsRollupService:
+    """Service maintaining the stats_daily / stats_totals rollups."""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def add_user(self, user: User) -> None:
+        """
+        Count a new user (call before the transaction is committed).
+        
+        Args:
+            user: Flushed user instance
+        """
+        self._bump(user.created_at.date(), {"metric": METRIC_USERS}, 1)
+    
+    def add_application(self, application: Application) -> None:
+        """
+        Count a new application (call before the transaction is committed).
+        
+        Args:
+            application: Flushed application instance
+        """
+        self._bump(application.created_at.date(), application_dimensions(application), 1)
+    
+    def move_status(self, application: Application, old_status: ApplicationStatus) -> None:
+        """
+        Move an application between status buckets of its creation day.
+        
+        Args:
+            application: Application with the new status already set
+            old_status: Previous status
+        """
+        if application.status == old_status:
+            return
+        
+        day = application.created_at.date()
+        new_keys = application_dimensions(application)
+        old_keys = {**new_keys, "status": old_status.value if old_status else ""}
+        self._bump(day, old_keys, -1)
+        self._bump(day, new_keys, 1)
+    
+    def rebuild(self) -> Tuple[int, int]:
+        """
+        Recompute both rollups from the users and applications tables.
+        
+        Returns:
+            Number of (stats_daily, stats_totals) rows written
+        """
+        daily: Counter = Counter()
+        
+        user_days = self.db.query(
+            func.date(User.created_at),
+            func.count(User.id)
+        ).group_by(func.date(User.created_at)).all()
+        for day, count in user_days:
+            daily[(_as_date(day), METRIC_USERS, "", "", "")] += count
+        
+        application_groups = self.db.query(
+            func.date(Application.created_at),
+            Application.type,
+            Application.service,
+            Application.status,
+            func.count(Application.id)
+        ).group_by(
+            func.date(Application.created_at),
+            Application.type,
+            Application.service,
+            Application.status
+        ).all()
+        for day, app_type, service, status, count in application_groups:
+            daily[(
+                _as_date(day), METRIC_APPLICATIONS, app_type.value,
+                service or "", status.value if status else ""
+            )] += count
+        
+        totals: Counter = Counter()
+        for (day, *keys), count in daily.items():
+            totals[tuple(keys)] += count
+        
+        self.db.execute(delete(StatsDaily))
+        self.db.execute(delete(StatsTotal))
+        self.db.info[STATS_CHANGED] = True
+        if daily:
+            self.db.execute(insert(StatsDaily), [
+                {"day": key[0], **dict(zip(DIMENSIONS, key[1:])), "value": count}
+                for key, count in daily.items()
+            ])
+        if totals:
+            self.db.execute(insert(StatsTotal), [
+                {**dict(zip(DIMENSIONS, key)), "value": count}
+                for key, count in totals.items()
+            ])
+        
+        logger.info(f"Rebuilt stats rollups: {len(daily)} daily rows, {len(totals)} totals")
+        return len(daily), len(totals)
+    
+    def _bump(self, day: date, keys: Dict[str, str], delta: int) -> None:
+        """Add delta to the daily and total counters of keys."""
+        keys = {"app_type": "", "service": "", "status": "", **keys}
+        self._upsert(StatsDaily, {"day": day, **keys}, delta)
+        self._upsert(StatsTotal, keys, delta)
+        self.db.info[STATS_CHANGED] = True
+    
+    def _upsert(self, model: type, keys: Dict[str, object], delta: int) -> None:
+        insert_ = upsert_insert(self.db)
+        
+        if insert_ is None:
+            row = self.db.get(model, keys)
+            if row is None:
+                self.db.add(model(**keys, value=delta))
+            else:
+                row.value += delta
+            self.db.flush()
+            return
+        
+        stmt = insert_(model).values(**keys, value=delta)
+        self.db.execute(stmt.on_conflict_do_update(
+            index_elements=list(keys),
+            set_={"value": model.value + stmt.excluded.value}
+        ))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_dashboard(session: Session) -> None:
+    """Drop dashboard snapshots once rollup changes are committed."""
+    if session.info.pop(STATS_CHANGED, False):
+        dashboard_cache.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_stats_changes(session: Session) -> None:
+    session.info.pop(STATS_CHANGED, None)
+
+
+class StatisticsService:
+    """
+    Service for dashboard statistics.
+    
+    Reads the rollups: one query for running totals and one for the
+    last days, no matter how large users and applications grow.
+    """
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def get_user_counters(self, now: Optional[datetime] = None) -> UserCounters:
+        """
+        Get user counters.
+        
+        Args:
+            now: Reference time (defaults to current local time)
+        
+        Returns:
+            User counters
+        """
+        today = (now or datetime.now()).date()
+        return self._user_counters(self._load_totals(), self._load_recent_days(today), today)
+    
+    def get_application_counters(self, now: Optional[datetime] = None) -> ApplicationCounters:
+        """
+        Get application counters.
+        
+        Args:
+            now: Reference time (defaults to current local time)
+        
+        Returns:
+            Application counters
+        """
+        today = (now or datetime.now()).date()
+        return self._application_counters(
+            self._load_totals(), self._load_recent_days(today), today
+        )
+    
+    def get_popular_services(self, limit: int = 3) -> List[Tuple[str, int]]:
+        """
+        Get most requested services.
+        
+        Args:
+            limit: Maximum number of services
+        
+        Returns:
+            List of (service, applications count) pairs
+        """
+        return self._popular_services(self._load_totals(), limit)
+    
+    def get_dashboard(self, popular_limit: int = 0) -> DashboardStatistics:
+        """
+        Get dashboard statistics.
+        
+        Args:
+            popular_limit: Number of popular services to include
+        
+        Returns:
+            Dashboard statistics
+        """
+        now = datetime.now()
+        today = now.date()
+        totals = self._load_totals()
+        recent = self._load_recent_days(today)
+        
+        return DashboardStatistics(
+            users=self._user_counters(totals, recent, today),
+            applications=self._application_counters(totals, recent, today),
+            popular_services=self._popular_services(totals, popular_limit) if popular_limit else [],
+            generated_at=now
+        )
+    
+    def _load_totals(self) -> List[StatsTotal]:
+        return self.db.query(StatsTotal).all()
+    
+    def _load_recent_days(self, today: date) -> List[Tuple[date, str, int]]:
+        """(day, metric, value) for the last week including today."""
+        return self.db.query(
+            StatsDaily.day,
+            StatsDaily.metric,
+            func.sum(StatsDaily.value)
+        ).filter(
+            StatsDaily.day >= today - timedelta(days=7)
+        ).group_by(StatsDaily.day, StatsDaily.metric).all()
+    
+    @staticmethod
+    def _user_counters(
+        totals: List[StatsTotal],
+        recent: List[Tuple[date, str, int]],
+        today: date
+    ) -> UserCounters:
+        return UserCounters(
+            total=sum(row.value for row in totals if row.metric == METRIC_USERS),
+            today=sum(value for day, metric, value in recent
+                      if metric == METRIC_USERS and day == today),
+            week=sum(value for day, metric, value in recent if metric == METRIC_USERS)
+        )
+    
+    @staticmethod
+    def _application_counters(
+        totals: List[StatsTotal],
+        recent: List[Tuple[date, str, int]],
+        today: date
+    ) -> ApplicationCounters:
+        applications = [row for row in totals if row.metric == METRIC_APPLICATIONS]
+        
+        def count(**match: str) -> int:
+            return sum(
+                row.value for row in applications
+                if all(getattr(row, key) == value for key, value in match.items())
+            )
+        
+        return ApplicationCounters(
+            total=count(),
+            service=count(app_type=ApplicationType.SERVICE.value),
+            team=count(app_type=ApplicationType.TEAM.value),
+            new=count(status=ApplicationStatus.NEW.value),
+            completed=count(status=ApplicationStatus.COMPLETED.value),
+            today=sum(value for day, metric, value in recent
+                      if metric == METRIC_APPLICATIONS and day == today)
+        )
+    
+    @staticmethod
+    def _popular_services(totals: List[StatsTotal], limit: int) -> List[Tuple[str, int]]:
+        services: Counter = Counter()
+        for row in totals:
+            if (row.metric == METRIC_APPLICATIONS and row.service
+                    and row.app_type == ApplicationType.SERVICE.value):
+                services[row.service] += row.value
+        
+        return [(service, count) for service, count in services.most_common(limit) if count > 0]
+
+
+async def get_dashboard_snapshot() -> DashboardStatistics:
+    """
+    Get dashboard statistics through dashboard_cache.
+    
+    The snapshot is computed in its own session, so concurrent admins
+    waiting for the same computation don't depend on each other's
+    update handling.
+    
+    Returns:
+        Dashboard statistics (generated_at tells how fresh they are)
+    """
+    return await dashboard_cache.get_or_compute(
+        "dashboard",
+        lambda: run_in_session(
+            lambda session: StatisticsService(session).get_dashboard(DASHBOARD_POPULAR_SERVICES)
+        )
+    )
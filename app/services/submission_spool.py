@@ -0,0 +1,267 @@
+"""
+Durable local spool for application submissions during database outages.
+"""
+
+import asyncio
+import json
+import os
+import struct
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.models.application import Application, ApplicationType
+from app.models.base import run_in_session
+from app.models.user import User
+from app.services.statistics import StatsRollupService
+from app.core.config import settings
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Record header: payload length, big-endian uint32
+HEADER = struct.Struct(">I")
+
+
+def read_records(path: str) -> Tuple[List[bytes], bytes]:
+    """
+    Read length-prefixed records from a spool file.
+    
+    Args:
+        path: Spool file path
+    
+    Returns:
+        (record payloads in append order, trailing bytes that do not form a
+        whole record: a torn append or a corrupt length prefix)
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    
+    payloads = []
+    offset = 0
+    while offset + HEADER.size <= len(data):
+        (length,) = HEADER.unpack_from(data, offset)
+        start = offset + HEADER.size
+        if start + length > len(data):
+            break
+        payloads.append(data[start:start + length])
+        offset = start + length
+    return payloads, data[offset:]
+
+
+def parse_record(payload: bytes) -> Dict[str, Any]:
+    """
+    Decode a spooled submission into an applications row.
+    
+    Raises:
+        ValueError, KeyError, TypeError: If the payload is not a valid record
+    """
+    record = json.loads(payload)
+    created_at = datetime.fromisoformat(record["created_at"])
+    return {
+        **record["fields"],
+        "type": ApplicationType(record["fields"]["type"]),
+        "user_id": record["user_id"],
+        "created_at": created_at,
+        "updated_at": created_at
+    }
+
+
+class SubmissionSpool:
+    """
+    Append-only file of submissions that could not be written to the database.
+    
+    Every record is fsync'd before the user is told the application was
+    accepted. A background task moves the spool aside, inserts its records
+    (skipping submission ids that already made it to the database) and
+    deletes it once the insert is committed. Records that cannot be decoded
+    are moved to a quarantine file (``<path>.bad``) for manual recovery
+    instead of blocking every later replay.
+    """
+    
+    def __init__(self, path: str, interval: float):
+        self.path = path
+        self.replay_path = f"{path}.replay"
+        self.quarantine_path = f"{path}.bad"
+        self.interval = interval
+        self.captured = 0
+        self.replayed = 0
+        self.duplicates = 0
+        self.quarantined = 0
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+    
+    @property
+    def pending_bytes(self) -> int:
+        """Size of spooled data waiting for replay."""
+        return sum(
+            os.path.getsize(path)
+            for path in (self.path, self.replay_path)
+            if os.path.exists(path)
+        )
+    
+    async def capture(self, user: User, fields: Dict[str, Any]) -> Application:
+        """
+        Durably spool a submission.
+        
+        Args:
+            user: Author of the application
+            fields: Application column values including submission_id
+        
+        Returns:
+            Unsaved application (id is None) for confirmation messages
+        """
+        now = datetime.utcnow()
+        record = {
+            "user_id": user.id,
+            "created_at": now.isoformat(),
+            "fields": {
+                **fields,
+                "type": fields["type"].value
+            }
+        }
+        await asyncio.to_thread(self._append, record)
+        self.captured += 1
+        logger.warning(f"Spooled submission {fields['submission_id']} of user {user.telegram_id}")
+        
+        application = Application(user_id=user.id, created_at=now, updated_at=now, **fields)
+        set_committed_value(application, "user", user)
+        return application
+    
+    def _append(self, record: Dict[str, Any]) -> None:
+        payload = json.dumps(record, ensure_ascii=False).encode("utf-8")
+        
+        with self._lock:
+            self._write_durably(self.path, [payload])
+    
+    @staticmethod
+    def _write_durably(path: str, payloads: List[bytes]) -> None:
+        """Append framed payloads to a file and fsync it (and a new directory entry)."""
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        created = not os.path.exists(path)
+        
+        with open(path, "ab") as f:
+            f.write(b"".join(HEADER.pack(len(payload)) + payload for payload in payloads))
+            f.flush()
+            os.fsync(f.fileno())
+        
+        if created:
+            # Make the new directory entry durable too
+            fd = os.open(directory, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+    
+    def _take(self) -> Tuple[List[bytes], bytes]:
+        """Move the spool aside (unless a previous replay is unfinished) and read it."""
+        with self._lock:
+            if not os.path.exists(self.replay_path):
+                if not os.path.exists(self.path) or not os.path.getsize(self.path):
+                    return [], b""
+                os.replace(self.path, self.replay_path)
+        return read_records(self.replay_path)
+    
+    def _finish(self, unreadable: List[bytes]) -> None:
+        """Quarantine unreadable records, then drop the replayed file."""
+        if unreadable:
+            self._write_durably(self.quarantine_path, unreadable)
+        os.remove(self.replay_path)
+    
+    async def replay(self) -> int:
+        """
+        Insert spooled submissions into the database.
+        
+        Returns:
+            Number of applications inserted
+        """
+        payloads, tail = await asyncio.to_thread(self._take)
+        if not payloads and not tail:
+            return 0
+        
+        rows = []
+        unreadable = []
+        for payload in payloads:
+            try:
+                rows.append(parse_record(payload))
+            except (ValueError, KeyError, TypeError) as e:
+                logger.error(f"Unreadable spooled submission: {e!r}")
+                unreadable.append(payload)
+        if tail:
+            logger.error(f"Incomplete record of {len(tail)} bytes at the end of the spool")
+            unreadable.append(tail)
+        
+        def write(session: Session) -> int:
+            existing = set(session.scalars(
+                select(Application.submission_id).where(
+                    Application.submission_id.in_([row["submission_id"] for row in rows])
+                )
+            ))
+            fresh = [row for row in rows if row["submission_id"] not in existing]
+            if not fresh:
+                return 0
+            
+            applications = session.scalars(insert(Application).returning(Application), fresh).all()
+            rollup = StatsRollupService(session)
+            for application in applications:
+                rollup.add_application(application)
+            return len(applications)
+        
+        try:
+            inserted = await run_in_session(write) if rows else 0
+        except Exception as e:
+            logger.warning(f"Spool replay postponed, {len(rows)} submissions waiting: {e}")
+            return 0
+        
+        await asyncio.to_thread(self._finish, unreadable)
+        if unreadable:
+            self.quarantined += len(unreadable)
+            logger.error(
+                f"Moved {len(unreadable)} unreadable spool records to {self.quarantine_path}"
+            )
+        self.replayed += inserted
+        self.duplicates += len(rows) - inserted
+        logger.info(
+            f"Replayed {inserted} spooled submissions ({len(rows) - inserted} already saved)"
+        )
+        return inserted
+    
+    def start(self) -> None:
+        """Start periodic replays."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        """Stop periodic replays and make a last attempt."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._replay_logged()
+    
+    async def _run(self) -> None:
+        while True:
+            await self._replay_logged()
+            await asyncio.sleep(self.interval)
+    
+    async def _replay_logged(self) -> None:
+        """Replay, keeping the task alive when the spool files can't be read or moved."""
+        try:
+            await self.replay()
+        except Exception as e:
+            logger.error(f"Spool replay failed: {e}", exc_info=True)
+
+
+# Global submission spool instance
+submission_spool = SubmissionSpool(
+    path=settings.submission_spool_path,
+    interval=settings.submission_replay_interval
+)
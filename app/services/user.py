@@ -2,15 +2,87 @@
 User management service.
 """
 
-from typing import Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import event
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 from aiogram.types import User as TgUser
 
+from app.models.base import upsert_insert
 from app.models.user import User
+from app.services.base import AsyncService
+from app.services.profile_writer import profile_writer
+from app.services.statistics import StatsRollupService
+from app.utils.cache import TTLCache
+from app.utils.pagination import OLDER, Cursor, Page, keyset_page
+from app.core.config import settings
 from app.core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# User records keyed by telegram_id, consulted before hitting the database
+user_cache = TTLCache(maxsize=settings.user_cache_size, ttl=settings.user_cache_ttl)
+
+CACHED_USER_FIELDS = (
+    "id", "telegram_id", "username", "first_name", "last_name",
+    "language_code", "is_bot", "is_premium", "is_blocked", "created_at"
+)
+
+# Session.info key: user_cache writes to apply once the update's transaction commits
+USER_CACHE_WRITES = "user_cache_writes"
+
+
+def queue_cache_write(db: Session, user: User, cache: bool = True) -> None:
+    """
+    Cache (or invalidate) a user once the session commits.
+    
+    Services only flush and the update's unit of work is committed later.
+    Deferring the cache write keeps rows that end up rolled back out of
+    user_cache.
+    
+    Args:
+        db: Session of the current update
+        user: User to cache
+        cache: False to invalidate the cached entry instead
+    """
+    entry = {field: getattr(user, field) for field in CACHED_USER_FIELDS} if cache else None
+    db.info.setdefault(USER_CACHE_WRITES, {})[user.telegram_id] = entry
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_cache_writes(session: Session) -> None:
+    """Apply user_cache writes of the committed transaction."""
+    for telegram_id, entry in session.info.pop(USER_CACHE_WRITES, {}).items():
+        if entry is None:
+            user_cache.invalidate(telegram_id)
+        else:
+            user_cache.set(telegram_id, entry)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_cache_writes(session: Session) -> None:
+    session.info.pop(USER_CACHE_WRITES, None)
+
+
+def profile_data(tg_user: TgUser) -> Dict[str, Any]:
+    """
+    Extract profile fields we keep in sync with Telegram.
+    
+    Args:
+        tg_user: Telegram user object
+        
+    Returns:
+        Dictionary with profile fields
+    """
+    return {
+        "username": tg_user.username,
+        "first_name": tg_user.first_name,
+        "last_name": tg_user.last_name,
+        "language_code": tg_user.language_code,
+        "is_premium": bool(getattr(tg_user, 'is_premium', False))
+    }
+
 
 class UserService:
     """Service for managing users."""
@@ -28,42 +100,82 @@ class UserService:
         Returns:
             User instance
         """
+        return self.get_or_create(tg_user)[0]
+    
+    def get_or_create(self, tg_user: TgUser) -> Tuple[User, bool]:
+        """
+        Get existing user or create new one, telling which happened.
+        
+        Args:
+            tg_user: Telegram user object
+            
+        Returns:
+            (user, True if the user was created by this call)
+        """
         user = self.db.query(User).filter(
             User.telegram_id == tg_user.id
         ).first()
         
-        if not user:
+        created = user is None
+        if created:
             user = self.create_user(tg_user)
             logger.info(f"Created new user: {user.telegram_id}")
         else:
             # Update user info if changed
             self.update_user_info(user, tg_user)
         
-        return user
+        queue_cache_write(self.db, user)
+        return user, created
     
     def create_user(self, tg_user: TgUser) -> User:
         """
         Create new user from Telegram user data.
         
+        On PostgreSQL and SQLite this is a single
+        ``INSERT ... ON CONFLICT (telegram_id) DO UPDATE ... RETURNING``,
+        so concurrent first updates from the same user all get the same row
+        instead of failing on the unique constraint.
+        
         Args:
             tg_user: Telegram user object
             
         Returns:
             Created user instance
         """
-        user = User(
+        profile = profile_data(tg_user)
+        insert = upsert_insert(self.db)
+        
+        if insert is None:
+            user = User(telegram_id=tg_user.id, is_bot=tg_user.is_bot, **profile)
+            self.db.add(user)
+            self.db.flush()
+            StatsRollupService(self.db).add_user(user)
+            return user
+        
+        now = datetime.utcnow()
+        stmt = insert(User).values(
             telegram_id=tg_user.id,
-            username=tg_user.username,
-            first_name=tg_user.first_name,
-            last_name=tg_user.last_name,
-            language_code=tg_user.language_code,
             is_bot=tg_user.is_bot,
-            is_premium=getattr(tg_user, 'is_premium', False)
+            created_at=now,
+            updated_at=now,
+            **profile
         )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[User.telegram_id],
+            set_={
+                **{field: stmt.excluded[field] for field in profile},
+                "updated_at": now
+            }
+        ).returning(User)
         
-        self.db.add(user)
-        self.db.commit()
-        self.db.refresh(user)
+        user = self.db.scalars(
+            stmt,
+            execution_options={"populate_existing": True}
+        ).one()
+        
+        # created_at is kept on conflict, so it only matches when this call inserted the row
+        if user.created_at == now:
+            StatsRollupService(self.db).add_user(user)
         
         return user
     
@@ -71,6 +183,10 @@ class UserService:
         """
         Update user information from Telegram data.
         
+        The instance is updated in memory right away (without marking it
+        dirty), while the database write is buffered by profile_writer and
+        flushed in bulk outside of update handling.
+        
         Args:
             user: Existing user instance
             tg_user: Telegram user object
@@ -78,32 +194,17 @@ class UserService:
         Returns:
             Updated user instance
         """
+        profile = profile_data(tg_user)
         updated = False
         
-        if user.username != tg_user.username:
-            user.username = tg_user.username
-            updated = True
-        
-        if user.first_name != tg_user.first_name:
-            user.first_name = tg_user.first_name
-            updated = True
-        
-        if user.last_name != tg_user.last_name:
-            user.last_name = tg_user.last_name
-            updated = True
-        
-        if user.language_code != tg_user.language_code:
-            user.language_code = tg_user.language_code
-            updated = True
-        
-        premium = getattr(tg_user, 'is_premium', False)
-        if user.is_premium != premium:
-            user.is_premium = premium
-            updated = True
+        for field, value in profile.items():
+            if getattr(user, field) != value:
+                set_committed_value(user, field, value)
+                updated = True
         
         if updated:
-            self.db.commit()
-            logger.info(f"Updated user info: {user.telegram_id}")
+            profile_writer.queue(user.id, profile)
+            logger.info(f"Queued user info update: {user.telegram_id}")
         
         return user
     
@@ -129,7 +230,8 @@ class UserService:
             user: User instance to block
         """
         user.is_blocked = True
-        self.db.commit()
+        self.db.flush()
+        queue_cache_write(self.db, user, cache=False)
         logger.info(f"Blocked user: {user.telegram_id}")
     
     def unblock_user(self, user: User) -> None:
@@ -140,7 +242,8 @@ class UserService:
             user: User instance to unblock
         """
         user.is_blocked = False
-        self.db.commit()
+        self.db.flush()
+        queue_cache_write(self.db, user, cache=False)
         logger.info(f"Unblocked user: {user.telegram_id}")
     
     def get_users_count(self) -> int:
@@ -161,4 +264,81 @@ class UserService:
         """
         return self.db.query(User).filter(
             User.is_blocked == False
-        ).all() 
\ No newline at end of file
+        ).all()
+    
+    def get_users_page(
+        self,
+        cursor: Optional[Cursor] = None,
+        direction: str = OLDER,
+        limit: int = 10
+    ) -> Page:
+        """
+        Get one page of the admin users list (keyset pagination).
+        
+        Args:
+            cursor: (created_at, id) to page from, None for the newest page
+            direction: OLDER or NEWER relative to the cursor
+            limit: Page size
+            
+        Returns:
+            Page of users, newest first
+        """
+        return keyset_page(self.db.query(User), User, cursor, direction, limit)
+
+
+class AsyncUserService(AsyncService):
+    """Async variant of UserService for handlers and middleware."""
+    
+    service_class = UserService
+    
+    async def get_or_create(self, tg_user: TgUser) -> Tuple[User, bool]:
+        """
+        Get existing user or create new one from Telegram user data.
+        
+        Served from user_cache when the cached profile still matches the
+        Telegram data, so repeated updates from one user skip the database.
+        
+        Args:
+            tg_user: Telegram user object
+            
+        Returns:
+            (user, True if the user was created): the user is a detached
+            copy on cache hit
+        """
+        cached = user_cache.get(tg_user.id)
+        if cached is not None and all(
+            cached[field] == value for field, value in profile_data(tg_user).items()
+        ):
+            return User(**cached), False
+        
+        # Cached by the sync service once the update's session commits
+        return await self._run("get_or_create", tg_user)
+    
+    async def get_user_by_telegram_id(self, telegram_id: int) -> Optional[User]:
+        """Get user by Telegram ID."""
+        return await self._run("get_user_by_telegram_id", telegram_id)
+    
+    async def block_user(self, user: User) -> None:
+        """Block user (mark as blocked)."""
+        await self._run("block_user", user)
+    
+    async def unblock_user(self, user: User) -> None:
+        """Unblock user."""
+        await self._run("unblock_user", user)
+    
+    async def get_users_count(self) -> int:
+        """Get total users count."""
+        return await self._run("get_users_count")
+    
+    async def get_all_users(self) -> List[User]:
+        """Get all users that are not blocked."""
+        return await self._run("get_all_users")
+    
+    async def get_users_page(
+        self,
+        cursor: Optional[Cursor] = None,
+        direction: str = OLDER,
+        limit: int = 10
+    ) -> Page:
+        """Get one page of the admin users list."""
+        return await self._run("get_users_page", cursor, direction, limit)
\ No newline at end of file
@@ -0,0 +1,160 @@
+"""
+In-process caching helpers.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """Bounded LRU cache with per-entry time-to-live and hit/miss counters."""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+    
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        Get cached value.
+        
+        Args:
+            key: Cache key
+            default: Value returned on miss
+        
+        Returns:
+            Cached value or default
+        """
+        item = self._data.get(key)
+        if item is None:
+            self.misses += 1
+            return default
+        
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return default
+        
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store value, evicting least recently used entries over the limit.
+        
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a single entry."""
+        self._data.pop(key, None)
+    
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._data.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache counters.
+        
+        Returns:
+            Dictionary with size, hits, misses and hit rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SingleFlightCache:
+    """
+    Async TTL cache where concurrent misses for a key share one computation.
+    
+    invalidate() drops cached values; computations already running finish
+    for their callers but their (possibly stale) result is not cached.
+    """
+    
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self._inflight: Dict[Hashable, "asyncio.Task[Any]"] = {}
+        self._generation = 0
+    
+    async def get_or_compute(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Get cached value or compute it once for all concurrent callers.
+        
+        Args:
+            key: Cache key
+            compute: Coroutine function producing the value
+        
+        Returns:
+            Cached or freshly computed value
+        """
+        item = self._data.get(key)
+        if item is not None and item[0] >= time.monotonic():
+            self.hits += 1
+            return item[1]
+        
+        task = self._inflight.get(key)
+        if task is not None:
+            self.shared += 1
+        else:
+            self.misses += 1
+            task = asyncio.ensure_future(compute())
+            self._inflight[key] = task
+            task.add_done_callback(
+                lambda done, generation=self._generation: self._store(key, done, generation)
+            )
+        
+        # shield: a cancelled caller must not cancel the computation others wait for
+        return await asyncio.shield(task)
+    
+    def invalidate(self) -> None:
+        """Drop all entries; running computations are no longer shared or stored."""
+        self._generation += 1
+        self._data.clear()
+        self._inflight.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache counters.
+        
+        Returns:
+            Dictionary with hits, misses and shared (coalesced) lookups
+        """
+        return {
+            "size": len(self._data),
+            "hits": self.hits,
+            "misses": self.misses,
+            "shared": self.shared
+        }
+    
+    def _store(self, key: Hashable, task: "asyncio.Task[Any]", generation: int) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        if generation == self._generation:
+            self._data[key] = (time.monotonic() + self.ttl, task.result())
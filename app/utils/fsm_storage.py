@@ -0,0 +1,195 @@
+"""
+Durable FSM storages selected by settings.fsm_storage.
+"""
+
+import json
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from aiogram.fsm.context import FSMContext
+from aiogram.fsm.state import State
+from aiogram.fsm.storage.base import BaseStorage, DefaultKeyBuilder, StateType, StorageKey
+from aiogram.fsm.storage.memory import MemoryStorage
+from sqlalchemy import and_, case, delete, select
+from sqlalchemy.orm import Session
+
+from app.models.base import run_in_update_session, upsert_insert
+from app.models.fsm import FsmRecord
+from app.core.config import settings
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Seconds between deletes of expired FSM records
+PURGE_INTERVAL = 3600
+
+
+def state_name(state: StateType) -> Optional[str]:
+    """Get the storage value of a state."""
+    return state.state if isinstance(state, State) else state
+
+
+async def advance_step(
+    state: FSMContext,
+    new_state: StateType,
+    data: Optional[Dict[str, Any]] = None,
+    **changes: Any
+) -> Dict[str, Any]:
+    """
+    Move a form to its next step: merge answers and set the state together.
+    
+    Storages with ``set_record`` (database, Redis) do it in one write instead
+    of update_data() (read + write) followed by set_state() (write).
+    
+    Args:
+        state: FSM context
+        new_state: Next state
+        data: Current FSM data if the handler already read it
+        **changes: Answers to merge into the data
+        
+    Returns:
+        Merged FSM data
+    """
+    if data is None:
+        data = await state.get_data()
+    data = {**data, **changes}
+    
+    set_record = getattr(state.storage, "set_record", None)
+    if set_record is not None:
+        await set_record(state.key, new_state, data)
+    else:
+        await state.set_data(data)
+        await state.set_state(new_state)
+    return data
+
+
+class DatabaseStorage(BaseStorage):
+    """
+    FSM storage in the fsm_records table of the bot database.
+    
+    Every write moves the record's expiry ``ttl`` seconds ahead; expired
+    records read as empty and are deleted in bulk from time to time.
+    Records of finished conversations (no state, no data) are deleted
+    right away. Reads and writes made while handling an update go through
+    the update's own session (see run_in_update_session): they see the
+    update's earlier writes, never wait for its locks on a second
+    connection, and are committed together with the update.
+    """
+    
+    def __init__(self, ttl: int):
+        self.ttl = ttl
+        self.key_builder = DefaultKeyBuilder(with_destiny=True)
+        self._next_purge = 0.0
+    
+    async def set_state(self, key: StorageKey, state: StateType = None) -> None:
+        await self._write(key, state=state_name(state))
+    
+    async def get_state(self, key: StorageKey) -> Optional[str]:
+        record = await self._read(key)
+        return record[0] if record else None
+    
+    async def set_data(self, key: StorageKey, data: Dict[str, Any]) -> None:
+        await self._write(key, data=self._dump(data))
+    
+    async def set_record(self, key: StorageKey, state: StateType, data: Dict[str, Any]) -> None:
+        """Set state and data in one statement."""
+        await self._write(key, state=state_name(state), data=self._dump(data))
+    
+    async def get_data(self, key: StorageKey) -> Dict[str, Any]:
+        record = await self._read(key)
+        return json.loads(record[1]) if record and record[1] else {}
+    
+    async def close(self) -> None:
+        pass
+    
+    @staticmethod
+    def _dump(data: Dict[str, Any]) -> Optional[str]:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")) if data else None
+    
+    async def _read(self, key: StorageKey) -> Optional[tuple]:
+        """Get (state, data) of a live record."""
+        stmt = select(FsmRecord.state, FsmRecord.data).where(
+            FsmRecord.key == self.key_builder.build(key),
+            FsmRecord.expires_at > datetime.utcnow()
+        )
+        return await run_in_update_session(lambda session: session.execute(stmt).first())
+    
+    async def _write(self, key: StorageKey, **values: Optional[str]) -> None:
+        """Set state and/or data of a record, resetting the other one if the record expired."""
+        record_key = self.key_builder.build(key)
+        purge = time.monotonic() >= self._next_purge
+        if purge:
+            self._next_purge = time.monotonic() + PURGE_INTERVAL
+        
+        def write(session: Session) -> None:
+            now = datetime.utcnow()
+            expires_at = now + timedelta(seconds=self.ttl)
+            others = [field for field in ("state", "data") if field not in values]
+            insert = upsert_insert(session)
+            
+            if insert is None:
+                record = session.get(FsmRecord, record_key)
+                if record is None:
+                    record = FsmRecord(key=record_key)
+                    session.add(record)
+                elif record.expires_at <= now:
+                    for field in others:
+                        setattr(record, field, None)
+                for field, value in values.items():
+                    setattr(record, field, value)
+                record.expires_at = expires_at
+            else:
+                stmt = insert(FsmRecord).values(key=record_key, expires_at=expires_at, **values)
+                session.execute(stmt.on_conflict_do_update(
+                    index_elements=[FsmRecord.key],
+                    set_={
+                        **{field: stmt.excluded[field] for field in values},
+                        **{
+                            field: case(
+                                (FsmRecord.expires_at <= now, None),
+                                else_=getattr(FsmRecord, field)
+                            )
+                            for field in others
+                        },
+                        "expires_at": stmt.excluded.expires_at
+                    }
+                ))
+            
+            session.flush()
+            session.execute(delete(FsmRecord).where(and_(
+                FsmRecord.key == record_key,
+                FsmRecord.state.is_(None),
+                FsmRecord.data.is_(None)
+            )))
+            if purge:
+                session.execute(delete(FsmRecord).where(FsmRecord.expires_at <= now))
+        
+        await run_in_update_session(write)
+
+
+def create_fsm_storage() -> BaseStorage:
+    """
+    Create the FSM storage configured by settings.fsm_storage.
+    
+    Returns:
+        MemoryStorage, RedisStorage or DatabaseStorage
+    """
+    if settings.fsm_storage == "redis":
+        # Optional dependency: only needed with FSM_STORAGE=redis
+        from app.utils.redis_storage import RedisStorage
+        
+        if not settings.redis_url:
+            raise ValueError("REDIS_URL is required for FSM_STORAGE=redis")
+        logger.info("Using Redis FSM storage")
+        return RedisStorage.from_url(
+            settings.redis_url,
+            state_ttl=settings.fsm_state_ttl,
+            data_ttl=settings.fsm_state_ttl
+        )
+    
+    if settings.fsm_storage == "database":
+        logger.info("Using database FSM storage")
+        return DatabaseStorage(ttl=settings.fsm_state_ttl)
+    
+    return MemoryStorage()
@@ -1,15 +1,26 @@
 """
 Modern keyboard utilities with enhanced design.
+
+Keyboards that depend only on their arguments are built once and memoized;
+callers get shared instances and must not modify them (copy with
+InlineKeyboardBuilder.from_markup() to extend one).
 """
 
-from typing import List, Optional
+from functools import lru_cache
+from typing import FrozenSet, Iterable, Optional, Tuple
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 
 from app.core.config import settings
-from app.core.service_categories import SERVICE_CATEGORIES, GENERAL_OPTIONS
+from app.core.callbacks import (
+    BudgetCallback, ContentCallback, DesignCallback, OptionCallback,
+    ServiceCallback, SubcategoryCallback, SupportCallback, TimelineCallback
+)
+from app.core.service_categories import SERVICE_CATEGORIES, SERVICE_NAMES, form_choices
+from app.utils.pagination import NEWER, OLDER, Page
 
 
+@lru_cache(maxsize=None)
 def get_main_menu() -> InlineKeyboardMarkup:
     """
     Get main menu keyboard with modern design.
@@ -48,6 +59,7 @@ def get_main_menu() -> InlineKeyboardMarkup:
     return keyboard.as_markup()
 
 
+@lru_cache(maxsize=None)
 def get_services_menu() -> InlineKeyboardMarkup:
     """
     Get services selection keyboard.
@@ -97,6 +109,7 @@ def get_services_menu() -> InlineKeyboardMarkup:
     return keyboard.as_markup()
 
 
+@lru_cache(maxsize=None)
 def get_back_button(callback_data: str = "back_to_main") -> InlineKeyboardMarkup:
     """
     Get simple back button.
@@ -117,6 +130,7 @@ def get_back_button(callback_data: str = "back_to_main") -> InlineKeyboardMarkup
     return keyboard.as_markup()
 
 
+@lru_cache(maxsize=None)
 def get_cancel_button() -> InlineKeyboardMarkup:
     """
     Get cancel button for service forms.
@@ -134,6 +148,7 @@ def get_cancel_button() -> InlineKeyboardMarkup:
     return keyboard.as_markup()
 
 
+@lru_cache(maxsize=None)
 def get_team_cancel_button() -> InlineKeyboardMarkup:
     """
     Get cancel button for team forms.
@@ -155,6 +170,7 @@ def get_team_cancel_button() -> InlineKeyboardMarkup:
     return keyboard.as_markup()
 
 
+@lru_cache(maxsize=None)
 def get_confirmation_keyboard(
     confirm_text: str = "✅ Подтвердить",
     cancel_text: str = "❌ Отменить",
@@ -187,6 +203,25 @@ def get_confirmation_keyboard(
     return keyboard.as_markup()
 
 
+@lru_cache(maxsize=None)
+def get_row_keyboard(*buttons: Tuple[str, str]) -> InlineKeyboardMarkup:
+    """
+    Get one-row keyboard of callback buttons.
+    
+    Args:
+        *buttons: (text, callback_data) pairs
+        
+    Returns:
+        InlineKeyboardMarkup: Keyboard with the buttons in one row
+    """
+    keyboard = InlineKeyboardBuilder()
+    keyboard.row(*(
+        InlineKeyboardButton(text=text, callback_data=callback_data)
+        for text, callback_data in buttons
+    ))
+    return keyboard.as_markup()
+
+
 def get_admin_keyboard(application_id: int) -> InlineKeyboardMarkup:
     """
     Get admin keyboard for application management.
@@ -225,51 +260,38 @@ def get_admin_keyboard(application_id: int) -> InlineKeyboardMarkup:
 
 
 def get_pagination_keyboard(
-    current_page: int,
-    total_pages: int,
     callback_prefix: str,
-    show_info: bool = True
+    page: Page
 ) -> InlineKeyboardMarkup:
     """
-    Get pagination keyboard.
+    Get keyset pagination keyboard.
     
     Args:
-        current_page: Current page number (1-based)
-        total_pages: Total number of pages
-        callback_prefix: Prefix for callback data
-        show_info: Whether to show page info
+        callback_prefix: Prefix for callback data (cursor is appended after ":")
+        page: Current page
         
     Returns:
-        InlineKeyboardMarkup: Pagination keyboard
+        InlineKeyboardMarkup: Pagination keyboard (empty if there is one page)
     """
     keyboard = InlineKeyboardBuilder()
     
     buttons = []
     
-    # Previous page
-    if current_page > 1:
+    # Newer items
+    if page.has_newer:
         buttons.append(
             InlineKeyboardButton(
                 text="⬅️",
-                callback_data=f"{callback_prefix}_{current_page - 1}"
+                callback_data=f"{callback_prefix}:{NEWER}{page.first_cursor}"
             )
         )
     
-    # Page info
-    if show_info and total_pages > 1:
-        buttons.append(
-            InlineKeyboardButton(
-                text=f"{current_page}/{total_pages}",
-                callback_data="page_info"
-            )
-        )
-    
-    # Next page
-    if current_page < total_pages:
+    # Older items
+    if page.has_older:
         buttons.append(
             InlineKeyboardButton(
                 text="➡️",
-                callback_data=f"{callback_prefix}_{current_page + 1}"
+                callback_data=f"{callback_prefix}:{OLDER}{page.last_cursor}"
             )
         )
     
@@ -279,136 +301,150 @@ def get_pagination_keyboard(
     return keyboard.as_markup()
 
 
+@lru_cache(maxsize=None)
 def create_services_keyboard() -> InlineKeyboardMarkup:
     """Create keyboard with all services."""
     buttons = []
-    for service in SERVICE_CATEGORIES.keys():
+    for code, service in enumerate(SERVICE_NAMES):
         buttons.append([InlineKeyboardButton(
             text=service, 
-            callback_data=f"service:{service}"
+            callback_data=ServiceCallback(code=code).pack()
         )])
     
     buttons.append([InlineKeyboardButton(text="🔙 Назад", callback_data="back_to_main")])
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
-def create_subcategories_keyboard(service: str) -> InlineKeyboardMarkup:
-    """Create keyboard with subcategories for selected service."""
+@lru_cache(maxsize=None)
+def create_subcategories_keyboard(service: int) -> InlineKeyboardMarkup:
+    """Create keyboard with subcategories for selected service (by code)."""
     buttons = []
     
-    if service in SERVICE_CATEGORIES:
-        subcategories = SERVICE_CATEGORIES[service]["subcategories"]
-        for subcat, description in subcategories.items():
-            buttons.append([InlineKeyboardButton(
-                text=subcat,
-                callback_data=f"subcategory:{subcat}"
-            )])
+    for code, subcat in enumerate(form_choices("subcategory", service)):
+        buttons.append([InlineKeyboardButton(
+            text=subcat,
+            callback_data=SubcategoryCallback(code=code).pack()
+        )])
     
     buttons.append([InlineKeyboardButton(text="🔙 Назад к услугам", callback_data="back_to_services")])
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
-def create_budget_keyboard(service: str) -> InlineKeyboardMarkup:
-    """Create keyboard with budget options for selected service."""
+@lru_cache(maxsize=None)
+def create_budget_keyboard(service: int) -> InlineKeyboardMarkup:
+    """Create keyboard with budget options for selected service (by code)."""
     buttons = []
     
-    if service in SERVICE_CATEGORIES:
-        budgets = SERVICE_CATEGORIES[service]["budgets"]
-        for budget in budgets:
-            buttons.append([InlineKeyboardButton(
-                text=budget,
-                callback_data=f"budget:{budget}"
-            )])
+    for code, budget in enumerate(form_choices("budget", service)):
+        buttons.append([InlineKeyboardButton(
+            text=budget,
+            callback_data=BudgetCallback(code=code).pack()
+        )])
     
     buttons.append([InlineKeyboardButton(text="🔙 Назад", callback_data="back_to_subcategory")])
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
+@lru_cache(maxsize=None)
 def create_timeline_keyboard() -> InlineKeyboardMarkup:
     """Create keyboard with timeline options."""
     buttons = []
     
-    for timeline, description in GENERAL_OPTIONS["timeline"].items():
+    for code, timeline in enumerate(form_choices("timeline")):
         buttons.append([InlineKeyboardButton(
             text=timeline,
-            callback_data=f"timeline:{timeline}"
+            callback_data=TimelineCallback(code=code).pack()
         )])
     
     buttons.append([InlineKeyboardButton(text="🔙 Назад", callback_data="back_to_budget")])
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
+@lru_cache(maxsize=None)
 def create_content_keyboard() -> InlineKeyboardMarkup:
     """Create keyboard for content availability."""
     buttons = []
     
-    for option, description in GENERAL_OPTIONS["has_content"].items():
+    for code, option in enumerate(form_choices("has_content")):
         buttons.append([InlineKeyboardButton(
             text=option,
-            callback_data=f"content:{option}"
+            callback_data=ContentCallback(code=code).pack()
         )])
     
     buttons.append([InlineKeyboardButton(text="🔙 Назад", callback_data="back_to_timeline")])
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
+@lru_cache(maxsize=None)
 def create_design_keyboard() -> InlineKeyboardMarkup:
     """Create keyboard for design availability."""
     buttons = []
     
-    for option, description in GENERAL_OPTIONS["has_design"].items():
+    for code, option in enumerate(form_choices("has_design")):
         buttons.append([InlineKeyboardButton(
             text=option,
-            callback_data=f"design:{option}"
+            callback_data=DesignCallback(code=code).pack()
         )])
     
     buttons.append([InlineKeyboardButton(text="🔙 Назад", callback_data="back_to_content")])
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
+@lru_cache(maxsize=None)
 def create_support_keyboard() -> InlineKeyboardMarkup:
     """Create keyboard for support level."""
     buttons = []
     
-    for option, description in GENERAL_OPTIONS["support"].items():
+    for code, option in enumerate(form_choices("support_level")):
         buttons.append([InlineKeyboardButton(
             text=option,
-            callback_data=f"support:{option}"
+            callback_data=SupportCallback(code=code).pack()
         )])
     
     buttons.append([InlineKeyboardButton(text="🔙 Назад", callback_data="back_to_design")])
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
-def create_additional_options_keyboard(service: str, selected_options: list = None) -> InlineKeyboardMarkup:
-    """Create keyboard for additional service-specific options."""
-    if selected_options is None:
-        selected_options = []
-    
+def create_additional_options_keyboard(
+    service: int,
+    selected_options: Optional[Iterable[int]] = None
+) -> InlineKeyboardMarkup:
+    """Create keyboard for additional service-specific options (service and option codes)."""
+    return _additional_options_keyboard(service, frozenset(selected_options or ()))
+
+
+# Bounded: one entry per selection of a service's options
+@lru_cache(maxsize=128)
+def _additional_options_keyboard(
+    service: int,
+    selected_options: FrozenSet[int]
+) -> InlineKeyboardMarkup:
     buttons = []
     
-    if service in SERVICE_CATEGORIES:
-        options = SERVICE_CATEGORIES[service]["options"]
-        for option_key, option_name in options.items():
-            # Показываем ✅ если опция выбрана, иначе ⭕
-            if option_key in selected_options:
-                text = f"✅ {option_name}"
-            else:
-                text = f"⭕ {option_name}"
-            
-            buttons.append([InlineKeyboardButton(
-                text=text,
-                callback_data=f"option:{option_key}"
-            )])
+    options = SERVICE_CATEGORIES[SERVICE_NAMES[service]]["options"]
+    for code, option_key in enumerate(form_choices("additional_options", service)):
+        # Показываем ✅ если опция выбрана, иначе ⭕
+        if code in selected_options:
+            text = f"✅ {options[option_key]}"
+        else:
+            text = f"⭕ {options[option_key]}"
+        
+        buttons.append([InlineKeyboardButton(
+            text=text,
+            callback_data=OptionCallback(code=code).pack()
+        )])
     
+    # Количество выбранных опций показывается на кнопке, текст сообщения не меняется
+    done_text = f"✅ Готово ({len(selected_options)})" if selected_options else "✅ Готово"
     buttons.extend([
         [InlineKeyboardButton(text="⏭ Пропустить", callback_data="skip_options")],
-        [InlineKeyboardButton(text="✅ Готово", callback_data="options_done")],
+        [InlineKeyboardButton(text=done_text, callback_data="options_done")],
         [InlineKeyboardButton(text="🔙 Назад", callback_data="back_to_support")]
     ])
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
+@lru_cache(maxsize=None)
 def create_final_step_keyboard() -> InlineKeyboardMarkup:
     """Create keyboard for final step (description or skip)."""
     buttons = [
@@ -419,6 +455,7 @@ def create_final_step_keyboard() -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
+@lru_cache(maxsize=None)
 def create_team_keyboard() -> InlineKeyboardMarkup:
     """Create keyboard for team application."""
     buttons = [
@@ -428,6 +465,7 @@ def create_team_keyboard() -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
+@lru_cache(maxsize=None)
 def create_main_menu_keyboard() -> InlineKeyboardMarkup:
     """Create main menu keyboard."""
     buttons = [
@@ -439,6 +477,7 @@ def create_main_menu_keyboard() -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
+@lru_cache(maxsize=None)
 def create_contact_keyboard() -> InlineKeyboardMarkup:
     """Create contact keyboard."""
     buttons = [
@@ -448,6 +487,7 @@ def create_contact_keyboard() -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
+@lru_cache(maxsize=None)
 def create_back_to_main_keyboard() -> InlineKeyboardMarkup:
     """Create simple back to main menu keyboard."""
     return InlineKeyboardMarkup(inline_keyboard=[
@@ -455,6 +495,7 @@ def create_back_to_main_keyboard() -> InlineKeyboardMarkup:
     ])
 
 
+@lru_cache(maxsize=None)
 def create_cancel_keyboard(cancel_type: str = "service") -> InlineKeyboardMarkup:
     """Create cancel keyboard for forms."""
     return InlineKeyboardMarkup(inline_keyboard=[
@@ -462,10 +503,44 @@ def create_cancel_keyboard(cancel_type: str = "service") -> InlineKeyboardMarkup
     ])
 
 
+@lru_cache(maxsize=None)
+def create_contact_method_keyboard() -> InlineKeyboardMarkup:
+    """Create keyboard for contact method selection."""
+    buttons = [
+        [InlineKeyboardButton(text="📞 Телефон", callback_data="contact_method:phone")],
+        [InlineKeyboardButton(text="💬 Telegram", callback_data="contact_method:telegram")],
+        [InlineKeyboardButton(text="📧 Email", callback_data="contact_method:email")],
+        [InlineKeyboardButton(text="🌐 WhatsApp", callback_data="contact_method:whatsapp")],
+        [InlineKeyboardButton(text="✏️ Ввести вручную", callback_data="contact_method:manual")],
+        [InlineKeyboardButton(text="❌ Отменить", callback_data="cancel_service")]
+    ]
+    return InlineKeyboardMarkup(inline_keyboard=buttons)
+
+
+@lru_cache(maxsize=None)
 def create_confirmation_keyboard() -> InlineKeyboardMarkup:
     """Create confirmation keyboard for form submission."""
     buttons = [
         [InlineKeyboardButton(text="✅ Отправить заявку", callback_data="confirm_application")],
         [InlineKeyboardButton(text="❌ Отменить", callback_data="cancel_service")]
     ]
-    return InlineKeyboardMarkup(inline_keyboard=buttons) 
\ No newline at end of file
+    return InlineKeyboardMarkup(inline_keyboard=buttons)
+
+
+def warm_keyboards() -> None:
+    """Build the static and per-service keyboards ahead of the first update."""
+    for build in (
+        get_main_menu, get_services_menu, get_back_button, get_cancel_button,
+        get_team_cancel_button, get_confirmation_keyboard, create_services_keyboard,
+        create_timeline_keyboard, create_content_keyboard, create_design_keyboard,
+        create_support_keyboard, create_final_step_keyboard, create_team_keyboard,
+        create_main_menu_keyboard, create_contact_keyboard, create_back_to_main_keyboard,
+        create_contact_method_keyboard, create_confirmation_keyboard
+    ):
+        build()
+    create_cancel_keyboard("service")
+    
+    for service in range(len(SERVICE_NAMES)):
+        create_subcategories_keyboard(service)
+        create_budget_keyboard(service)
+        create_additional_options_keyboard(service)
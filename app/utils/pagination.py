@@ -0,0 +1,140 @@
+"""
+Keyset (cursor) pagination helpers for admin lists.
+
+Lists are ordered by ``(created_at, id)`` newest first. A page is fetched
+with ``WHERE (created_at, id) < cursor`` instead of OFFSET, so every page
+costs the same index range scan no matter how deep it is.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Query
+
+# Direction markers used in callback data
+OLDER = ">"
+NEWER = "<"
+
+EPOCH = datetime(1970, 1, 1)
+
+Cursor = Tuple[datetime, int]
+
+
+@dataclass
+class Page:
+    """One page of a keyset-paginated list."""
+    
+    items: List[Any]
+    has_newer: bool
+    has_older: bool
+    
+    @property
+    def first_cursor(self) -> Optional[str]:
+        """Encoded cursor of the newest item on the page."""
+        return encode_cursor(self.items[0]) if self.items else None
+    
+    @property
+    def last_cursor(self) -> Optional[str]:
+        """Encoded cursor of the oldest item on the page."""
+        return encode_cursor(self.items[-1]) if self.items else None
+
+
+def _to_base36(value: int) -> str:
+    digits = "0123456789abcdefghijklmnopqrstuvwxyz"
+    result = ""
+    while True:
+        value, remainder = divmod(value, 36)
+        result = digits[remainder] + result
+        if not value:
+            return result
+
+
+def encode_cursor(item: Any) -> str:
+    """
+    Encode (created_at, id) of a row for callback data.
+    
+    Args:
+        item: Row with created_at and id attributes
+    
+    Returns:
+        Compact cursor like ``"1k2x9f8s0w.2n"`` (microseconds and id in base 36)
+    """
+    delta = item.created_at - EPOCH
+    micros = (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+    return f"{_to_base36(micros)}.{_to_base36(item.id)}"
+
+
+def decode_cursor(value: str) -> Optional[Cursor]:
+    """
+    Decode a cursor produced by encode_cursor().
+    
+    Args:
+        value: Encoded cursor
+    
+    Returns:
+        (created_at, id) or None if the cursor is malformed or out of range
+    """
+    try:
+        micros, item_id = value.split(".")
+        return EPOCH + timedelta(microseconds=int(micros, 36)), int(item_id, 36)
+    except (ValueError, OverflowError):
+        return None
+
+
+def parse_page_callback(data: str) -> Tuple[str, str, Optional[Cursor]]:
+    """
+    Split callback data like ``"admin_users:>1k2x9f8s0w.2n"``.
+    
+    Args:
+        data: Callback data
+    
+    Returns:
+        (prefix, direction, cursor); the cursor is None for the first page,
+        which is also shown for tampered positions
+    """
+    prefix, _, position = data.partition(":")
+    direction, cursor = position[:1], decode_cursor(position[1:])
+    if direction not in (OLDER, NEWER) or cursor is None:
+        return prefix, OLDER, None
+    return prefix, direction, cursor
+
+
+def keyset_page(
+    query: Query,
+    model: Any,
+    cursor: Optional[Cursor] = None,
+    direction: str = OLDER,
+    limit: int = 10
+) -> Page:
+    """
+    Fetch one page ordered by (created_at, id), newest first.
+    
+    Args:
+        query: Filtered query over model
+        model: Mapped class with created_at and id columns
+        cursor: Position to page from (None for the newest page)
+        direction: OLDER for items after the cursor, NEWER for items before it
+        limit: Page size
+    
+    Returns:
+        Page of items, newest first
+    """
+    key = tuple_(model.created_at, model.id)
+    
+    if cursor is not None and direction == NEWER:
+        rows = query.filter(key > cursor).order_by(
+            model.created_at.asc(), model.id.asc()
+        ).limit(limit + 1).all()
+        if len(rows) <= limit:
+            # Reached the newest items: show a full first page instead
+            return keyset_page(query, model, limit=limit)
+        return Page(items=list(reversed(rows[:limit])), has_newer=True, has_older=True)
+    
+    if cursor is not None:
+        query = query.filter(key < cursor)
+    rows = query.order_by(
+        model.created_at.desc(), model.id.desc()
+    ).limit(limit + 1).all()
+    return Page(items=rows[:limit], has_newer=cursor is not None, has_older=len(rows) > limit)
@@ -0,0 +1,33 @@
+"""
+Redis FSM storage with combined state and data writes.
+
+Imported only with FSM_STORAGE=redis (needs the redis package).
+"""
+
+from typing import Any, Dict
+
+from aiogram.fsm.storage.base import StateType, StorageKey
+from aiogram.fsm.storage.redis import RedisStorage as BaseRedisStorage
+
+from app.utils.fsm_storage import state_name
+
+
+class RedisStorage(BaseRedisStorage):
+    """aiogram RedisStorage that can set state and data in one round trip."""
+    
+    async def set_record(self, key: StorageKey, state: StateType, data: Dict[str, Any]) -> None:
+        """Set state and data in one MULTI/EXEC pipeline."""
+        state_key = self.key_builder.build(key, "state")
+        data_key = self.key_builder.build(key, "data")
+        value = state_name(state)
+        
+        async with self.redis.pipeline(transaction=True) as pipe:
+            if value is None:
+                pipe.delete(state_key)
+            else:
+                pipe.set(state_key, value, ex=self.state_ttl)
+            if data:
+                pipe.set(data_key, self.json_dumps(data), ex=self.data_ttl)
+            else:
+                pipe.delete(data_key)
+            await pipe.execute()
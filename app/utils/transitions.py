@@ -0,0 +1,221 @@
+"""
+Screen transitions that edit the current message instead of replacing it.
+"""
+
+import hashlib
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.types import CallbackQuery, InlineKeyboardMarkup, Message
+
+from app.services.media import media_registry
+from app.utils.cache import TTLCache
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def is_not_modified(error: TelegramBadRequest) -> bool:
+    """Check if an edit failed only because the content is unchanged."""
+    return "message is not modified" in error.message
+
+
+@dataclass
+class FlowTransitions:
+    """Transition counters of one flow."""
+    edits: int = 0
+    resends: int = 0
+    failed_edits: int = 0
+    markup_edits: int = 0
+    skipped: int = 0
+    
+    @property
+    def calls_saved(self) -> int:
+        """Bot API calls saved against delete + send for every transition."""
+        return self.edits - self.failed_edits + self.markup_edits + 2 * self.skipped
+
+
+class TransitionMetrics:
+    """Transition counters per flow."""
+    
+    def __init__(self):
+        self.flows: Dict[str, FlowTransitions] = {}
+    
+    def flow(self, name: str) -> FlowTransitions:
+        """Get (creating on first use) the counters of a flow."""
+        counters = self.flows.get(name)
+        if counters is None:
+            counters = self.flows[name] = FlowTransitions()
+        return counters
+
+
+async def show_screen(
+    callback: CallbackQuery,
+    text: str,
+    reply_markup: Optional[InlineKeyboardMarkup] = None,
+    photo: Optional[str] = None,
+    flow: str = "other"
+) -> None:
+    """
+    Show the next screen in the message the callback button belongs to.
+    
+    Text screens replace the text of a text message and photo screens the
+    photo and caption of a photo message, in one edit call. Switching
+    between photo and text (or an edit Telegram refuses, e.g. on a message
+    older than 48 hours) falls back to delete + send.
+    
+    Args:
+        callback: Callback query of the pressed button
+        text: Screen text (HTML), the caption for photo screens
+        reply_markup: Screen keyboard
+        photo: Photo URL for photo screens (sent through the media registry)
+        flow: Flow name for transition metrics
+    """
+    message = callback.message
+    counters = transition_metrics.flow(flow)
+    
+    if bool(getattr(message, "photo", None)) == (photo is not None):
+        try:
+            if photo is None:
+                await message.edit_text(text, reply_markup=reply_markup, parse_mode="HTML")
+            else:
+                await media_registry.edit_photo(
+                    message, photo, caption=text, reply_markup=reply_markup, parse_mode="HTML"
+                )
+            counters.edits += 1
+            return
+        except TelegramBadRequest as e:
+            if is_not_modified(e):
+                counters.edits += 1
+                return
+            counters.failed_edits += 1
+            logger.debug(f"Edit in place failed, resending: {e}")
+    
+    with suppress(TelegramBadRequest):
+        await message.delete()
+    if photo is None:
+        await message.answer(text, reply_markup=reply_markup, parse_mode="HTML")
+    else:
+        await media_registry.answer_photo(
+            message, photo, caption=text, reply_markup=reply_markup, parse_mode="HTML"
+        )
+    counters.resends += 1
+
+
+async def update_markup(
+    callback: CallbackQuery,
+    reply_markup: InlineKeyboardMarkup,
+    flow: str = "other"
+) -> None:
+    """
+    Replace only the keyboard of the callback's message.
+    
+    Nothing is sent if the message already has this keyboard (e.g. a
+    repeated tap that did not change the selection).
+    
+    Args:
+        callback: Callback query of the pressed button
+        reply_markup: New keyboard
+        flow: Flow name for transition metrics
+    """
+    counters = transition_metrics.flow(flow)
+    if callback.message.reply_markup == reply_markup:
+        counters.skipped += 1
+        return
+    
+    try:
+        await callback.message.edit_reply_markup(reply_markup=reply_markup)
+    except TelegramBadRequest as e:
+        if not is_not_modified(e):
+            raise
+    counters.markup_edits += 1
+
+
+class RenderedEdits:
+    """
+    Skips text edits that would not change the message.
+    
+    A digest of the text and keyboard last rendered into each message is
+    kept per (chat, message) together with the message's edit date. A
+    re-render with the same digest is not sent as long as the message
+    still carries that edit date, i.e. nothing else edited it since.
+    """
+    
+    def __init__(self, maxsize: int = 10000, ttl: float = 48 * 3600):
+        self.edits = 0
+        self.skipped = 0
+        self.not_modified = 0
+        self._digests = TTLCache(maxsize=maxsize, ttl=ttl)
+    
+    @staticmethod
+    def digest(
+        text: str,
+        reply_markup: Optional[InlineKeyboardMarkup],
+        parse_mode: Optional[str]
+    ) -> bytes:
+        """Digest of rendered message content."""
+        content = hashlib.blake2b(digest_size=16)
+        content.update(f"{parse_mode}\0{text}\0".encode())
+        if reply_markup is not None:
+            content.update(reply_markup.model_dump_json(exclude_none=True).encode())
+        return content.digest()
+    
+    async def edit_text(
+        self,
+        message: Message,
+        text: str,
+        reply_markup: Optional[InlineKeyboardMarkup] = None,
+        parse_mode: Optional[str] = "HTML"
+    ) -> bool:
+        """
+        Edit the text of a bot message unless it already shows this content.
+        
+        Args:
+            message: Message sent by the bot (usually callback.message)
+            text: New text
+            reply_markup: New inline keyboard
+            parse_mode: Text parse mode
+        
+        Returns:
+            True if the message was edited
+        """
+        key = (message.chat.id, message.message_id)
+        digest = self.digest(text, reply_markup, parse_mode)
+        if self._digests.get(key) == (digest, message.edit_date):
+            self.skipped += 1
+            return False
+        
+        try:
+            edited = await message.edit_text(text, reply_markup=reply_markup, parse_mode=parse_mode)
+        except TelegramBadRequest as e:
+            if not is_not_modified(e):
+                raise
+            # Rendered before this process saw the message (e.g. before a restart)
+            self.not_modified += 1
+            self._digests.set(key, (digest, message.edit_date))
+            return False
+        
+        self.edits += 1
+        self._digests.set(key, (digest, edited.edit_date if isinstance(edited, Message) else None))
+        return True
+
+
+async def edit_text_if_changed(
+    message: Message,
+    text: str,
+    reply_markup: Optional[InlineKeyboardMarkup] = None,
+    parse_mode: Optional[str] = "HTML"
+) -> bool:
+    """Edit a message through the global rendered edits registry, see RenderedEdits.edit_text()."""
+    return await rendered_edits.edit_text(
+        message, text, reply_markup=reply_markup, parse_mode=parse_mode
+    )
+
+
+# Global transition metrics instance
+transition_metrics = TransitionMetrics()
+
+# Global rendered edits instance
+rendered_edits = RenderedEdits()
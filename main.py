@@ -12,15 +12,23 @@ from pathlib import Path
 from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
 from aiogram.enums import ParseMode
-from aiogram.fsm.storage.memory import MemoryStorage
 
 # Add app directory to Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from app.core.config import settings
 from app.core.logger import setup_logging, get_logger
-from app.models.base import create_tables
-from app.middlewares import DatabaseMiddleware, LoggingMiddleware, UserMiddleware
+from app.models.base import async_engine, create_tables, create_tables_async
+from app.services.profile_writer import profile_writer
+from app.services.application_writer import application_writer
+from app.services.submission_spool import submission_spool
+from app.services.media import media_registry
+from app.utils.fsm_storage import create_fsm_storage
+from app.utils.keyboards import warm_keyboards
+from app.middlewares import (
+    AnswerOnceMiddleware, CallbackAnswerMiddleware, DatabaseMiddleware,
+    LoggingMiddleware, UserMiddleware
+)
 from app.handlers import routers
 
 
@@ -35,12 +43,31 @@ async def on_startup(bot: Bot) -> None:
     
     # Create database tables
     try:
-        create_tables()
+        if settings.database_async:
+            await create_tables_async()
+        else:
+            create_tables()
         logger.info("Database tables created successfully")
     except Exception as e:
         logger.error(f"Failed to create database tables: {e}")
         raise
     
+    # Start write-behind flushing of profile updates
+    profile_writer.start()
+    
+    # Start batched application inserts if enabled
+    if settings.application_batching:
+        application_writer.start()
+    
+    # Replay submissions spooled during database outages
+    submission_spool.start()
+    
+    # Build static keyboards before the first update
+    warm_keyboards()
+    
+    # Reuse Telegram file ids of the menu photos
+    await media_registry.load()
+    
     # Get bot info
     bot_info = await bot.get_me()
     logger.info(
@@ -71,6 +98,16 @@ async def on_shutdown(bot: Bot) -> None:
     logger = get_logger(__name__)
     logger.info("Bot shutting down...")
     
+    # Flush buffered profile updates before the engine goes away
+    await profile_writer.stop()
+    await application_writer.stop()
+    await submission_spool.stop()
+    await media_registry.stop()
+    
+    # Release pooled async connections
+    if async_engine is not None:
+        await async_engine.dispose()
+    
     # Close bot session
     await bot.session.close()
     logger.info("Bot shutdown completed")
@@ -83,13 +120,17 @@ def create_bot() -> Bot:
     Returns:
         Bot: Configured bot instance
     """
-    return Bot(
+    bot = Bot(
         token=settings.bot_token,
         default=DefaultBotProperties(
             parse_mode=ParseMode.HTML,
             link_preview_is_disabled=True
         )
     )
+    
+    # Late answer() calls after CallbackAnswerMiddleware acknowledged the query
+    bot.session.middleware(AnswerOnceMiddleware())
+    return bot
 
 
 def create_dispatcher() -> Dispatcher:
@@ -99,10 +140,13 @@ def create_dispatcher() -> Dispatcher:
     Returns:
         Dispatcher: Configured dispatcher
     """
-    # Create dispatcher with memory storage
-    dp = Dispatcher(storage=MemoryStorage())
+    # Create dispatcher with the configured FSM storage
+    dp = Dispatcher(storage=create_fsm_storage())
     
     # Register middleware (order matters!)
+    # Acknowledge callback queries first so the deadline covers the other middlewares too
+    dp.callback_query.middleware(CallbackAnswerMiddleware(settings.callback_answer_deadline))
+    
     dp.message.middleware(LoggingMiddleware())
     dp.callback_query.middleware(LoggingMiddleware())
     
@@ -142,6 +186,8 @@ async def main() -> None:
         logger.info(f"Admin IDs: {settings.admin_ids}")
         logger.info(f"Debug mode: {settings.debug}")
         logger.info(f"Database: {settings.database_url}")
+        logger.info(f"Database mode: {'async' if settings.database_async else 'sync'}")
+        logger.info(f"FSM storage: {settings.fsm_storage}")
     except Exception as e:
         logger.error(f"Configuration validation failed: {e}")
         return
@@ -57,9 +57,55 @@ def migrate_database():
         print(f"❌ Migration failed: {e}")
         return False
 
+def migrate_submission_id():
+    """Add applications.submission_id (spool deduplication) on any database from settings."""
+    from sqlalchemy import inspect, text
+    from app.models.base import engine
+    
+    try:
+        inspector = inspect(engine)
+        if not inspector.has_table("applications"):
+            print("⚠️ Table applications not found, it is created with submission_id on startup")
+            return True
+        
+        columns = {column["name"] for column in inspector.get_columns("applications")}
+        if "submission_id" in columns:
+            print("⚠️ Field already exists: submission_id")
+            return True
+        
+        with engine.begin() as conn:
+            conn.execute(text("ALTER TABLE applications ADD COLUMN submission_id VARCHAR(32)"))
+        print("✅ Added field: submission_id")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Failed to add submission_id: {e}")
+        return False
+
+def migrate_indexes():
+    """Create indexes used by admin dashboard queries (any database from settings)."""
+    from app.models import Application, User
+    from app.models.base import engine
+    
+    try:
+        for table in (User.__table__, Application.__table__):
+            for index in table.indexes:
+                # CREATE INDEX only if it does not exist yet
+                index.create(bind=engine, checkfirst=True)
+                print(f"✅ Index ready: {index.name}")
+        
+        print("✅ Index migration completed successfully!")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Index migration failed: {e}")
+        return False
+
 if __name__ == "__main__":
     print("🔄 Starting database migration...")
     success = migrate_database()
+    # The unique index on submission_id needs the column first
+    success = migrate_submission_id() and migrate_indexes() and success
     if success:
         print("🎉 Migration completed!")
     else:
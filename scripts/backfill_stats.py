@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Rebuild the stats_daily / stats_totals rollups from users and applications.
+
+Usage:
+  python3 scripts/backfill_stats.py
+
+Notes:
+- Runs against the database configured in .env (DATABASE_URL / DATABASE_ASYNC).
+- Creates missing tables first, then replaces both rollups in one transaction.
+- Run it once after upgrading an existing database, preferably with the bot stopped.
+"""
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.models.base import (  # noqa: E402
+    AsyncSessionLocal, create_tables, create_tables_async, run_in_session
+)
+from app.services.statistics import StatsRollupService  # noqa: E402
+
+
+async def run() -> None:
+    if AsyncSessionLocal is not None:
+        await create_tables_async()
+    else:
+        create_tables()
+
+    daily, totals = await run_in_session(lambda session: StatsRollupService(session).rebuild())
+    print(f"✅ Rebuilt stats rollups: {daily} daily rows, {totals} totals")
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
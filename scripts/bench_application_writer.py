@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Compare submission latency of per-submission commits and ApplicationWriter batches.
+
+Usage:
+  python3 scripts/bench_application_writer.py [--rounds 200] [--concurrency 1,10,50]
+
+Notes:
+- Runs against a scratch SQLite database in a temporary directory; pass --env-database
+  to use the database configured in .env (benchmark rows are left there).
+- Latency is measured from the submission to the committed row, which is what the
+  user waits for before the confirmation with the application number.
+- "direct" commits every submission in its own transaction (APPLICATION_BATCHING=false),
+  "batched" goes through ApplicationWriter with the configured size and delay.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+from uuid import uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+if "--env-database" not in sys.argv:
+    os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/bench.db"
+    os.environ["DATABASE_ASYNC"] = "false"
+
+from app.core.config import settings  # noqa: E402
+from app.models.application import ApplicationType  # noqa: E402
+from app.models.base import SessionLocal, create_tables, run_in_session  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.services.application import ApplicationService  # noqa: E402
+from app.services.application_writer import ApplicationWriter  # noqa: E402
+
+
+def form_fields() -> dict:
+    return {
+        "type": ApplicationType.SERVICE,
+        "submission_id": uuid4().hex,
+        "name": "Benchmark",
+        "contact": "@benchmark",
+        "service": "0",
+        "description": "Benchmark"
+    }
+
+
+async def submit_direct(user: User) -> None:
+    fields = form_fields()
+    application_type = fields.pop("type")
+    await run_in_session(
+        lambda session: ApplicationService(session).create_application(
+            user, application_type, **fields
+        )
+    )
+
+
+async def measure(submit, rounds: int, concurrency: int) -> List[float]:
+    timings: List[float] = []
+
+    async def submitter(count: int) -> None:
+        for _ in range(count):
+            started = time.perf_counter()
+            await submit()
+            timings.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(submitter(rounds // concurrency) for _ in range(concurrency)))
+    return timings
+
+
+def report(name: str, concurrency: int, timings: List[float], elapsed: float) -> None:
+    values_ms = sorted(v * 1000 for v in timings)
+    p95 = values_ms[int(len(values_ms) * 0.95) - 1]
+    print(
+        f"{name:>7} x{concurrency:<3}: median {statistics.median(values_ms):.2f} ms, "
+        f"p95 {p95:.2f} ms, {len(timings) / elapsed:.0f} submissions/s"
+    )
+
+
+async def run(rounds: int, levels: List[int]) -> None:
+    create_tables()
+    with SessionLocal() as session:
+        user = User(telegram_id=-int(time.time()), first_name="Benchmark")
+        session.add(user)
+        session.commit()
+        session.refresh(user)
+        session.expunge(user)
+
+    for concurrency in levels:
+        started = time.perf_counter()
+        timings = await measure(lambda: submit_direct(user), rounds, concurrency)
+        report("direct", concurrency, timings, time.perf_counter() - started)
+
+        writer = ApplicationWriter(
+            batch_size=settings.application_batch_size,
+            delay=settings.application_batch_delay,
+            max_queue=settings.application_queue_size
+        )
+        writer.start()
+        started = time.perf_counter()
+        timings = await measure(lambda: writer.submit(user, **form_fields()), rounds, concurrency)
+        report("batched", concurrency, timings, time.perf_counter() - started)
+        await writer.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--concurrency", default="1,10,50")
+    parser.add_argument("--env-database", action="store_true")
+    args = parser.parse_args()
+    levels = [int(level) for level in args.concurrency.split(",") if level.strip()]
+    asyncio.run(run(args.rounds, levels))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Compare get/set latency of the FSM storages with MemoryStorage.
+
+Usage:
+  python3 scripts/bench_fsm_storage.py [--rounds 500] [--storages memory,database,redis]
+
+Notes:
+- The database storage uses the database configured in .env (DATABASE_URL / DATABASE_ASYNC).
+- The redis storage needs REDIS_URL and is skipped without it.
+- Each round is one set_state, one set_data (a typical form payload) and a get of both,
+  like a single step of the service form. Benchmark records are cleared afterwards.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aiogram.fsm.storage.base import BaseStorage, StorageKey  # noqa: E402
+from aiogram.fsm.storage.memory import MemoryStorage  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.models.base import AsyncSessionLocal, create_tables, create_tables_async  # noqa: E402
+from app.utils.fsm_storage import DatabaseStorage  # noqa: E402
+
+FORM_DATA = {
+    "name": "Benchmark",
+    "contact": "@benchmark",
+    "service": "🌐 Сайты и веб-приложения",
+    "subcategory": "Лендинг",
+    "budget": "50-100k",
+    "additional_options": ["SEO", "Аналитика"],
+}
+
+
+def build_storage(name: str) -> BaseStorage | None:
+    if name == "memory":
+        return MemoryStorage()
+    if name == "database":
+        return DatabaseStorage(ttl=settings.fsm_state_ttl)
+    if name == "redis":
+        if not settings.redis_url:
+            print("⚠️ redis: REDIS_URL is not set, skipped")
+            return None
+        from app.utils.redis_storage import RedisStorage
+        return RedisStorage.from_url(settings.redis_url, state_ttl=settings.fsm_state_ttl)
+    raise ValueError(f"Unknown storage: {name}")
+
+
+async def bench(storage: BaseStorage, rounds: int) -> Dict[str, List[float]]:
+    timings: Dict[str, List[float]] = {"set": [], "get": []}
+
+    for i in range(rounds):
+        key = StorageKey(bot_id=0, chat_id=-(i % 50) - 1, user_id=-(i % 50) - 1)
+
+        started = time.perf_counter()
+        await storage.set_state(key, "ServiceFormStates:waiting_budget")
+        await storage.set_data(key, {**FORM_DATA, "step": i})
+        timings["set"].append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await storage.get_state(key)
+        await storage.get_data(key)
+        timings["get"].append(time.perf_counter() - started)
+
+    for i in range(50):
+        key = StorageKey(bot_id=0, chat_id=-i - 1, user_id=-i - 1)
+        await storage.set_state(key, None)
+        await storage.set_data(key, {})
+    return timings
+
+
+def report(name: str, timings: Dict[str, List[float]]) -> None:
+    for op, values in timings.items():
+        values_ms = sorted(v * 1000 for v in values)
+        p95 = values_ms[int(len(values_ms) * 0.95) - 1]
+        print(
+            f"{name:>9} {op}: median {statistics.median(values_ms):.3f} ms, "
+            f"p95 {p95:.3f} ms"
+        )
+
+
+async def run(rounds: int, names: List[str]) -> None:
+    if "database" in names:
+        if AsyncSessionLocal is not None:
+            await create_tables_async()
+        else:
+            create_tables()
+
+    for name in names:
+        storage = build_storage(name)
+        if storage is None:
+            continue
+        try:
+            report(name, await bench(storage, rounds))
+        finally:
+            await storage.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--rounds", type=int, default=500)
+    parser.add_argument("--storages", default="memory,database,redis")
+    args = parser.parse_args()
+    storages = [name.strip() for name in args.storages.split(",") if name.strip()]
+    asyncio.run(run(args.rounds, storages))
+
+
+if __name__ == "__main__":
+    main()
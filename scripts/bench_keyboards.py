@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Compare building the service form keyboards per step with the memoized ones.
+
+Usage:
+  python3 scripts/bench_keyboards.py [--rounds 2000]
+
+Notes:
+- One round renders the keyboards of a full service form walk-through:
+  services, subcategories, budget, timeline, content, design, support,
+  three option toggles and the final step.
+- "build" calls the undecorated builders (the previous behaviour), "cached"
+  the memoized ones after warm_keyboards().
+- Peak allocation is measured with tracemalloc over a single round.
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.core.service_categories import SERVICE_NAMES, form_choices  # noqa: E402
+from app.utils import keyboards  # noqa: E402
+
+# (builder, takes the service code)
+STEPS = (
+    (keyboards.create_services_keyboard, False),
+    (keyboards.create_subcategories_keyboard, True),
+    (keyboards.create_budget_keyboard, True),
+    (keyboards.create_timeline_keyboard, False),
+    (keyboards.create_content_keyboard, False),
+    (keyboards.create_design_keyboard, False),
+    (keyboards.create_support_keyboard, False),
+    (keyboards.create_final_step_keyboard, False),
+)
+
+
+def walk(cached: bool) -> Callable[[int], None]:
+    steps = [(step if cached else step.__wrapped__, by_service) for step, by_service in STEPS]
+    options = keyboards._additional_options_keyboard
+    if not cached:
+        options = options.__wrapped__
+
+    def run(service: int) -> None:
+        for step, by_service in steps:
+            if by_service:
+                step(service)
+            else:
+                step()
+        selected: frozenset = frozenset()
+        for code in range(len(form_choices("additional_options", service))):
+            selected = selected | {code}
+            options(service, selected)
+
+    return run
+
+
+def measure(name: str, run: Callable[[int], None], rounds: int) -> None:
+    timings: List[float] = []
+    for i in range(rounds):
+        started = time.perf_counter()
+        run(i % len(SERVICE_NAMES))
+        timings.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    run(0)
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+
+    timings_us = sorted(t * 1_000_000 for t in timings)
+    print(
+        f"{name:>6}: median {statistics.median(timings_us):.1f} µs/form, "
+        f"p95 {timings_us[int(len(timings_us) * 0.95) - 1]:.1f} µs, "
+        f"peak {peak / 1024:.1f} KiB allocated per form"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+
+    keyboards.warm_keyboards()
+    measure("build", walk(cached=False), args.rounds)
+    measure("cached", walk(cached=True), args.rounds)
+
+
+if __name__ == "__main__":
+    main()
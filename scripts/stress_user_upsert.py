@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Fire many simultaneous first contacts from one Telegram user and check that
+exactly one users row comes out of it without errors.
+
+Usage:
+  python3 scripts/stress_user_upsert.py [--concurrency 50] [--telegram-id 999000111]
+
+Notes:
+- Runs against the database configured in .env (DATABASE_URL / DATABASE_ASYNC).
+- Every task uses its own session, like concurrent updates do in the bot.
+- The test user row is deleted before and after the run.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aiogram.types import User as TgUser  # noqa: E402
+from sqlalchemy import delete, func, select  # noqa: E402
+
+from app.models.base import (  # noqa: E402
+    AsyncSessionLocal, SessionLocal, create_tables, create_tables_async, run_in_session
+)
+from app.models.user import User  # noqa: E402
+from app.services.user import UserService  # noqa: E402
+
+
+def first_contact(tg_user: TgUser) -> int:
+    with SessionLocal() as session:
+        user = UserService(session).get_or_create_user(tg_user)
+        session.commit()
+        return user.id
+
+
+async def first_contact_async(tg_user: TgUser) -> int:
+    async with AsyncSessionLocal() as session:
+        user = await session.run_sync(
+            lambda sync_session: UserService(sync_session).get_or_create_user(tg_user)
+        )
+        await session.commit()
+        return user.id
+
+
+async def run(concurrency: int, telegram_id: int) -> int:
+    if AsyncSessionLocal is not None:
+        await create_tables_async()
+    else:
+        create_tables()
+
+    def cleanup(session):
+        session.execute(delete(User).where(User.telegram_id == telegram_id))
+
+    await run_in_session(cleanup)
+
+    tg_user = TgUser(id=telegram_id, is_bot=False, first_name="Stress", username="stress_upsert")
+    if AsyncSessionLocal is not None:
+        tasks = [first_contact_async(tg_user) for _ in range(concurrency)]
+    else:
+        tasks = [asyncio.to_thread(first_contact, tg_user) for _ in range(concurrency)]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    errors = [r for r in results if isinstance(r, BaseException)]
+    ids = {r for r in results if not isinstance(r, BaseException)}
+    rows = await run_in_session(
+        lambda session: session.scalar(
+            select(func.count(User.id)).where(User.telegram_id == telegram_id)
+        )
+    )
+    await run_in_session(cleanup)
+
+    print(f"tasks: {concurrency}, errors: {len(errors)}, distinct ids: {len(ids)}, rows: {rows}")
+    for error in errors[:5]:
+        print(f"  {type(error).__name__}: {error}")
+    return 0 if not errors and len(ids) == 1 and rows == 1 else 1
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Concurrent first-contact check for users upsert")
+    parser.add_argument("--concurrency", type=int, default=50, help="Simultaneous first contacts")
+    parser.add_argument(
+        "--telegram-id", type=int, default=999000111, help="Telegram ID of the test user"
+    )
+    args = parser.parse_args()
+    return asyncio.run(run(args.concurrency, args.telegram_id))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,244 @@
+"""
+Shared fixtures: a file-backed SQLite database and a bot whose Bot API
+requests are answered locally after a simulated network delay.
+"""
+
+import asyncio
+import itertools
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Configure settings before anything from app is imported
+TEST_DIR = tempfile.mkdtemp(prefix="noface-tests-")
+os.environ["BOT_TOKEN"] = "123456:TEST-TOKEN"
+os.environ["ADMIN_IDS"] = "1000"
+os.environ["DATABASE_URL"] = f"sqlite:///{TEST_DIR}/test.db"
+os.environ["SUBMISSION_SPOOL_PATH"] = f"{TEST_DIR}/submissions.spool"
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest  # noqa: E402
+from aiogram import Bot  # noqa: E402
+from aiogram.client.session.base import BaseSession  # noqa: E402
+from aiogram.fsm.context import FSMContext  # noqa: E402
+from aiogram.fsm.storage.base import StorageKey  # noqa: E402
+from aiogram.methods import (  # noqa: E402
+    EditMessageCaption, EditMessageMedia, EditMessageText, SendMessage, SendPhoto, TelegramMethod
+)
+from aiogram.types import Message, Update  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.core.service_categories import CATALOG_VERSION  # noqa: E402
+from app.core.states import ServiceFormStates  # noqa: E402
+from app.middlewares import AnswerOnceMiddleware  # noqa: E402
+from app.models.application import Application  # noqa: E402
+from app.models.base import Base, SessionLocal, engine  # noqa: E402
+from app.services.media import media_registry  # noqa: E402
+from app.services.statistics import dashboard_cache  # noqa: E402
+from app.services.submission_spool import submission_spool  # noqa: E402
+from app.services.user import user_cache  # noqa: E402
+from app.utils.fsm_storage import create_fsm_storage  # noqa: E402
+from sqlalchemy import func, select  # noqa: E402
+from main import create_dispatcher  # noqa: E402
+
+# Bot API round trip simulated for every request
+API_LATENCY = 0.05
+
+# Completed service form as the service flow stores it (choice codes)
+SERVICE_FORM = {
+    "catalog": CATALOG_VERSION,
+    "service": 0,
+    "subcategory": 1,
+    "budget": 2,
+    "timeline": 0,
+    "has_content": 1,
+    "has_design": 0,
+    "support_level": 2,
+    "additional_options": [0, 2],
+    "description": "Test project",
+    "name": "Test",
+    "contact": "@test"
+}
+
+
+class FakeSession(BaseSession):
+    """Answers Bot API requests locally after ``latency`` seconds and records them."""
+    
+    def __init__(self, latency: float = API_LATENCY):
+        super().__init__()
+        self.latency = latency
+        self.requests: List[TelegramMethod] = []
+        self._message_ids = itertools.count(1)
+    
+    async def make_request(
+        self,
+        bot: Bot,
+        method: TelegramMethod,
+        timeout: Optional[int] = None
+    ) -> Any:
+        self.requests.append(method)
+        await asyncio.sleep(self.latency)
+        
+        if isinstance(method, (SendMessage, SendPhoto)):
+            return self._message(bot, method.chat_id, next(self._message_ids), method)
+        if isinstance(method, (EditMessageText, EditMessageCaption, EditMessageMedia)):
+            return self._message(bot, method.chat_id, method.message_id, method, edited=True)
+        return True
+    
+    async def stream_content(self, *args: Any, **kwargs: Any):
+        raise NotImplementedError
+        yield b""
+    
+    async def close(self) -> None:
+        pass
+    
+    def sent(self, method_type: type) -> List[TelegramMethod]:
+        """Recorded requests of one method type."""
+        return [method for method in self.requests if isinstance(method, method_type)]
+    
+    @staticmethod
+    def _message(
+        bot: Bot,
+        chat_id: int,
+        message_id: int,
+        method: TelegramMethod,
+        edited: bool = False
+    ) -> Message:
+        now = int(time.time())
+        data: Dict[str, Any] = {
+            "message_id": message_id,
+            "date": now,
+            "chat": {"id": chat_id, "type": "private"},
+            "reply_markup": getattr(method, "reply_markup", None)
+        }
+        if edited:
+            data["edit_date"] = now
+        if isinstance(method, SendPhoto):
+            data["photo"] = [{
+                "file_id": f"photo-{message_id}", "file_unique_id": f"unique-{message_id}",
+                "width": 1, "height": 1
+            }]
+            data["caption"] = method.caption
+        elif isinstance(method, EditMessageMedia):
+            data["photo"] = [{
+                "file_id": f"photo-{message_id}", "file_unique_id": f"unique-{message_id}",
+                "width": 1, "height": 1
+            }]
+        else:
+            data["text"] = getattr(method, "text", None) or getattr(method, "caption", None) or ""
+        return Message.model_validate(data, context={"bot": bot})
+
+
+_update_ids = itertools.count(1)
+
+
+def user_data(user_id: int) -> Dict[str, Any]:
+    """Telegram user payload of a test user."""
+    return {
+        "id": user_id,
+        "is_bot": False,
+        "first_name": f"User {user_id}",
+        "username": f"user{user_id}"
+    }
+
+
+def message_update(user_id: int, text: str) -> Update:
+    """Private chat text message update."""
+    return Update.model_validate({
+        "update_id": next(_update_ids),
+        "message": {
+            "message_id": next(_update_ids),
+            "date": int(time.time()),
+            "chat": {"id": user_id, "type": "private"},
+            "from": user_data(user_id),
+            "text": text
+        }
+    })
+
+
+def callback_update(
+    user_id: int,
+    data: str,
+    message_id: int = 1,
+    photo: bool = False,
+    edit_date: Optional[int] = None
+) -> Update:
+    """Callback query update for a button of a bot message."""
+    message: Dict[str, Any] = {
+        "message_id": message_id,
+        "date": int(time.time()),
+        "chat": {"id": user_id, "type": "private"},
+        "edit_date": edit_date
+    }
+    if photo:
+        message["photo"] = [{"file_id": "menu", "file_unique_id": "menu", "width": 1, "height": 1}]
+    else:
+        message["text"] = "screen"
+    
+    return Update.model_validate({
+        "update_id": next(_update_ids),
+        "callback_query": {
+            "id": str(next(_update_ids)),
+            "from": user_data(user_id),
+            "chat_instance": "test",
+            "message": message,
+            "data": data
+        }
+    })
+
+
+def applications_count() -> int:
+    """Number of saved applications."""
+    with SessionLocal() as session:
+        return session.scalar(select(func.count(Application.id)))
+
+
+async def fill_service_form(dispatcher, bot: Bot, user_id: int, **changes: Any) -> None:
+    """Put a user's service form on the confirmation step."""
+    key = StorageKey(bot_id=bot.id, chat_id=user_id, user_id=user_id)
+    state = FSMContext(storage=dispatcher.storage, key=key)
+    await state.set_state(ServiceFormStates.waiting_for_contact)
+    await state.set_data({**SERVICE_FORM, **changes})
+
+
+@pytest.fixture
+def database():
+    """Empty database, caches and submission spool."""
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    user_cache.clear()
+    dashboard_cache.invalidate()
+    media_registry._file_ids.clear()
+    spool_paths = (
+        submission_spool.path, submission_spool.replay_path, submission_spool.quarantine_path
+    )
+    for path in spool_paths:
+        if os.path.exists(path):
+            os.remove(path)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def bot():
+    """Bot talking to a FakeSession, with the request middlewares of create_bot()."""
+    bot = Bot(token=settings.bot_token, session=FakeSession())
+    bot.session.middleware(AnswerOnceMiddleware())
+    return bot
+
+
+@pytest.fixture(scope="session")
+def production_dispatcher():
+    """Dispatcher configured like in production (routers attach only once)."""
+    return create_dispatcher()
+
+
+@pytest.fixture
+def dispatcher(database, production_dispatcher):
+    """Production dispatcher with a fresh FSM storage from settings."""
+    production_dispatcher.fsm.storage = create_fsm_storage()
+    return production_dispatcher
@@ -0,0 +1,36 @@
+"""
+Admin panel screens re-rendered with the 🔄 buttons.
+"""
+
+import asyncio
+import time
+
+from aiogram.methods import EditMessageText
+
+from app.services.statistics import dashboard_cache
+from app.utils.transitions import rendered_edits
+from conftest import callback_update
+
+ADMIN_ID = 1000
+
+
+def test_refresh_without_changes_is_not_sent(dispatcher, bot):
+    message_id = 700
+    skipped = rendered_edits.skipped
+    
+    async def run():
+        await dispatcher.feed_update(bot, callback_update(ADMIN_ID, "admin_stats", message_id))
+        
+        # A new snapshot of the same data, taken in another second
+        dashboard_cache.invalidate()
+        await asyncio.sleep(1.1 - time.time() % 1)
+        
+        _, edit_date = rendered_edits._digests.get((ADMIN_ID, message_id))
+        await dispatcher.feed_update(
+            bot, callback_update(ADMIN_ID, "admin_stats", message_id, edit_date=edit_date)
+        )
+    
+    asyncio.run(run())
+    
+    assert len(bot.session.sent(EditMessageText)) == 1
+    assert rendered_edits.skipped == skipped + 1
@@ -0,0 +1,140 @@
+"""
+Batched application inserts of ApplicationWriter.
+"""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.exc import OperationalError
+
+from app.models.application import Application, ApplicationType
+from app.models.base import SessionLocal
+from app.models.user import User
+from app.services import application_writer as writer_module
+from app.services.application_writer import ApplicationWriter
+from conftest import applications_count
+
+USER_ID = 9500
+
+
+@pytest.fixture
+def user(database):
+    with SessionLocal() as session:
+        user = User(telegram_id=USER_ID, first_name="Test")
+        session.add(user)
+        session.commit()
+        session.refresh(user)
+        session.expunge(user)
+    return user
+
+
+def service_fields():
+    return {
+        "type": ApplicationType.SERVICE,
+        "submission_id": uuid4().hex,
+        "name": "Test",
+        "contact": "@test",
+        "service": "0"
+    }
+
+
+def team_fields():
+    return {
+        "type": ApplicationType.TEAM,
+        "submission_id": uuid4().hex,
+        "name": "Test",
+        "contact": "@test",
+        "activity": "Design"
+    }
+
+
+def test_full_batch_is_written_without_waiting(user):
+    writer = ApplicationWriter(batch_size=3, delay=10, max_queue=100)
+    
+    async def run():
+        writer.start()
+        try:
+            submissions = [writer.submit(user, **service_fields()) for _ in range(3)]
+            return await asyncio.wait_for(asyncio.gather(*submissions), 1)
+        finally:
+            await writer.stop()
+    
+    applications = asyncio.run(run())
+    
+    assert writer.batches == 1
+    assert all(application.id is not None for application in applications)
+    assert all(application.user is user for application in applications)
+    assert applications_count() == 3
+
+
+def test_partial_batch_is_written_after_delay(user):
+    writer = ApplicationWriter(batch_size=50, delay=0.05, max_queue=100)
+    
+    async def run():
+        writer.start()
+        try:
+            submissions = [writer.submit(user, **service_fields()) for _ in range(2)]
+            started = asyncio.get_running_loop().time()
+            applications = await asyncio.gather(*submissions)
+            return applications, asyncio.get_running_loop().time() - started
+        finally:
+            await writer.stop()
+    
+    applications, waited = asyncio.run(run())
+    
+    assert writer.batches == 1
+    assert len(applications) == 2
+    assert 0.05 <= waited < 1
+
+
+def test_mixed_batch_keeps_each_submission(user):
+    writer = ApplicationWriter(batch_size=4, delay=10, max_queue=100)
+    submitted = [service_fields(), team_fields(), team_fields(), service_fields()]
+    
+    async def run():
+        writer.start()
+        try:
+            return await asyncio.gather(*(writer.submit(user, **fields) for fields in submitted))
+        finally:
+            await writer.stop()
+    
+    applications = asyncio.run(run())
+    
+    # Каждый отправитель получает свою строку, даже если столбцы у строк разные
+    assert writer.batches == 1
+    assert [a.submission_id for a in applications] == [f["submission_id"] for f in submitted]
+    with SessionLocal() as session:
+        stored = {
+            application.submission_id: application
+            for application in session.scalars(select(Application))
+        }
+    for fields in submitted:
+        application = stored[fields["submission_id"]]
+        assert application.type == fields["type"]
+        assert application.service == fields.get("service")
+        assert application.activity == fields.get("activity")
+
+
+def test_failed_batch_fails_each_submitter(user, monkeypatch):
+    writer = ApplicationWriter(batch_size=3, delay=10, max_queue=100)
+    
+    async def failing_session(fn):
+        raise OperationalError("INSERT", {}, Exception("database is locked"))
+    
+    monkeypatch.setattr(writer_module, "run_in_session", failing_session)
+    
+    async def run():
+        writer.start()
+        try:
+            submissions = [writer.submit(user, **service_fields()) for _ in range(3)]
+            return await asyncio.gather(*submissions, return_exceptions=True)
+        finally:
+            await writer.stop()
+    
+    results = asyncio.run(run())
+    
+    assert [type(result) for result in results] == [OperationalError] * 3
+    assert writer.batches == 0
+    assert applications_count() == 0
@@ -0,0 +1,54 @@
+"""
+Callback query answers under the early answer deadline.
+"""
+
+import asyncio
+
+from aiogram.fsm.context import FSMContext
+from aiogram.fsm.storage.base import StorageKey
+from aiogram.fsm.storage.memory import MemoryStorage
+from aiogram.methods import AnswerCallbackQuery
+
+from app.core.config import settings
+from app.core.states import ServiceFormStates
+from app.handlers.services import UNKNOWN_CHOICE_ALERT
+from conftest import SERVICE_FORM, callback_update, message_update
+
+USER_ID = 8000
+ADMIN_ID = 1000
+
+
+class SlowStorage(MemoryStorage):
+    """Memory storage whose reads take longer than the early answer deadline."""
+    
+    async def get_data(self, key):
+        await asyncio.sleep(settings.callback_answer_deadline * 2)
+        return await super().get_data(key)
+
+
+def answers(bot):
+    return [(answer.text, answer.show_alert) for answer in bot.session.sent(AnswerCallbackQuery)]
+
+
+def test_alert_after_slow_fsm_read_is_delivered(dispatcher, bot):
+    dispatcher.fsm.storage = SlowStorage()
+    key = StorageKey(bot_id=bot.id, chat_id=USER_ID, user_id=USER_ID)
+    state = FSMContext(storage=dispatcher.storage, key=key)
+    
+    async def run():
+        await dispatcher.feed_update(bot, message_update(USER_ID, "/start"))
+        await state.set_state(ServiceFormStates.waiting_for_budget)
+        await state.set_data({"service": SERVICE_FORM["service"], "subcategory": 0})
+        await dispatcher.feed_update(bot, callback_update(USER_ID, "bg:99"))
+    
+    asyncio.run(run())
+    
+    assert answers(bot) == [(UNKNOWN_CHOICE_ALERT, True)]
+
+
+def test_broadcast_alert_after_slow_fsm_read_is_delivered(dispatcher, bot):
+    dispatcher.fsm.storage = SlowStorage()
+    
+    asyncio.run(dispatcher.feed_update(bot, callback_update(ADMIN_ID, "broadcast_confirm")))
+    
+    assert answers(bot) == [("❌ Ошибка: сообщение не найдено", True)]
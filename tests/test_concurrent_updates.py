@@ -0,0 +1,77 @@
+"""
+Concurrent updates fed through the dispatcher and its middlewares.
+"""
+
+import asyncio
+import time
+
+from aiogram.methods import SendPhoto
+from sqlalchemy import func, select
+
+from app.models.base import SessionLocal
+from app.models.stats import StatsTotal
+from app.models.user import User
+from app.services.statistics import METRIC_USERS
+from conftest import message_update
+
+# A lock held across Bot API calls makes waiters time out after 5 s (SQLite busy timeout)
+MAX_SECONDS = 2.0
+
+
+def feed_concurrently(dispatcher, bot, updates):
+    """Feed updates at once; returns (results or exceptions, seconds taken)."""
+    async def run():
+        start = time.monotonic()
+        results = await asyncio.gather(
+            *(dispatcher.feed_update(bot, update) for update in updates),
+            return_exceptions=True
+        )
+        return results, time.monotonic() - start
+    
+    return asyncio.run(run())
+
+
+def user_rows():
+    """Number of users rows per telegram_id."""
+    with SessionLocal() as session:
+        return dict(session.execute(
+            select(User.telegram_id, func.count(User.id)).group_by(User.telegram_id)
+        ).all())
+
+
+def test_concurrent_first_contacts(dispatcher, bot):
+    user_ids = range(2000, 2010)
+    
+    results, elapsed = feed_concurrently(
+        dispatcher, bot, [message_update(user_id, "/start") for user_id in user_ids]
+    )
+    
+    assert [r for r in results if isinstance(r, BaseException)] == []
+    assert elapsed < MAX_SECONDS
+    assert user_rows() == {user_id: 1 for user_id in user_ids}
+    assert len(bot.session.sent(SendPhoto)) == len(user_ids)
+    
+    with SessionLocal() as session:
+        users_total = session.scalar(
+            select(func.sum(StatsTotal.value)).where(StatsTotal.metric == METRIC_USERS)
+        )
+    assert users_total == len(user_ids)
+
+
+def test_concurrent_first_updates_from_one_user(dispatcher, bot):
+    user_id = 2100
+    updates = [message_update(user_id, "/start") for _ in range(20)]
+    
+    results, elapsed = feed_concurrently(dispatcher, bot, updates)
+    
+    # Every update reached the handler with the same user, none hit IntegrityError
+    assert [r for r in results if isinstance(r, BaseException)] == []
+    assert elapsed < MAX_SECONDS
+    assert user_rows() == {user_id: 1}
+    assert len(bot.session.sent(SendPhoto)) == len(updates)
+    
+    with SessionLocal() as session:
+        users_total = session.scalar(
+            select(func.sum(StatsTotal.value)).where(StatsTotal.metric == METRIC_USERS)
+        )
+    assert users_total == 1
@@ -0,0 +1,87 @@
+"""
+Service application confirmation: database write, spool fallback, FSM.
+"""
+
+import asyncio
+import time
+
+from aiogram.methods import AnswerCallbackQuery, SendMessage, SendPhoto
+from sqlalchemy import func, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.models.base import SessionLocal
+from app.models.fsm import FsmRecord
+from app.services.media import media_registry
+from app.services.submission_spool import submission_spool
+from app.utils.fsm_storage import DatabaseStorage
+from conftest import applications_count, callback_update, fill_service_form, message_update
+
+USER_ID = 4000
+
+
+def test_commit_failure_spools_submission(dispatcher, bot, monkeypatch):
+    commit = Session.commit
+    failures = []
+    
+    def commit_once_failing(session):
+        if not failures:
+            failures.append(session)
+            raise OperationalError("COMMIT", {}, Exception("database is locked"))
+        return commit(session)
+    
+    async def run():
+        await dispatcher.feed_update(bot, message_update(USER_ID, "/start"))
+        await fill_service_form(dispatcher, bot, USER_ID)
+        # Let the menu photo's file_id be stored before commits start failing
+        await media_registry.stop()
+        
+        with monkeypatch.context() as patch:
+            patch.setattr(Session, "commit", commit_once_failing)
+            await dispatcher.feed_update(bot, callback_update(USER_ID, "confirm_application"))
+    
+    asyncio.run(run())
+    
+    # The user was told the application is queued, and the admin got it
+    assert len(failures) == 1
+    assert "в очереди на сохранение" in bot.session.sent(SendPhoto)[-1].caption
+    assert [m.chat_id for m in bot.session.sent(SendMessage)] == [1000]
+    assert applications_count() == 0
+    assert submission_spool.pending_bytes > 0
+    
+    assert asyncio.run(submission_spool.replay()) == 1
+    assert applications_count() == 1
+
+
+def test_confirm_with_database_fsm_storage(dispatcher, bot):
+    dispatcher.fsm.storage = DatabaseStorage(ttl=3600)
+    
+    async def run():
+        await dispatcher.feed_update(bot, message_update(USER_ID, "/start"))
+        await fill_service_form(dispatcher, bot, USER_ID)
+        
+        start = time.monotonic()
+        await dispatcher.feed_update(bot, callback_update(USER_ID, "confirm_application"))
+        return time.monotonic() - start
+    
+    elapsed = asyncio.run(run())
+    
+    assert elapsed < 2.0
+    assert applications_count() == 1
+    assert submission_spool.pending_bytes == 0
+    assert "#1" in bot.session.sent(SendPhoto)[-1].caption
+    with SessionLocal() as session:
+        assert session.scalar(select(func.count()).select_from(FsmRecord)) == 0
+
+
+def test_confirm_answers_callback_with_its_text(dispatcher, bot):
+    async def run():
+        await dispatcher.feed_update(bot, message_update(USER_ID, "/start"))
+        await fill_service_form(dispatcher, bot, USER_ID)
+        await dispatcher.feed_update(bot, callback_update(USER_ID, "confirm_application"))
+    
+    asyncio.run(run())
+    
+    # Answered by the handler before the slow part, not by the deadline fallback
+    answers = bot.session.sent(AnswerCallbackQuery)
+    assert [answer.text for answer in answers] == ["📤 Отправляем заявку..."]
@@ -0,0 +1,120 @@
+"""
+Form answer codes coming from callback data and FSM data.
+"""
+
+import asyncio
+
+from aiogram.fsm.context import FSMContext
+from aiogram.fsm.storage.base import StorageKey
+from aiogram.methods import AnswerCallbackQuery
+
+from app.core.states import ServiceFormStates
+from app.handlers.services import FORM_EXPIRED_TEXT, UNKNOWN_CHOICE_ALERT
+from app.utils.keyboards import _additional_options_keyboard
+from conftest import SERVICE_FORM, applications_count, callback_update, message_update
+
+USER_ID = 5000
+
+
+def form_state(dispatcher, bot, user_id=USER_ID):
+    key = StorageKey(bot_id=bot.id, chat_id=user_id, user_id=user_id)
+    return FSMContext(storage=dispatcher.storage, key=key)
+
+
+def test_unknown_option_code_is_rejected(dispatcher, bot):
+    state = form_state(dispatcher, bot)
+    
+    async def run():
+        await dispatcher.feed_update(bot, message_update(USER_ID, "/start"))
+        await state.set_state(ServiceFormStates.waiting_for_additional_options)
+        await state.set_data({"service": SERVICE_FORM["service"], "additional_options": []})
+        
+        _additional_options_keyboard.cache_clear()
+        for code in (99, -1, 1):
+            await dispatcher.feed_update(bot, callback_update(USER_ID, f"op:{code}"))
+        return await state.get_data()
+    
+    data = asyncio.run(run())
+    
+    assert data["additional_options"] == [1]
+    assert _additional_options_keyboard.cache_info().currsize == 1
+    alerts = [answer for answer in bot.session.sent(AnswerCallbackQuery) if answer.show_alert]
+    assert len(alerts) == 2
+
+
+def test_unknown_answer_code_resets_form(dispatcher, bot):
+    state = form_state(dispatcher, bot)
+    
+    async def run():
+        await dispatcher.feed_update(bot, message_update(USER_ID, "/start"))
+        await state.set_state(ServiceFormStates.waiting_for_contact)
+        await state.set_data({**SERVICE_FORM, "budget": 99})
+        await dispatcher.feed_update(bot, callback_update(USER_ID, "confirm_application"))
+        return await state.get_state()
+    
+    assert asyncio.run(run()) is None
+    answers = bot.session.sent(AnswerCallbackQuery)
+    assert [(answer.text, answer.show_alert) for answer in answers] == [(FORM_EXPIRED_TEXT, True)]
+    assert applications_count() == 0
+
+
+def test_unknown_button_code_is_rejected(dispatcher, bot):
+    state = form_state(dispatcher, bot)
+    
+    async def run():
+        await dispatcher.feed_update(bot, message_update(USER_ID, "/start"))
+        await state.set_state(ServiceFormStates.waiting_for_budget)
+        await state.set_data({"service": SERVICE_FORM["service"], "subcategory": 0})
+        await dispatcher.feed_update(bot, callback_update(USER_ID, "bg:99"))
+        return await state.get_state()
+    
+    assert asyncio.run(run()) == ServiceFormStates.waiting_for_budget.state
+    answers = bot.session.sent(AnswerCallbackQuery)
+    assert [(answer.text, answer.show_alert) for answer in answers] == [
+        (UNKNOWN_CHOICE_ALERT, True)
+    ]
+
+
+def test_form_of_another_catalog_is_reset(dispatcher, bot):
+    state = form_state(dispatcher, bot)
+    
+    async def run():
+        await dispatcher.feed_update(bot, message_update(USER_ID, "/start"))
+        await dispatcher.feed_update(bot, callback_update(USER_ID, "order_service", photo=True))
+        started = await state.get_data()
+        
+        # Каталог переупорядочили, пока форма ждала ответа
+        await state.set_state(ServiceFormStates.waiting_for_contact)
+        await state.set_data({**SERVICE_FORM, "catalog": "0badc0de"})
+        await dispatcher.feed_update(bot, callback_update(USER_ID, "confirm_application"))
+        return started, await state.get_state()
+    
+    started, final_state = asyncio.run(run())
+    
+    assert started == {"catalog": SERVICE_FORM["catalog"]}
+    assert final_state is None
+    alerts = [(answer.text, answer.show_alert) for answer in bot.session.sent(AnswerCallbackQuery)]
+    assert alerts[-1] == (FORM_EXPIRED_TEXT, True)
+    assert applications_count() == 0
+
+
+def test_back_after_confirm_asks_to_start_over(dispatcher, bot):
+    state = form_state(dispatcher, bot)
+    
+    async def run():
+        await dispatcher.feed_update(bot, message_update(USER_ID, "/start"))
+        await state.set_state(ServiceFormStates.waiting_for_contact)
+        await state.set_data(SERVICE_FORM)
+        await dispatcher.feed_update(bot, callback_update(USER_ID, "confirm_application"))
+        
+        # Кнопки «Назад» старых экранов остаются у пользователя после отправки
+        for data in ("back_to_subcategory", "back_to_budget", "back_to_options"):
+            await dispatcher.feed_update(bot, callback_update(USER_ID, data))
+        return await state.get_state()
+    
+    assert asyncio.run(run()) is None
+    answers = bot.session.sent(AnswerCallbackQuery)
+    assert [(answer.text, answer.show_alert) for answer in answers[-3:]] == [
+        (FORM_EXPIRED_TEXT, True)
+    ] * 3
+    assert applications_count() == 1
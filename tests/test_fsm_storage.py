@@ -0,0 +1,137 @@
+"""
+Durable FSM storages: Redis combined writes, database expiry and purge.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+from aiogram.fsm.storage.base import StorageKey
+from sqlalchemy import select, update
+
+from app.core.states import ServiceFormStates
+from app.models.base import SessionLocal
+from app.models.fsm import FsmRecord
+from app.utils.fsm_storage import DatabaseStorage
+from app.utils.redis_storage import RedisStorage
+
+BOT_ID = 42
+
+
+def storage_key(user_id: int) -> StorageKey:
+    return StorageKey(bot_id=BOT_ID, chat_id=user_id, user_id=user_id)
+
+
+class StubPipeline:
+    """Records the commands queued on a Redis pipeline."""
+    
+    def __init__(self, redis, transaction):
+        self.redis = redis
+        self.transaction = transaction
+        self.commands = []
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        pass
+    
+    def set(self, name, value, ex=None):
+        self.commands.append(("set", name, value, ex))
+    
+    def delete(self, name):
+        self.commands.append(("delete", name))
+    
+    async def execute(self):
+        self.redis.executed.append((self.transaction, self.commands))
+
+
+class StubRedis:
+    """Redis client stand-in that only hands out pipelines."""
+    
+    def __init__(self):
+        self.executed = []
+    
+    def pipeline(self, transaction=True):
+        return StubPipeline(self, transaction)
+
+
+def test_redis_set_record_is_one_transaction():
+    redis = StubRedis()
+    storage = RedisStorage(redis=redis, state_ttl=60, data_ttl=120)
+    key = storage_key(1)
+    state_key = storage.key_builder.build(key, "state")
+    data_key = storage.key_builder.build(key, "data")
+    
+    async def run():
+        await storage.set_record(key, ServiceFormStates.waiting_for_budget, {"service": 0})
+        await storage.set_record(key, None, {})
+    
+    asyncio.run(run())
+    
+    assert redis.executed == [
+        (True, [
+            ("set", state_key, ServiceFormStates.waiting_for_budget.state, 60),
+            ("set", data_key, '{"service": 0}', 120)
+        ]),
+        (True, [("delete", state_key), ("delete", data_key)])
+    ]
+
+
+def expire(key: StorageKey, storage: DatabaseStorage) -> None:
+    """Move a record's expiry into the past."""
+    with SessionLocal() as session:
+        session.execute(
+            update(FsmRecord)
+            .where(FsmRecord.key == storage.key_builder.build(key))
+            .values(expires_at=datetime.utcnow() - timedelta(seconds=1))
+        )
+        session.commit()
+
+
+def stored_keys():
+    with SessionLocal() as session:
+        return set(session.scalars(select(FsmRecord.key)))
+
+
+def test_database_record_expires(database):
+    storage = DatabaseStorage(ttl=3600)
+    key = storage_key(1)
+    
+    async def run():
+        await storage.set_record(key, ServiceFormStates.waiting_for_budget, {"service": 0})
+        expire(key, storage)
+        expired = await storage.get_state(key), await storage.get_data(key)
+        
+        # Запись поверх истёкшей не наследует старые данные
+        await storage.set_state(key, ServiceFormStates.waiting_for_timeline)
+        return expired, await storage.get_state(key), await storage.get_data(key)
+    
+    expired, state, data = asyncio.run(run())
+    
+    assert expired == (None, {})
+    assert state == ServiceFormStates.waiting_for_timeline.state
+    assert data == {}
+
+
+def test_database_purges_expired_records(database):
+    storage = DatabaseStorage(ttl=3600)
+    old, live, new = storage_key(1), storage_key(2), storage_key(3)
+    
+    async def run():
+        await storage.set_record(old, ServiceFormStates.waiting_for_budget, {"service": 0})
+        await storage.set_record(live, ServiceFormStates.waiting_for_budget, {"service": 1})
+        expire(old, storage)
+        
+        # Следующая очистка только через PURGE_INTERVAL
+        await storage.set_state(new, ServiceFormStates.waiting_for_service)
+        before_purge = stored_keys()
+        
+        storage._next_purge = 0.0
+        await storage.set_state(new, ServiceFormStates.waiting_for_subcategory)
+        return before_purge, stored_keys()
+    
+    before_purge, after_purge = asyncio.run(run())
+    
+    build = storage.key_builder.build
+    assert before_purge == {build(old), build(live), build(new)}
+    assert after_purge == {build(live), build(new)}
@@ -0,0 +1,47 @@
+"""
+Media registry: file_ids are stored without holding up the send.
+"""
+
+import asyncio
+import sqlite3
+import time
+
+from sqlalchemy import select
+
+from app.models.base import SessionLocal
+from app.models.media import MediaFile
+from app.services.media import MAIN_MENU_PHOTO, media_registry
+from conftest import message_update
+
+USER_ID = 5000
+
+
+def test_send_does_not_wait_for_file_id_write(dispatcher, bot, database):
+    async def run():
+        # Cache the user, then forget the photo so the next /start uploads it again
+        await dispatcher.feed_update(bot, message_update(USER_ID, "/start"))
+        await media_registry.stop()
+        media_registry._file_ids.clear()
+        with SessionLocal.begin() as session:
+            session.query(MediaFile).delete()
+        
+        # Another writer holds the SQLite write lock
+        lock = sqlite3.connect(database.url.database, isolation_level=None)
+        lock.execute("BEGIN IMMEDIATE")
+        try:
+            start = time.monotonic()
+            await dispatcher.feed_update(bot, message_update(USER_ID, "/start"))
+            elapsed = time.monotonic() - start
+        finally:
+            lock.execute("COMMIT")
+            lock.close()
+        
+        await media_registry.stop()
+        return elapsed
+    
+    elapsed = asyncio.run(run())
+    
+    assert elapsed < 1.0
+    assert MAIN_MENU_PHOTO in media_registry._file_ids
+    with SessionLocal() as session:
+        assert session.scalar(select(MediaFile.file_id).where(MediaFile.url == MAIN_MENU_PHOTO))
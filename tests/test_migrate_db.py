@@ -0,0 +1,24 @@
+"""
+migrate_db.py against the configured database.
+"""
+
+from sqlalchemy import inspect, text
+
+import migrate_db
+
+
+def test_submission_id_added_before_its_index(database):
+    with database.begin() as conn:
+        conn.execute(text("DROP INDEX ux_applications_submission_id"))
+        conn.execute(text("ALTER TABLE applications DROP COLUMN submission_id"))
+    
+    assert migrate_db.migrate_submission_id()
+    assert migrate_db.migrate_indexes()
+    # Idempotent
+    assert migrate_db.migrate_submission_id()
+    
+    inspector = inspect(database)
+    assert "submission_id" in {column["name"] for column in inspector.get_columns("applications")}
+    assert "ux_applications_submission_id" in {
+        index["name"] for index in inspector.get_indexes("applications")
+    }
@@ -0,0 +1,110 @@
+"""
+Keyset pagination of admin lists and its callback cursors.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.application import Application, ApplicationType
+from app.models.base import SessionLocal
+from app.models.user import User
+from app.utils.pagination import (
+    NEWER,
+    OLDER,
+    encode_cursor,
+    keyset_page,
+    parse_page_callback
+)
+
+PAGE_SIZE = 4
+
+
+@pytest.fixture
+def applications(database):
+    """Ten applications, created in groups of three sharing created_at."""
+    started = datetime(2026, 1, 1, 12, 0, 0, 123456)
+    with SessionLocal() as session:
+        user = User(telegram_id=8000, first_name="Test")
+        session.add(user)
+        session.flush()
+        session.add_all(
+            Application(
+                user_id=user.id,
+                type=ApplicationType.SERVICE,
+                name=f"Test {i}",
+                contact="@test",
+                created_at=started + timedelta(minutes=i // 3)
+            )
+            for i in range(10)
+        )
+        session.commit()
+        ordered = session.query(Application).all()
+        return [
+            a.id for a in sorted(ordered, key=lambda a: (a.created_at, a.id), reverse=True)
+        ]
+
+
+def page_ids(session, cursor=None, direction=OLDER):
+    page = keyset_page(session.query(Application), Application, cursor, direction, PAGE_SIZE)
+    return page, [application.id for application in page.items]
+
+
+def cursor_of(encoded):
+    return parse_page_callback(f"admin_apps_all:{OLDER}{encoded}")[2]
+
+
+def test_pages_cover_ties_once(applications):
+    seen = []
+    with SessionLocal() as session:
+        page, ids = page_ids(session)
+        seen += ids
+        while page.has_older:
+            page, ids = page_ids(session, cursor_of(page.last_cursor))
+            seen += ids
+    
+    assert seen == applications
+
+
+def test_paging_back_returns_previous_pages(applications):
+    with SessionLocal() as session:
+        first, first_ids = page_ids(session)
+        second, second_ids = page_ids(session, cursor_of(first.last_cursor))
+        third, third_ids = page_ids(session, cursor_of(second.last_cursor))
+        
+        back, back_ids = page_ids(session, cursor_of(third.first_cursor), NEWER)
+        assert back_ids == second_ids
+        assert (back.has_newer, back.has_older) == (True, True)
+        
+        # Подход к началу списка показывает полную первую страницу
+        top, top_ids = page_ids(session, cursor_of(back.first_cursor), NEWER)
+        assert top_ids == first_ids
+        assert (top.has_newer, top.has_older) == (False, True)
+    
+    assert third_ids == applications[2 * PAGE_SIZE:]
+    assert not third.has_older
+
+
+def test_cursor_round_trip(applications):
+    with SessionLocal() as session:
+        application = session.get(Application, applications[0])
+        data = f"admin_apps_all:{NEWER}{encode_cursor(application)}"
+        
+        assert parse_page_callback(data) == (
+            "admin_apps_all", NEWER, (application.created_at, application.id)
+        )
+
+
+@pytest.mark.parametrize("position", [
+    "",
+    ">",
+    ">1k2x9f8s0w",
+    ">1k2x9f8s0w.2n.1",
+    ">1k2x9f8s0w.",
+    ">!!.2n",
+    ">zzzzzzzzzzzzzzzzzzzz.2n",
+    ">-zzzzzzzzzzzz.2n",
+    "?1k2x9f8s0w.2n",
+])
+def test_tampered_position_shows_first_page(position):
+    assert parse_page_callback(f"admin_users:{position}") == ("admin_users", OLDER, None)
@@ -0,0 +1,141 @@
+"""
+Write-behind profile updates of ProfileWriter.
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.models.base import SessionLocal
+from app.models.user import User
+from app.services import profile_writer as writer_module
+from app.services.profile_writer import ProfileWriter
+
+USER_ID = 9700
+
+
+@pytest.fixture
+def user_id(database):
+    with SessionLocal() as session:
+        user = User(telegram_id=USER_ID, first_name="Test")
+        session.add(user)
+        session.commit()
+        return user.id
+
+
+def profile(first_name):
+    return {
+        "username": "test",
+        "first_name": first_name,
+        "last_name": None,
+        "language_code": "ru",
+        "is_premium": False
+    }
+
+
+def stored_name(user_id):
+    with SessionLocal() as session:
+        return session.get(User, user_id).first_name
+
+
+def test_profiles_are_flushed_every_interval(user_id):
+    writer = ProfileWriter(interval=0.05)
+    
+    async def run():
+        writer.start()
+        try:
+            writer.queue(user_id, profile("First"))
+            await asyncio.sleep(0.2)
+            first = stored_name(user_id)
+            writer.queue(user_id, profile("Second"))
+            await asyncio.sleep(0.2)
+            return first, stored_name(user_id)
+        finally:
+            await writer.stop()
+    
+    assert asyncio.run(run()) == ("First", "Second")
+    assert writer.flushes == 2
+    assert writer.pending == 0
+
+
+def test_profiles_are_flushed_on_shutdown(user_id):
+    writer = ProfileWriter(interval=3600)
+    
+    async def run():
+        writer.start()
+        writer.queue(user_id, profile("Renamed"))
+        await writer.stop()
+    
+    asyncio.run(run())
+    
+    assert stored_name(user_id) == "Renamed"
+    assert writer.pending == 0
+
+
+def test_shutdown_waits_for_running_flush(user_id, monkeypatch):
+    writer = ProfileWriter(interval=0.01)
+    run_in_session = writer_module.run_in_session
+    started = []
+    
+    async def slow_session(fn):
+        started.append(fn)
+        await asyncio.sleep(0.1)
+        return await run_in_session(fn)
+    
+    monkeypatch.setattr(writer_module, "run_in_session", slow_session)
+    
+    async def run():
+        writer.start()
+        writer.queue(user_id, profile("Renamed"))
+        while not started:
+            await asyncio.sleep(0.01)
+        await writer.stop()
+    
+    asyncio.run(run())
+    
+    # Пакет, который уже пишется при остановке, не теряется
+    assert stored_name(user_id) == "Renamed"
+    assert writer.rows_written == 1
+
+
+def test_failed_flush_keeps_batch_for_retry(user_id, monkeypatch):
+    writer = ProfileWriter(interval=3600)
+    run_in_session = writer_module.run_in_session
+    
+    async def failing_session(fn):
+        # Пока запись идёт, приходит профиль другого пользователя
+        writer.queue(user_id + 1, profile("Other"))
+        raise OperationalError("UPDATE", {}, Exception("database is locked"))
+    
+    async def run():
+        writer.queue(user_id, profile("Renamed"))
+        monkeypatch.setattr(writer_module, "run_in_session", failing_session)
+        failed = await writer.flush()
+        pending = writer.pending
+        monkeypatch.setattr(writer_module, "run_in_session", run_in_session)
+        return failed, pending, await writer.flush()
+    
+    assert asyncio.run(run()) == (0, 2, 2)
+    assert stored_name(user_id) == "Renamed"
+    assert (writer.flushes, writer.pending) == (1, 0)
+
+
+def test_failed_flush_keeps_newer_profile(user_id, monkeypatch):
+    writer = ProfileWriter(interval=3600)
+    run_in_session = writer_module.run_in_session
+    
+    async def failing_session(fn):
+        writer.queue(user_id, profile("Newer"))
+        raise OperationalError("UPDATE", {}, Exception("database is locked"))
+    
+    async def run():
+        writer.queue(user_id, profile("Older"))
+        monkeypatch.setattr(writer_module, "run_in_session", failing_session)
+        await writer.flush()
+        monkeypatch.setattr(writer_module, "run_in_session", run_in_session)
+        await writer.flush()
+    
+    asyncio.run(run())
+    
+    assert stored_name(user_id) == "Newer"
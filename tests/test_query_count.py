@@ -0,0 +1,139 @@
+"""
+SQL statements and commits issued per update.
+"""
+
+import asyncio
+from contextlib import contextmanager
+
+import pytest
+from aiogram.fsm.context import FSMContext
+from aiogram.fsm.storage.base import StorageKey
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.states import ServiceFormStates
+from app.handlers import services
+from app.models.base import async_engine, engine, update_session
+from app.services.media import media_registry
+from app.services.user import user_cache
+from app.utils.fsm_storage import DatabaseStorage
+from conftest import callback_update, fill_service_form, message_update
+
+USER_ID = 6000
+
+
+@contextmanager
+def count_statements():
+    """Collect the SQL statements executed on the sync and async engines."""
+    statements = []
+    
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.split(None, 1)[0])
+    
+    # async_engine is only created with DATABASE_ASYNC
+    engines = [engine] + ([async_engine.sync_engine] if async_engine is not None else [])
+    for target in engines:
+        event.listen(target, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        for target in engines:
+            event.remove(target, "before_cursor_execute", before_cursor_execute)
+
+
+@contextmanager
+def count_update_commits():
+    """Count commits of the sessions DatabaseMiddleware opens for updates."""
+    commits = []
+    
+    def after_commit(session):
+        db = update_session.get()
+        if db is not None and db.touched:
+            if session in (db.session, getattr(db.session, "sync_session", None)):
+                commits.append(session)
+    
+    event.listen(Session, "after_commit", after_commit)
+    try:
+        yield commits
+    finally:
+        event.remove(Session, "after_commit", after_commit)
+
+
+def feed(dispatcher, bot, update):
+    async def run():
+        await dispatcher.feed_update(bot, update)
+        # Wait for the menu photo's file_id, stored in the background
+        await media_registry.stop()
+    
+    asyncio.run(run())
+
+
+def test_statements_per_start(dispatcher, bot):
+    # User upsert, daily and total users rollups; the photo's file_id is stored once
+    with count_statements() as first_contact:
+        feed(dispatcher, bot, message_update(USER_ID, "/start"))
+    assert first_contact == ["SELECT", "INSERT", "INSERT", "INSERT", "INSERT"]
+    
+    with count_statements() as cached:
+        feed(dispatcher, bot, message_update(USER_ID, "/start"))
+    assert cached == []
+    
+    user_cache.clear()
+    with count_statements() as returning:
+        feed(dispatcher, bot, message_update(USER_ID, "/start"))
+    assert returning == ["SELECT"]
+
+
+def test_statements_per_confirmation(dispatcher, bot):
+    feed(dispatcher, bot, message_update(USER_ID, "/start"))
+    asyncio.run(fill_service_form(dispatcher, bot, USER_ID))
+    
+    # Application insert and its rollups, no refresh or lazy load of application.user
+    with count_statements() as confirmation:
+        feed(dispatcher, bot, callback_update(USER_ID, "confirm_application"))
+    assert confirmation == ["INSERT", "INSERT", "INSERT"]
+
+
+def test_commits_per_update(dispatcher, bot):
+    dispatcher.fsm.storage = DatabaseStorage(ttl=3600)
+    
+    # The signup is committed before the handler, nothing is left afterwards
+    with count_update_commits() as first_contact:
+        feed(dispatcher, bot, message_update(USER_ID, "/start"))
+    assert len(first_contact) == 1
+    
+    with count_update_commits() as cached:
+        feed(dispatcher, bot, message_update(USER_ID, "/start"))
+    assert cached == []
+    
+    user_cache.clear()
+    with count_update_commits() as returning:
+        feed(dispatcher, bot, message_update(USER_ID, "/start"))
+    assert len(returning) == 1
+    
+    # FSM records are written in the update's transaction
+    feed(dispatcher, bot, callback_update(USER_ID, "order_service", photo=True))
+    with count_update_commits() as form_step:
+        feed(dispatcher, bot, callback_update(USER_ID, "sv:0"))
+    assert len(form_step) == 1
+
+
+def test_fsm_write_rolls_back_with_failed_handler(dispatcher, bot, monkeypatch):
+    dispatcher.fsm.storage = DatabaseStorage(ttl=3600)
+    key = StorageKey(bot_id=bot.id, chat_id=USER_ID, user_id=USER_ID)
+    state = FSMContext(storage=dispatcher.storage, key=key)
+    
+    async def failing_screen(*args, **kwargs):
+        raise RuntimeError("Telegram is down")
+    
+    monkeypatch.setattr(services, "show_screen", failing_screen)
+    
+    async def run():
+        await dispatcher.feed_update(bot, message_update(USER_ID, "/start"))
+        await state.set_state(ServiceFormStates.waiting_for_service)
+        with pytest.raises(RuntimeError):
+            await dispatcher.feed_update(bot, callback_update(USER_ID, "sv:0"))
+        return await state.get_state(), await state.get_data()
+    
+    # The step written by advance_step() before the failure is not durable
+    assert asyncio.run(run()) == (ServiceFormStates.waiting_for_service.state, {})
@@ -0,0 +1,107 @@
+"""
+Submission spool: replay, quarantine of unreadable records, write timeout.
+"""
+
+import asyncio
+import os
+from uuid import uuid4
+
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.models.application import ApplicationType
+from app.models.base import LazySession, SessionLocal
+from app.models.user import User
+from app.services.application import AsyncApplicationService
+from app.services.submission_spool import HEADER, SubmissionSpool, read_records, submission_spool
+from conftest import applications_count, message_update
+
+USER_ID = 9000
+
+
+def create_user(dispatcher, bot) -> User:
+    asyncio.run(dispatcher.feed_update(bot, message_update(USER_ID, "/start")))
+    with SessionLocal() as session:
+        return session.scalar(select(User).where(User.telegram_id == USER_ID))
+
+
+def team_fields():
+    return {
+        "type": ApplicationType.TEAM,
+        "submission_id": uuid4().hex,
+        "name": "Test",
+        "contact": "@test"
+    }
+
+
+def append_raw(path, data):
+    with open(path, "ab") as f:
+        f.write(data)
+
+
+def test_unreadable_records_are_quarantined(dispatcher, bot):
+    user = create_user(dispatcher, bot)
+    spool = submission_spool
+    
+    asyncio.run(spool.capture(user, team_fields()))
+    append_raw(spool.path, HEADER.pack(8) + b"{broken}")
+    asyncio.run(spool.capture(user, team_fields()))
+    # Torn append: the length prefix promises more than was written
+    append_raw(spool.path, HEADER.pack(1000) + b"{}")
+    
+    assert asyncio.run(spool.replay()) == 2
+    assert applications_count() == 2
+    assert spool.pending_bytes == 0
+    
+    payloads, tail = read_records(spool.quarantine_path)
+    assert payloads == [b"{broken}", HEADER.pack(1000) + b"{}"]
+    assert tail == b""
+    
+    # Nothing is retried on the next pass
+    assert asyncio.run(spool.replay()) == 0
+
+
+def test_replayer_survives_unreadable_spool(dispatcher, bot, monkeypatch, tmp_path):
+    user = create_user(dispatcher, bot)
+    spool = SubmissionSpool(path=str(tmp_path / "submissions.spool"), interval=0.01)
+    asyncio.run(spool.capture(user, team_fields()))
+    
+    take = spool._take
+    failures = []
+    
+    def take_once_failing():
+        if not failures:
+            failures.append(True)
+            raise OSError("disk error")
+        return take()
+    
+    monkeypatch.setattr(spool, "_take", take_once_failing)
+    
+    async def run():
+        spool.start()
+        await asyncio.sleep(0.2)
+        await spool.stop()
+    
+    asyncio.run(run())
+    
+    assert failures == [True]
+    assert spool.replayed == 1
+    assert not os.path.exists(spool.replay_path)
+
+
+def test_hung_write_is_spooled(dispatcher, bot, monkeypatch):
+    user = create_user(dispatcher, bot)
+    monkeypatch.setattr(settings, "submission_write_timeout", 0.1)
+    service = AsyncApplicationService(LazySession(SessionLocal))
+    
+    async def hung_write():
+        await asyncio.sleep(10)
+    
+    async def run():
+        return await service._write_or_spool(user, team_fields(), hung_write)
+    
+    application = asyncio.run(asyncio.wait_for(run(), 2))
+    
+    assert application.id is None
+    assert submission_spool.captured >= 1
+    assert submission_spool.pending_bytes > 0
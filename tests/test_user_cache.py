@@ -0,0 +1,78 @@
+"""
+user_cache: hits, commit-only writes and invalidation.
+"""
+
+import asyncio
+
+from aiogram.types import User as TgUser
+
+from app.models.base import SessionLocal
+from app.services.user import AsyncUserService, UserService, user_cache
+from test_query_count import count_statements
+
+USER_ID = 7000
+
+
+def tg_user(**changes) -> TgUser:
+    return TgUser(**{"id": USER_ID, "is_bot": False, "first_name": "Test", **changes})
+
+
+def cache_user():
+    """Create the test user and commit, which caches it."""
+    with SessionLocal() as session:
+        UserService(session).get_or_create(tg_user())
+        session.commit()
+
+
+def test_cache_hit_skips_query(database):
+    cache_user()
+    
+    with SessionLocal() as session:
+        with count_statements() as statements:
+            user, created = asyncio.run(AsyncUserService(session).get_or_create(tg_user()))
+    
+    assert statements == []
+    assert (user.telegram_id, user.first_name, created) == (USER_ID, "Test", False)
+
+
+def test_changed_profile_misses_cache(database):
+    cache_user()
+    
+    with SessionLocal() as session:
+        with count_statements() as statements:
+            service = AsyncUserService(session)
+            user, _ = asyncio.run(service.get_or_create(tg_user(first_name="Renamed")))
+            session.commit()
+    
+    assert statements[0] == "SELECT"
+    assert user.first_name == "Renamed"
+    assert user_cache.get(USER_ID)["first_name"] == "Renamed"
+
+
+def test_cache_is_written_on_commit_only(database):
+    with SessionLocal() as session:
+        UserService(session).get_or_create(tg_user())
+        assert user_cache.get(USER_ID) is None
+        session.rollback()
+    assert user_cache.get(USER_ID) is None
+    
+    with SessionLocal() as session:
+        UserService(session).get_or_create(tg_user())
+        assert user_cache.get(USER_ID) is None
+        session.commit()
+    assert user_cache.get(USER_ID)["telegram_id"] == USER_ID
+
+
+def test_block_and_unblock_invalidate_cache(database):
+    for action in ("block_user", "unblock_user"):
+        cache_user()
+        assert user_cache.get(USER_ID) is not None
+        
+        with SessionLocal() as session:
+            service = UserService(session)
+            getattr(service, action)(service.get_user_by_telegram_id(USER_ID))
+            # До commit в кэше остаётся прежняя запись
+            assert user_cache.get(USER_ID) is not None
+            session.commit()
+        
+        assert user_cache.get(USER_ID) is None